@@ -0,0 +1,238 @@
+"""
+Benchmark
+---------
+
+Throughput benchmark for the PDF splitter. Synthetic exports of the given
+sizes are generated (see ``SyntheticExport``) and the main stages are timed
+separately:
+
+    get_page_person_infos   header scan of every page (clip zone and full text)
+    get_data_from_pli_id    contact lookup for every person
+    create_report           writing every per-person PDF
+    iterate_pages           the complete split
+
+Results are written to a JSON file; pass an earlier file with ``--compare``
+to print the change per stage.
+
+Usage:
+    python Benchmark.py --sizes 50:500 200:4000 1000:20000
+    python Benchmark.py --sizes 50:500 --compare results/benchmark_20261001.json
+
+Author: Mu Dell'Oro
+Version: v1.0
+Date: 18.10.2026
+Git: https://github.com/Capicodo/PDF-Splitter.git
+"""
+
+import argparse
+import contextlib
+import datetime
+import importlib.util
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+BENCHMARK_FOLDER = os.path.dirname(os.path.abspath(__file__))
+CODE_FOLDER = os.path.join(BENCHMARK_FOLDER, "..", "code")
+MAIN_SCRIPT_PATH = os.path.join(CODE_FOLDER, "Monatsbericht Automat.py")
+
+sys.path.insert(0, CODE_FOLDER)
+
+import fitz  # PyMuPDF
+
+import PeopleEmailLookup
+from SyntheticExport import generate
+
+# Stages that are more than this much slower than the compared run are flagged
+REGRESSION_THRESHOLD = 0.10
+
+
+def load_main_module():
+    """Import the main script, whose file name is not a valid module name."""
+    spec = importlib.util.spec_from_file_location("monatsbericht_automat", MAIN_SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def timed(function: Callable[[], int]) -> Dict[str, float]:
+    """
+    Time ``function`` with its console output suppressed.
+
+    Args:
+        function: Callable returning the number of processed items.
+
+    Returns:
+        A dict with ``seconds``, ``calls`` and ``per_second``.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        calls = function()
+        seconds = time.perf_counter() - start
+    return {
+        "seconds": round(seconds, 4),
+        "calls": calls,
+        "per_second": round(calls / seconds, 2) if seconds else None,
+    }
+
+
+def reset_run_state(automat, destination_folder_path: str):
+    """Reset the module globals the main script accumulates during a run."""
+    automat.contact_failures.clear()
+    automat.contact_data_list.clear()
+    automat.reports.clear()
+    automat.sort_by_deliver_method = True
+    automat.destination_folder_path = destination_folder_path
+
+
+def benchmark_size(automat, work_folder: str, persons: int, pages: int, workers: int) -> Dict:
+    """
+    Run all stage benchmarks for one export size.
+
+    Returns:
+        A dict with the size and the timings per stage.
+    """
+    pdf_path, csv_path = generate(os.path.join(work_folder, "input"), persons, pages)
+    output_folder = os.path.join(work_folder, "output")
+
+    automat.raw_report_file_path = pdf_path
+    automat.raw_report_doc = fitz.open(pdf_path)
+    automat.use_scan_cache = False
+    automat.streaming_mode = False
+    automat.dry_run = False
+    automat.scan_workers = workers
+    automat.write_workers = workers
+    PeopleEmailLookup.init(csv_path)
+
+    timings = {}
+
+    def scan_all_pages():
+        for page_index in range(automat.raw_report_doc.page_count):
+            automat.get_page_person_infos(page_index)
+        return automat.raw_report_doc.page_count
+
+    automat.use_header_zone = False
+    automat.setup_header_zone()
+    timings["get_page_person_infos_full_text"] = timed(scan_all_pages)
+
+    automat.use_header_zone = True
+    automat.setup_header_zone()
+    timings["get_page_person_infos"] = timed(scan_all_pages)
+
+    pli_ids = [pli_id for pli_id in range(1, persons + 1)]
+
+    def lookup_all_persons():
+        for pli_id in pli_ids:
+            PeopleEmailLookup.get_data_from_pli_id(pli_id)
+        return len(pli_ids)
+
+    timings["get_data_from_pli_id"] = timed(lookup_all_persons)
+
+    reset_run_state(automat, os.path.join(output_folder, "create_report"))
+    with contextlib.redirect_stdout(io.StringIO()):
+        segments = automat.plan_segments(automat.scan_page_infos())
+
+    def write_all_segments():
+        for segment in segments:
+            automat.create_report(
+                segment.start_page_index,
+                segment.end_page_index,
+                segment.name,
+                segment.contact_data,
+            )
+        return len(segments)
+
+    timings["create_report"] = timed(write_all_segments)
+
+    reset_run_state(automat, os.path.join(output_folder, "iterate_pages"))
+
+    def split_all():
+        automat.iterate_pages()
+        return automat.raw_report_doc.page_count
+
+    timings["iterate_pages"] = timed(split_all)
+
+    automat.raw_report_doc.close()
+    shutil.rmtree(work_folder, ignore_errors=True)
+
+    return {"persons": persons, "pages": pages, "workers": workers, "timings": timings}
+
+
+def compare_results(current: Dict, previous: Dict):
+    """Print the change of every stage against an earlier result file."""
+    previous_runs = {(run["persons"], run["pages"], run.get("workers")): run for run in previous["runs"]}
+
+    print(f"\nVergleich mit {previous['created']}:")
+    for run in current["runs"]:
+        previous_run = previous_runs.get((run["persons"], run["pages"], run["workers"]))
+        if not previous_run:
+            print(f"  {run['persons']} Personen / {run['pages']} Seiten: kein Vergleichslauf")
+            continue
+
+        print(f"  {run['persons']} Personen / {run['pages']} Seiten:")
+        for stage, timing in run["timings"].items():
+            previous_timing = previous_run["timings"].get(stage)
+            if not previous_timing or not previous_timing["seconds"]:
+                continue
+            change = timing["seconds"] / previous_timing["seconds"] - 1
+            flag = "  ⚠️ langsamer" if change > REGRESSION_THRESHOLD else ""
+            print(
+                f"    {stage:34} {previous_timing['seconds']:9.3f} s -> {timing['seconds']:9.3f} s ({change:+.0%}){flag}"
+            )
+
+
+def parse_size(value: str):
+    persons, pages = value.split(":")
+    return int(persons), int(pages)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark der einzelnen Verarbeitungsschritte.")
+    parser.add_argument("--sizes", nargs="+", type=parse_size, default=[(50, 500)], metavar="PERSONEN:SEITEN")
+    parser.add_argument("--workers", type=int, default=1, help="Prozesse für Scan und Schreiben")
+    parser.add_argument("--output", help="Ergebnisdatei (Standard: results/benchmark_<Zeitstempel>.json)")
+    parser.add_argument("--compare", help="Frühere Ergebnisdatei zum Vergleich")
+    args = parser.parse_args()
+
+    automat = load_main_module()
+
+    runs: List[Dict] = []
+    for persons, pages in args.sizes:
+        print(f"Benchmark: {persons} Personen / {pages} Seiten ...")
+        work_folder = tempfile.mkdtemp(prefix="pdf_splitter_benchmark_")
+        run = benchmark_size(automat, work_folder, persons, pages, args.workers)
+        for stage, timing in run["timings"].items():
+            print(f"  {stage:34} {timing['seconds']:9.3f} s  ({timing['per_second']} /s)")
+        runs.append(run)
+
+    now = datetime.datetime.now()
+    result = {
+        "created": now.isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pymupdf": fitz.VersionBind,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "runs": runs,
+    }
+
+    output_path = args.output or os.path.join(
+        BENCHMARK_FOLDER, "results", f"benchmark_{now:%Y%m%d_%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as result_file:
+        json.dump(result, result_file, indent=2)
+    print(f"\nErgebnis gespeichert: {output_path}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as previous_file:
+            compare_results(result, json.load(previous_file))
+
+
+if __name__ == "__main__":
+    main()
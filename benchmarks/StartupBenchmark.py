@@ -0,0 +1,208 @@
+"""
+StartupBenchmark
+----------------
+
+Measures the time-to-first-prompt of the interactive mode: the program is
+started in a fresh process and the time until the first input prompt
+appears on its output is taken. Works for the script as well as for the
+frozen PyInstaller executable (``--exe``).
+
+With ``--imports`` the script is started once more with ``-X importtime``
+and the slowest imports before the first prompt are listed.
+
+Usage:
+    python StartupBenchmark.py --runs 10
+    python StartupBenchmark.py --exe "../dist/Monatsbericht Automat.exe" --target 0.5
+    python StartupBenchmark.py --imports 15 --compare results/startup_20261001.json
+
+Author: Mu Dell'Oro
+Version: v1.0
+Date: 18.10.2026
+Git: https://github.com/Capicodo/PDF-Splitter.git
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List, Tuple
+
+BENCHMARK_FOLDER = os.path.dirname(os.path.abspath(__file__))
+CODE_FOLDER = os.path.join(BENCHMARK_FOLDER, "..", "code")
+MAIN_SCRIPT_PATH = os.path.join(CODE_FOLDER, "Monatsbericht Automat.py")
+
+# End of the first input prompt (raw report path) of the interactive mode
+PROMPT_MARKER = "Pfad: "
+
+# Runs more than this much slower than the compared run are flagged
+REGRESSION_THRESHOLD = 0.10
+
+
+def run_until_prompt(command: List[str], marker: str, timeout: float, stderr=subprocess.DEVNULL) -> float:
+    """
+    Start ``command`` and wait for ``marker`` on its output.
+
+    The process runs in an empty temporary folder (its ``log.txt`` ends up
+    there) and is killed as soon as the prompt appears.
+
+    Args:
+        command: Command line of the program.
+        marker: Text that ends the first prompt.
+        timeout: Maximum wait in seconds.
+        stderr: Target of the program's error output.
+
+    Returns:
+        Seconds from process start to the prompt.
+
+    Raises:
+        TimeoutError: If the prompt does not appear within ``timeout``.
+        RuntimeError: If the process exits before showing the prompt.
+    """
+    marker_bytes = marker.encode("utf-8")
+    environment = dict(os.environ, PYTHONUNBUFFERED="1", PYTHONIOENCODING="utf-8")
+
+    with tempfile.TemporaryDirectory(prefix="pdf_splitter_startup_") as work_folder:
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            command,
+            cwd=work_folder,
+            env=environment,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+        )
+        # Kill a process that never prompts, the read below then returns
+        timer = threading.Timer(timeout, process.kill)
+        timer.start()
+
+        output = b""
+        try:
+            while marker_bytes not in output:
+                chunk = process.stdout.read1(4096)
+                if not chunk:
+                    break
+                output += chunk
+            seconds = time.perf_counter() - start
+        finally:
+            timer.cancel()
+            process.kill()
+            process.wait()
+            process.stdout.close()
+            process.stdin.close()
+
+    if marker_bytes not in output:
+        if seconds >= timeout:
+            raise TimeoutError(f"Keine Eingabeaufforderung nach {timeout:.0f} s")
+        raise RuntimeError(
+            f"Programm beendet ohne Eingabeaufforderung:\n{output.decode('utf-8', 'replace')[-2000:]}"
+        )
+    return seconds
+
+
+def slowest_imports(marker: str, timeout: float, count: int) -> List[Tuple[str, float]]:
+    """
+    Start the script with ``-X importtime`` and return the ``count`` top-level
+    imports with the highest cumulative time until the first prompt, in
+    seconds.
+    """
+    with tempfile.TemporaryFile() as stderr_file:
+        run_until_prompt(
+            [sys.executable, "-X", "importtime", MAIN_SCRIPT_PATH], marker, timeout, stderr_file
+        )
+        stderr_file.seek(0)
+        lines = stderr_file.read().decode("utf-8", "replace").splitlines()
+
+    imports = []
+    for line in lines:
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith("  ") or not cumulative.strip().isdigit():
+            continue  # nested import, counted in its parent
+        imports.append((name.strip(), int(cumulative) / 1_000_000))
+
+    imports.sort(key=lambda item: item[1], reverse=True)
+    return imports[:count]
+
+
+def compare_results(current: Dict, previous: Dict):
+    """Print the change of the median against an earlier result file."""
+    change = current["median_seconds"] / previous["median_seconds"] - 1
+    flag = "  ⚠️ langsamer" if change > REGRESSION_THRESHOLD else ""
+    print(
+        f"\nVergleich mit {previous['created']}: "
+        f"{previous['median_seconds']:.3f} s -> {current['median_seconds']:.3f} s ({change:+.0%}){flag}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark der Startzeit bis zur ersten Eingabeaufforderung.")
+    parser.add_argument("--exe", help="Gebaute Programmdatei statt des Skripts messen")
+    parser.add_argument("--runs", type=int, default=10, help="Anzahl der Starts")
+    parser.add_argument("--marker", default=PROMPT_MARKER, help="Text, an dem die Eingabeaufforderung erkannt wird")
+    parser.add_argument("--timeout", type=float, default=60, help="Maximale Wartezeit pro Start in Sekunden")
+    parser.add_argument("--target", type=float, help="Zielwert in Sekunden; Exit-Code 1, wenn der Median darüber liegt")
+    parser.add_argument("--imports", type=int, default=0, metavar="N", help="Die N langsamsten Importe anzeigen (nur Skript)")
+    parser.add_argument("--output", help="Ergebnisdatei (Standard: results/startup_<Zeitstempel>.json)")
+    parser.add_argument("--compare", help="Frühere Ergebnisdatei zum Vergleich")
+    args = parser.parse_args()
+
+    command = [os.path.abspath(args.exe)] if args.exe else [sys.executable, MAIN_SCRIPT_PATH]
+    print(f"Startzeit bis zur ersten Eingabeaufforderung: {' '.join(command)}")
+
+    seconds = []
+    for run in range(args.runs):
+        seconds.append(run_until_prompt(command, args.marker, args.timeout))
+        print(f"  Start {run + 1:3}: {seconds[-1]:7.3f} s")
+
+    now = datetime.datetime.now()
+    result = {
+        "created": now.isoformat(timespec="seconds"),
+        "command": command,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": [round(value, 4) for value in seconds],
+        "min_seconds": round(min(seconds), 4),
+        "median_seconds": round(statistics.median(seconds), 4),
+        "max_seconds": round(max(seconds), 4),
+    }
+    print(
+        f"\nMinimum {result['min_seconds']:.3f} s | Median {result['median_seconds']:.3f} s | "
+        f"Maximum {result['max_seconds']:.3f} s"
+    )
+
+    if args.imports and not args.exe:
+        result["slowest_imports"] = slowest_imports(args.marker, args.timeout, args.imports)
+        print("\nLangsamste Importe (kumuliert):")
+        for name, import_seconds in result["slowest_imports"]:
+            print(f"  {name:34} {import_seconds:7.3f} s")
+
+    output_path = args.output or os.path.join(
+        BENCHMARK_FOLDER, "results", f"startup_{now:%Y%m%d_%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as result_file:
+        json.dump(result, result_file, indent=2)
+    print(f"\nErgebnis gespeichert: {output_path}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as previous_file:
+            compare_results(result, json.load(previous_file))
+
+    if args.target is not None:
+        if result["median_seconds"] > args.target:
+            print(f"⚠️ Ziel von {args.target:.3f} s verfehlt")
+            sys.exit(1)
+        print(f"✅ Ziel von {args.target:.3f} s erreicht")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+SyntheticExport
+---------------
+
+Generator for synthetic Timoto monthly-report exports and matching contact
+CSVs, used by the benchmark suite. Every page carries the same header fields
+as the real export ("Name:" and "Dienstplan: <PLI> ...") followed by a table
+of booking lines, so text extraction costs are comparable.
+
+Usage:
+    python SyntheticExport.py --persons 200 --pages 4000 --output synthetic
+
+Author: Mu Dell'Oro
+Version: v1.0
+Date: 18.10.2026
+Git: https://github.com/Capicodo/PDF-Splitter.git
+"""
+
+import argparse
+import csv
+import os
+import random
+from typing import List, Tuple
+
+import fitz  # PyMuPDF
+
+CSV_COLUMNS = [
+    "Rufname",
+    "Nachname",
+    "Durchwahl",
+    "Telefonnummer",
+    "Mail-Adresse",
+    "Adresse",
+    "Pilu seit",
+    "Geburtsdatum",
+    "PLI - #",
+    "Arbeitsbereiche",
+    "Papierbericht",
+]
+
+FIRST_NAMES = ["Anna", "Ben", "Clara", "David", "Emma", "Felix", "Greta", "Hans", "Ida", "Jonas"]
+LAST_NAMES = ["Albrecht", "Becker", "Clemens", "Dorn", "Ebert", "Fuchs", "Graf", "Hahn", "Imhof", "Jung"]
+TEAMS = ["AMN", "BLG", "BDE", "EMT", "FBG", "MKG", "SGT", "SMT", "VWG", "ITE"]
+
+BOOKING_LINES_PER_PAGE = 35
+
+
+def build_persons(person_count: int, seed: int = 0) -> List[Tuple[int, str, str, str]]:
+    """
+    Build a deterministic list of persons.
+
+    Args:
+        person_count: Number of persons.
+        seed: Seed for the random generator.
+
+    Returns:
+        A list of ``(pli_id, first_name, last_name, team)`` tuples.
+    """
+    rng = random.Random(seed)
+    persons = []
+    for index in range(person_count):
+        first_name = FIRST_NAMES[index % len(FIRST_NAMES)]
+        last_name = f"{LAST_NAMES[(index // len(FIRST_NAMES)) % len(LAST_NAMES)]}{index}"
+        persons.append((index + 1, first_name, last_name, rng.choice(TEAMS)))
+    return persons
+
+
+def split_pages(page_count: int, person_count: int, seed: int = 0) -> List[int]:
+    """
+    Distribute ``page_count`` pages over ``person_count`` persons.
+
+    Every person gets at least one page; the rest is spread randomly.
+
+    Returns:
+        The number of pages per person.
+    """
+    if person_count > page_count:
+        raise ValueError("Es muss mindestens eine Seite pro Person geben")
+
+    rng = random.Random(seed)
+    pages = [1] * person_count
+    for _ in range(page_count - person_count):
+        pages[rng.randrange(person_count)] += 1
+    return pages
+
+
+def write_pdf(path: str, persons, pages_per_person: List[int], seed: int = 0):
+    """
+    Write the synthetic raw report PDF.
+
+    Args:
+        path: Target PDF path.
+        persons: Persons from ``build_persons``.
+        pages_per_person: Page counts from ``split_pages``.
+        seed: Seed for the booking lines.
+    """
+    rng = random.Random(seed)
+    doc = fitz.open()
+
+    for (pli_id, first_name, last_name, team), page_count in zip(persons, pages_per_person):
+        for page_number in range(page_count):
+            page = doc.new_page(width=595, height=842)  # A4
+            page.insert_text((40, 50), "Monatsbericht", fontsize=14)
+            page.insert_text((40, 80), f"Name: {last_name}, {first_name}", fontsize=10)
+            page.insert_text((40, 95), f"Dienstplan: {pli_id} {team} Standard", fontsize=10)
+            page.insert_text((400, 80), f"Seite {page_number + 1} von {page_count}", fontsize=10)
+
+            y = 130
+            for line in range(BOOKING_LINES_PER_PAGE):
+                day = line % 28 + 1
+                start = rng.randint(6, 10)
+                end = start + rng.randint(4, 9)
+                page.insert_text(
+                    (40, y),
+                    f"{day:02d}.  {start:02d}:00  {end:02d}:00  {end - start:>2} h  {team}  Projekt {rng.randint(100, 999)}",
+                    fontsize=8,
+                )
+                y += 19
+
+    doc.save(path, garbage=3, deflate=True)
+    doc.close()
+
+
+def write_csv(path: str, persons, paper_share: float = 0.2, seed: int = 0):
+    """
+    Write the contact CSV matching the persons of the synthetic PDF.
+
+    Args:
+        path: Target CSV path.
+        persons: Persons from ``build_persons``.
+        paper_share: Share of persons who get a paper report.
+        seed: Seed for the delivery preference.
+    """
+    rng = random.Random(seed)
+    with open(path, "w", newline="", encoding="utf-8") as csv_fh:
+        writer = csv.DictWriter(csv_fh, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+        for pli_id, first_name, last_name, team in persons:
+            writer.writerow(
+                {
+                    "Rufname": first_name,
+                    "Nachname": last_name,
+                    "Durchwahl": "",
+                    "Telefonnummer": f"0170 {pli_id:07d}",
+                    "Mail-Adresse": f"{first_name.lower()}.{last_name.lower()}@example.org",
+                    "Adresse": f"Musterstraße {pli_id},\n79576 Weil a. R.",
+                    "Pilu seit": "01.01.2020",
+                    "Geburtsdatum": "01.01.1990",
+                    "PLI - #": str(pli_id),
+                    "Arbeitsbereiche": team,
+                    "Papierbericht": "TRUE" if rng.random() < paper_share else "FALSE",
+                }
+            )
+
+
+def generate(output_folder: str, person_count: int, page_count: int, seed: int = 0) -> Tuple[str, str]:
+    """
+    Generate a synthetic raw report and contact CSV.
+
+    Args:
+        output_folder: Folder for the generated files.
+        person_count: Number of persons.
+        page_count: Total number of pages.
+        seed: Seed for all random data.
+
+    Returns:
+        A tuple of ``(pdf_path, csv_path)``.
+    """
+    os.makedirs(output_folder, exist_ok=True)
+
+    persons = build_persons(person_count, seed)
+    pages_per_person = split_pages(page_count, person_count, seed)
+
+    pdf_path = os.path.join(output_folder, f"synthetic_{person_count}p_{page_count}s.pdf")
+    csv_path = os.path.join(output_folder, f"synthetic_{person_count}p.csv")
+
+    write_pdf(pdf_path, persons, pages_per_person, seed)
+    write_csv(csv_path, persons, seed=seed)
+
+    return pdf_path, csv_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Erzeugt einen synthetischen Timoto-Export und eine passende Kontaktdatei.")
+    parser.add_argument("--persons", type=int, default=50)
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="synthetic")
+    args = parser.parse_args()
+
+    pdf_path, csv_path = generate(args.output, args.persons, args.pages, args.seed)
+    print(f"PDF: {pdf_path}")
+    print(f"CSV: {csv_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,11 @@ class ContactData:
         pli_id: int,
         first_name: str,
         last_name: str,
+        address: str = "",
     ):
         self.deliver_via_paper: bool = deliver_via_paper
         self.email: str = email
         self.pli_id: int = pli_id
         self.first_name: str = first_name
         self.last_name: str = last_name
+        self.address: str = address
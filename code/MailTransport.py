@@ -0,0 +1,361 @@
+"""
+MailTransport
+-------------
+
+Transport layer for sending the per-person reports by email. A transport
+sends a single report; ``dispatch_reports`` sends a whole batch through a
+transport, concurrently where the transport allows it. Reports kept in
+memory (``Report.content``) are attached without reading them from disk.
+
+Backends:
+    OutlookTransport: Sends through the local Outlook installation via COM.
+        COM objects are bound to their thread, so it sends one mail at a time.
+    SmtpTransport: Sends through an SMTP server. Every worker thread keeps
+        its own connection open for the whole batch.
+
+Author: Mu Dell'Oro
+Version: v1.0
+Date: 18.10.2026
+Git: https://github.com/Capicodo/PDF-Splitter.git
+"""
+
+import abc
+import os
+import shutil
+import smtplib
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage
+from typing import List, Optional, Tuple
+
+from Report import Report
+
+
+def read_attachment(report: Report) -> bytes:
+    """Return the PDF bytes of ``report``, from memory if available."""
+    if report.content is not None:
+        return report.content
+    with open(report.document, "rb") as report_file:
+        return report_file.read()
+
+
+def read_signature_html(signature_path: str) -> str:
+    """
+    Read a signature HTML file, e.g. one saved by Outlook in
+    ``%APPDATA%\\Microsoft\\Signatures``.
+
+    Outlook saves signatures in the Windows code page, so the file is read as
+    UTF-8 and otherwise as cp1252.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(signature_path, "rb") as signature_file:
+        data = signature_file.read()
+    try:
+        return data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return data.decode("cp1252", errors="replace")
+
+
+class MailTransport(abc.ABC):
+    """
+    Interface of a mail backend.
+
+    Attributes:
+        max_workers: Number of mails that may be sent concurrently.
+    """
+
+    max_workers: int = 1
+
+    def open(self):
+        """Prepare the transport before the first mail of a batch."""
+
+    @abc.abstractmethod
+    def send(self, report: Report, recipient_email: str, subject: str, html_body: str):
+        """
+        Send ``report`` as attachment to ``recipient_email``.
+
+        Args:
+            report: The report to attach.
+            recipient_email: The recipient email address.
+            subject: Subject line of the mail.
+            html_body: HTML body of the mail.
+
+        Raises:
+            Exception: If the mail could not be sent.
+        """
+
+    def close(self):
+        """Release all resources after the last mail of a batch."""
+
+
+class OutlookTransport(MailTransport):
+    """
+    Send mails through Outlook via COM, appending the default signature.
+
+    The sending account and the signature HTML are resolved once in
+    ``open`` and reused for every mail of the batch, so each mail only needs
+    ``CreateItem`` and ``Send``. Only duck-typed access to the COM objects is
+    used, so a fake ``outlook`` object can stand in for tests.
+
+    ``Attachments.Add`` only accepts file paths, so in-memory reports are
+    written to a local temporary folder (instead of the destination share)
+    and deleted once the mail is sent.
+
+    Attributes:
+        outlook: The ``outlook.application`` dispatch object.
+        accounts: The Outlook ``Session.Accounts`` collection.
+        sender_email: Address of the Outlook account used for sending.
+        account: The resolved sending account, set by ``open``.
+        signature_html: The default signature, set by ``open``.
+    """
+
+    max_workers = 1
+
+    # Outlook constants
+    OL_MAIL_ITEM = 0
+    OL_DISCARD = 1
+    # DISPID of MailItem.SendUsingAccount
+    DISPID_SEND_USING_ACCOUNT = 64209
+
+    def __init__(self, outlook, accounts, sender_email: str):
+        self.outlook = outlook
+        self.accounts = accounts
+        self.sender_email: str = sender_email
+        self.account = None
+        self.signature_html: str = None
+        self._temp_folder_path: str = None
+
+    def find_account(self):
+        """
+        Return the Outlook account matching ``sender_email``.
+
+        Raises:
+            Exception: If no matching Outlook account is found.
+        """
+        for account in self.accounts:
+            if account.SmtpAddress.lower() == self.sender_email.lower():
+                return account
+
+        raise Exception("\n❌ Problem Beim Setzen der Sender Email ❌")
+
+    def set_send_using_account(self, mail, account):
+        """Set ``SendUsingAccount`` on a mail item."""
+        mail._oleobj_.Invoke(
+            *(self.DISPID_SEND_USING_ACCOUNT, 0, 8, 0, account)
+        )  # A plain property assignment is not supported by the dynamic dispatch
+
+    def fetch_signature(self, account) -> str:
+        """
+        Read the default signature of ``account``.
+
+        Outlook inserts the signature when a new mail is displayed; the mail is
+        closed again without saving.
+
+        Returns:
+            The signature HTML.
+        """
+        mail = self.outlook.CreateItem(self.OL_MAIL_ITEM)
+        self.set_send_using_account(mail, account)
+        mail.Display(False)
+        signature = mail.HTMLBody
+        mail.Close(self.OL_DISCARD)
+        return signature
+
+    def open(self):
+        if self.account is None:
+            self.account = self.find_account()
+        if self.signature_html is None:
+            self.signature_html = self.fetch_signature(self.account)
+
+    def send(self, report: Report, recipient_email: str, subject: str, html_body: str):
+        self.open()
+
+        mail = self.outlook.CreateItem(self.OL_MAIL_ITEM)
+        self.set_send_using_account(mail, self.account)
+
+        mail.To = recipient_email
+        mail.Subject = subject
+
+        # Append the custom message *before* the signature
+        mail.HTMLBody = html_body + self.signature_html
+
+        if report.content is None:
+            mail.Attachments.Add(report.document)
+            mail.Send()
+            return
+
+        if self._temp_folder_path is None:
+            self._temp_folder_path = tempfile.mkdtemp(prefix="monatsbericht_")
+        attachment_path = os.path.join(
+            self._temp_folder_path, os.path.basename(report.document)
+        )
+        with open(attachment_path, "wb") as attachment_file:
+            attachment_file.write(report.content)
+        try:
+            mail.Attachments.Add(attachment_path)  # Outlook copies the file
+            mail.Send()
+        finally:
+            os.remove(attachment_path)
+
+    def close(self):
+        if self._temp_folder_path:
+            shutil.rmtree(self._temp_folder_path, ignore_errors=True)
+            self._temp_folder_path = None
+
+
+def create_outlook_transport(sender_email: str) -> OutlookTransport:
+    """
+    Create an ``OutlookTransport`` owned by the calling thread.
+
+    COM objects may only be used in the thread that created them, so a
+    transport used outside the main thread (e.g. by the send stage of the
+    pipeline) has to initialize COM and dispatch Outlook in that thread.
+
+    Args:
+        sender_email: Address of the Outlook account used for sending.
+    """
+    import pythoncom
+    import win32com.client
+
+    pythoncom.CoInitialize()
+    outlook = win32com.client.Dispatch("outlook.application")
+    return OutlookTransport(outlook, outlook.Session.Accounts, sender_email)
+
+
+class SmtpTransport(MailTransport):
+    """
+    Send mails through an SMTP server with one reused connection per worker.
+
+    Attributes:
+        host: SMTP server host name.
+        port: SMTP server port.
+        sender_email: Address used as ``From``.
+        username: Optional login name, no login if empty.
+        password: Optional login password.
+        starttls: Upgrade the connection with STARTTLS before the login.
+        max_workers: Number of parallel connections.
+        signature_html: HTML appended to every body (Outlook adds its
+            signature itself, SMTP mails need it explicitly).
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        sender_email: str,
+        username: str = None,
+        password: str = None,
+        starttls: bool = False,
+        max_workers: int = 4,
+        signature_html: str = "",
+        timeout: float = 30,
+    ):
+        self.host: str = host
+        self.port: int = port
+        self.sender_email: str = sender_email
+        self.username: str = username
+        self.password: str = password
+        self.starttls: bool = starttls
+        self.max_workers: int = max(1, max_workers)
+        self.signature_html: str = signature_html
+        self.timeout: float = timeout
+
+        self._local = threading.local()
+        self._connections: List[smtplib.SMTP] = []
+        self._lock = threading.Lock()
+
+    def _connect(self) -> smtplib.SMTP:
+        connection = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.starttls:
+            connection.starttls()
+        if self.username:
+            connection.login(self.username, self.password or "")
+        return connection
+
+    def _get_connection(self) -> smtplib.SMTP:
+        """Return the connection of the current thread, opening it if needed."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._connect()
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def build_message(
+        self, report: Report, recipient_email: str, subject: str, html_body: str
+    ) -> EmailMessage:
+        """Build the MIME message with the report PDF as attachment."""
+        message = EmailMessage()
+        message["From"] = self.sender_email
+        message["To"] = recipient_email
+        message["Subject"] = subject
+        message.set_content(html_body + self.signature_html, subtype="html")
+
+        message.add_attachment(
+            read_attachment(report),
+            maintype="application",
+            subtype="pdf",
+            filename=os.path.basename(report.document),
+        )
+        return message
+
+    def send(self, report: Report, recipient_email: str, subject: str, html_body: str):
+        message = self.build_message(report, recipient_email, subject, html_body)
+        try:
+            self._get_connection().send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            # The server closed an idle connection, reconnect once
+            self._local.connection = None
+            self._get_connection().send_message(message)
+
+    def close(self):
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            try:
+                connection.quit()
+            except Exception:
+                pass
+        self._local = threading.local()
+
+
+def dispatch_reports(
+    transport: MailTransport,
+    jobs: List[Tuple[Report, str, str, str]],
+) -> List[Tuple[Report, Optional[Exception]]]:
+    """
+    Send a batch of reports through ``transport``.
+
+    Up to ``transport.max_workers`` mails are sent concurrently. A failed
+    mail does not stop the batch; its error is returned instead.
+
+    Args:
+        transport: The mail backend.
+        jobs: List of ``(report, recipient_email, subject, html_body)``.
+
+    Returns:
+        A list of ``(report, error)`` tuples in the order of ``jobs`` where
+        ``error`` is ``None`` if the mail was sent.
+    """
+
+    def send_job(job: Tuple[Report, str, str, str]):
+        report = job[0]
+        try:
+            transport.send(*job)
+            return report, None
+        except Exception as e:
+            return report, e
+
+    transport.open()
+    try:
+        if transport.max_workers <= 1 or len(jobs) < 2:
+            return [send_job(job) for job in jobs]
+
+        with ThreadPoolExecutor(max_workers=transport.max_workers) as pool:
+            return list(pool.map(send_job, jobs))
+    finally:
+        transport.close()
@@ -0,0 +1,296 @@
+"""
+MailTransportTester
+-------------------
+
+Manual check of the mail transports without a real mail server or Outlook:
+
+- ``SmtpTransport`` and ``dispatch_reports`` send a batch of reports (from
+  file and from memory) to a local SMTP stand-in on 127.0.0.1. Every mail
+  has to arrive with its attachment and the batch may not use more
+  connections than ``max_workers``.
+- ``OutlookTransport`` sends the same kind of reports through a fake
+  Outlook COM object. Sender account, signature, recipient and attachment
+  of every mail are checked, as well as the removal of the temporary
+  attachment files of in-memory reports.
+
+Usage:
+    python MailTransportTester.py
+    python MailTransportTester.py --mails 50 --workers 8
+
+Author: Mu Dell'Oro
+Version: v1.0
+Date: 18.10.2026
+Git: https://github.com/Capicodo/PDF-Splitter.git
+"""
+
+import argparse
+import email
+import email.policy
+import os
+import socketserver
+import sys
+import tempfile
+import threading
+from typing import List, Tuple
+
+from ContactData import ContactData
+from MailTransport import OutlookTransport, SmtpTransport, dispatch_reports
+from Report import Report
+
+SENDER_EMAIL = "monatsbericht@example.org"
+SIGNATURE_HTML = "<p>Signatur</p>"
+
+
+class LocalSmtpHandler(socketserver.StreamRequestHandler):
+    """One SMTP session: accepts every sender and recipient, stores the mails."""
+
+    def reply(self, line: str):
+        self.wfile.write(f"{line}\r\n".encode("ascii"))
+
+    def handle(self):
+        self.server.count_connection()
+        self.reply("220 localhost SMTP stand-in")
+
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("ascii", "replace").strip().upper()
+
+            if command.startswith(("EHLO", "HELO")):
+                self.reply("250-localhost")
+                self.reply("250-8BITMIME")
+                self.reply("250 SMTPUTF8")
+            elif command.startswith(("MAIL", "RCPT", "RSET", "NOOP")):
+                self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                self.server.store_mail(self.read_data())
+                self.reply("250 OK")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+    def read_data(self) -> bytes:
+        lines = []
+        while True:
+            line = self.rfile.readline()
+            if not line or line == b".\r\n":
+                return b"".join(lines)
+            # Undo the dot-stuffing of the client
+            lines.append(line[1:] if line.startswith(b"..") else line)
+
+
+class LocalSmtpServer(socketserver.ThreadingTCPServer):
+    """SMTP stand-in on an ephemeral port of 127.0.0.1."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), LocalSmtpHandler)
+        self.mails: List[email.message.EmailMessage] = []
+        self.connections: int = 0
+        self._lock = threading.Lock()
+
+    def count_connection(self):
+        with self._lock:
+            self.connections += 1
+
+    def store_mail(self, data: bytes):
+        mail = email.message_from_bytes(data, policy=email.policy.default)
+        with self._lock:
+            self.mails.append(mail)
+
+
+class FakeAccount:
+    def __init__(self, smtp_address: str):
+        self.SmtpAddress = smtp_address
+
+
+class FakeOleObject:
+    def __init__(self, mail: "FakeMail"):
+        self.mail = mail
+
+    def Invoke(self, dispid, lcid, flags, result, account):
+        if dispid == OutlookTransport.DISPID_SEND_USING_ACCOUNT:
+            self.mail.account = account
+
+
+class FakeAttachments:
+    def __init__(self):
+        self.contents: List[Tuple[str, bytes]] = []
+
+    def Add(self, path: str):
+        # Outlook copies the file when it is attached
+        with open(path, "rb") as attachment_file:
+            self.contents.append((os.path.basename(path), attachment_file.read()))
+
+
+class FakeMail:
+    def __init__(self, outlook: "FakeOutlook"):
+        self.outlook = outlook
+        self._oleobj_ = FakeOleObject(self)
+        self.account = None
+        self.To = ""
+        self.Subject = ""
+        self.HTMLBody = ""
+        self.Attachments = FakeAttachments()
+
+    def Display(self, modal):
+        # Outlook inserts the default signature of the sending account
+        self.HTMLBody = SIGNATURE_HTML
+
+    def Close(self, save_mode):
+        pass
+
+    def Send(self):
+        self.outlook.sent.append(self)
+
+
+class FakeOutlook:
+    """Stand-in for the ``outlook.application`` COM object."""
+
+    def __init__(self):
+        self.sent: List[FakeMail] = []
+
+    def CreateItem(self, item_type):
+        return FakeMail(self)
+
+
+def create_jobs(folder_path: str, count: int) -> List[Tuple[Report, str, str, str]]:
+    """
+    Create ``count`` send jobs, every second report is kept in memory.
+
+    Returns:
+        A list of ``(report, recipient_email, subject, html_body)``.
+    """
+    jobs = []
+    for number in range(1, count + 1):
+        contact_data = ContactData(False, f"person{number}@example.org", number, f"Vorname{number}", "Nachname")
+        report_path = os.path.join(folder_path, f"Bericht {number}.pdf")
+        content = f"%PDF-1.7 Bericht {number}\n".encode("ascii")
+
+        if number % 2:
+            with open(report_path, "wb") as report_file:
+                report_file.write(content)
+            report = Report(number, report_path, contact_data)
+        else:
+            report = Report(number, report_path, contact_data, content)
+
+        jobs.append((report, contact_data.email, f"Monatsbericht {number}", f"<p>Hallo Vorname{number}</p>"))
+    return jobs
+
+
+def expected_attachment(report: Report) -> Tuple[str, bytes]:
+    return os.path.basename(report.document), f"%PDF-1.7 Bericht {report.pli_id}\n".encode("ascii")
+
+
+def check(condition: bool, message: str, failures: List[str]):
+    print(f"{'✅' if condition else '❌'} {message}")
+    if not condition:
+        failures.append(message)
+
+
+def check_smtp(jobs: List[Tuple[Report, str, str, str]], workers: int, failures: List[str]):
+    print(f"\nSmtpTransport: {len(jobs)} Emails mit {workers} Verbindungen an lokalen SMTP Server")
+
+    server = LocalSmtpServer()
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    try:
+        host, port = server.server_address
+        transport = SmtpTransport(host, port, SENDER_EMAIL, max_workers=workers, signature_html=SIGNATURE_HTML, timeout=10)
+        results = dispatch_reports(transport, jobs)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    errors = [error for _, error in results if error is not None]
+    check(not errors, f"Keine Sendefehler {errors[:1]}", failures)
+    check(len(server.mails) == len(jobs), f"{len(server.mails)}/{len(jobs)} Emails angekommen", failures)
+    check(
+        1 <= server.connections <= workers,
+        f"{server.connections} Verbindungen (höchstens {workers})",
+        failures,
+    )
+
+    mails_by_recipient = {mail["To"]: mail for mail in server.mails}
+    wrong = []
+    for report, recipient_email, subject, html_body in jobs:
+        mail = mails_by_recipient.get(recipient_email)
+        if mail is None:
+            wrong.append(recipient_email)
+            continue
+        attachments = [
+            (part.get_filename(), part.get_content()) for part in mail.iter_attachments()
+        ]
+        body = mail.get_body(("html",)).get_content()
+        if (
+            mail["Subject"] != subject
+            or mail["From"] != SENDER_EMAIL
+            or attachments != [expected_attachment(report)]
+            or html_body + SIGNATURE_HTML not in body
+        ):
+            wrong.append(recipient_email)
+    check(not wrong, f"Betreff, Text und Anhang korrekt {wrong[:3]}", failures)
+
+
+def check_outlook(jobs: List[Tuple[Report, str, str, str]], failures: List[str]):
+    print(f"\nOutlookTransport: {len(jobs)} Emails über Outlook Attrappe")
+
+    outlook = FakeOutlook()
+    accounts = [FakeAccount("andere@example.org"), FakeAccount(SENDER_EMAIL.upper())]
+    transport = OutlookTransport(outlook, accounts, SENDER_EMAIL)
+    results = dispatch_reports(transport, jobs)
+
+    errors = [error for _, error in results if error is not None]
+    check(not errors, f"Keine Sendefehler {errors[:1]}", failures)
+    check(len(outlook.sent) == len(jobs), f"{len(outlook.sent)}/{len(jobs)} Emails gesendet", failures)
+
+    wrong = []
+    for (report, recipient_email, subject, html_body), mail in zip(jobs, outlook.sent):
+        if (
+            mail.account is not accounts[1]
+            or mail.To != recipient_email
+            or mail.Subject != subject
+            or mail.HTMLBody != html_body + SIGNATURE_HTML
+            or mail.Attachments.contents != [expected_attachment(report)]
+        ):
+            wrong.append(recipient_email)
+    check(not wrong, f"Absender, Betreff, Text und Anhang korrekt {wrong[:3]}", failures)
+    check(transport._temp_folder_path is None, "Temporäre Anhänge entfernt", failures)
+
+    # An unknown sender account stops the batch before the first mail
+    outlook = FakeOutlook()
+    transport = OutlookTransport(outlook, [FakeAccount("andere@example.org")], SENDER_EMAIL)
+    try:
+        dispatch_reports(transport, jobs)
+        account_error = False
+    except Exception:
+        account_error = True
+    check(account_error and not outlook.sent, "Fehler bei unbekanntem Absenderkonto gemeldet", failures)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test der Email Transporte gegen lokale Attrappen.")
+    parser.add_argument("--mails", type=int, default=10, help="Anzahl der Emails pro Transport")
+    parser.add_argument("--workers", type=int, default=4, help="Anzahl der SMTP Verbindungen")
+    args = parser.parse_args()
+
+    failures: List[str] = []
+    with tempfile.TemporaryDirectory(prefix="pdf_splitter_mail_") as folder_path:
+        jobs = create_jobs(folder_path, args.mails)
+        check_smtp(jobs, args.workers, failures)
+        check_outlook(jobs, failures)
+
+    print()
+    if failures:
+        print(f"❌ {len(failures)} Prüfungen fehlgeschlagen")
+        sys.exit(1)
+    print("✅ Alle Prüfungen bestanden")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+MemoryUsage
+-----------
+
+Helper to read the peak resident set size (RSS) of the current process
+without third-party packages. Uses ``GetProcessMemoryInfo`` on Windows and
+``resource.getrusage`` elsewhere.
+
+Author: Mu Dell'Oro
+Version: v1.0
+Date: 18.10.2026
+Git: https://github.com/Capicodo/PDF-Splitter.git
+"""
+
+import sys
+from typing import Optional
+
+
+def _get_peak_rss_windows() -> Optional[int]:
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    kernel32 = ctypes.WinDLL("kernel32")
+    psapi = ctypes.WinDLL("psapi")
+    kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+    psapi.GetProcessMemoryInfo.argtypes = [
+        wintypes.HANDLE,
+        ctypes.POINTER(PROCESS_MEMORY_COUNTERS),
+        wintypes.DWORD,
+    ]
+    psapi.GetProcessMemoryInfo.restype = wintypes.BOOL
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    if not psapi.GetProcessMemoryInfo(
+        kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb
+    ):
+        return None
+    return counters.PeakWorkingSetSize
+
+
+def get_peak_rss_bytes() -> Optional[int]:
+    """
+    Return the peak resident set size of the current process.
+
+    Returns:
+        The peak RSS in bytes or ``None`` if it cannot be determined.
+    """
+    try:
+        if sys.platform == "win32":
+            return _get_peak_rss_windows()
+
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is reported in bytes on macOS and in kilobytes on Linux
+        return peak if sys.platform == "darwin" else peak * 1024
+    except Exception:
+        return None
+
+
+def format_bytes(size: Optional[int]) -> str:
+    """
+    Format a byte count for console output, e.g. ``"123.4 MB"``.
+
+    Args:
+        size: Number of bytes or ``None``.
+
+    Returns:
+        The formatted size or ``"unbekannt"`` if ``size`` is ``None``.
+    """
+    if size is None:
+        return "unbekannt"
+    return f"{size / (1024 * 1024):.1f} MB"
@@ -20,34 +20,87 @@ GitHub: https://github.com/Capicodo/PDF-Splitter.git
 
 """
 
+from __future__ import annotations
+
 ########################################
 ############# IMPORTS ##################
 ########################################
 
+# fitz, Outlook COM, the print bundle, the asyncio pipeline and the run
+# history are imported in the functions that use them, so the first prompt
+# appears without waiting for them (see benchmarks/StartupBenchmark.py)
+
+import argparse
+import atexit
+import contextlib
 import datetime
+import functools
+import glob
+import hashlib
 import locale
 import logging
+import logging.handlers
+import multiprocessing
 import os
+import queue
 import random
 import sys
 import time
-from typing import Dict
-import fitz  # PyMuPDF
-import pyfiglet
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 import re
 
-import win32com.client as win32
 
 from ContactData import ContactData
 from Report import Report
-
-from PeopleEmailLookup import get_data_from_pli_id, extract_pli_id, init
+from Segment import Segment
+
+from PeopleEmailLookup import (
+    get_data_from_pli_id,
+    extract_pli_id,
+    init,
+    get_validation_errors,
+)
+from PageScanner import (
+    learn_header_zone,
+    extract_header_text,
+    scan_pages_parallel,
+    scan_pages_galloping,
+)
+from ReportWriter import (
+    write_segments_parallel,
+    write_segment,
+    create_writer_pool,
+    save_document,
+    render_document,
+    SAVE_PROFILES,
+)
+from ScanCache import hash_file, build_cache_key, load_scan, store_scan
+from MemoryUsage import get_peak_rss_bytes, format_bytes
+from RunMetrics import RunMetrics
+from OutputManifest import OutputManifest
+from SourceBuffer import SharedSource, SourceDescriptor
+
+if TYPE_CHECKING:
+    import cProfile
+
+    import fitz  # PyMuPDF
+    import win32com.client as win32
+
+    from MailTransport import MailTransport
 
 ########################################
 ############# GLOBALS ##################
 ########################################
 
-logger: logging.Logger
+logger: logging.Logger = logging.getLogger("my_logger")
+log_listener: logging.handlers.QueueListener = None
+log_queue: queue.Queue = None
+
+# Console verbosity; the log file always gets INFO and above
+console_log_level: int = logging.INFO
+log_max_bytes: int = 5 * 1024 * 1024
+log_backup_count: int = 5
 
 sort_by_deliver_method: bool = True
 
@@ -56,18 +109,128 @@ contact_data_list = []
 
 reports: Dict[int, Report] = {}
 
+# Path -> size in bytes of every per-person PDF written in this run
+written_bytes: Dict[str, int] = {}
+# Paths of per-person PDFs reused unchanged from an earlier run
+reused_files: List[str] = []
+
 regex_name_finding_pattern = r"Name:\s*(.*?)\n"
 regex_dienstplan_finding_pattern = r"Dienstplan:\s*(.*?)\n"
 
+use_header_zone: bool = True
+header_zone: fitz.Rect = None
+
+# Number of worker processes for the page scan, 1 scans in this process
+scan_workers: int = os.cpu_count() or 1
+# Number of worker processes for writing the reports, 1 writes in this process
+write_workers: int = os.cpu_count() or 1
+
+# Save profile of the per-person PDFs (see ReportWriter.SAVE_PROFILES) and
+# the attachment size budget used by the "budget" profile
+save_profile: str = "fast"
+size_budget_bytes: int = 2 * 1024 * 1024
+
+# Only read pages around the person boundaries (galloping + binary search);
+# verify_boundaries re-checks the result against a full scan
+boundary_search: bool = False
+verify_boundaries: bool = False
+
+# Skip reports whose inputs did not change since the last run (see OutputManifest)
+use_output_manifest: bool = True
+output_manifest: OutputManifest = None
+
+# Page scan results are cached on disk, keyed by PDF content and regexes
+use_scan_cache: bool = True
+scan_cache_folder_path: str = "scan_cache"
+scan_cache_max_bytes: int = 50 * 1024 * 1024
+
+# The contact index is cached in the scan cache folder, keyed by CSV content
+use_contact_cache: bool = True
+
+# Process one person at a time with bounded memory instead of two phases
+streaming_mode: bool = False
+
+# Keep email reports in memory for sending (see keeps_in_memory); the disk
+# files are then only written in the background for archiving
+in_memory_reports: bool = False
+archive_reports: bool = True
+archive_executor: ThreadPoolExecutor = None
+# (path, size, start page index, end page index, output hash, write future)
+archive_jobs: List[Tuple[str, int, int, int, str, Future]] = []
+
+# Process pool shared by all raw reports of a multi-file batch (see
+# run_multi_file_batch), otherwise every parallel stage creates its own pool
+worker_pool: ProcessPoolExecutor = None
+# One summary entry per raw report of a multi-file batch
+batch_results: List[Dict] = []
+
+# Read the raw report once into shared memory for all worker processes; every
+# process still needs a private in-memory copy to open it (see SourceBuffer)
+use_shared_source: bool = False
+shared_source: SharedSource = None
+
+# Scan, write and send overlapped in one asyncio pipeline (see Pipeline)
+pipeline_mode: bool = False
+pipeline_queue_size: int = 8
+
+# Check the contact data of all people before any PDF is written
+contact_preflight: bool = True
+
+# Only scan and plan, neither write nor send anything
+dry_run: bool = False
+
+# Per-stage timing (and memory with --trace-memory) of the current run,
+# written to run_report_path
+metrics: RunMetrics = RunMetrics()
+run_report_path: str = "run_report.json"
+
+# Every run is added to this SQLite database (see RunHistory), None disables it
+run_history_path: str = "run_history.sqlite3"
+
+# Persons found and mails that failed in this run, over all raw reports
+person_count: int = 0
+send_failures: int = 0
+
+# Set to a file path to profile the run with cProfile (or MONATSBERICHT_PROFILE)
+profile_path: str = os.environ.get("MONATSBERICHT_PROFILE")
+profiler: cProfile.Profile = None
+
+# Paper reports are combined into one print job (see PrintBundle)
+print_duplex: bool = True
+print_cover_pages: bool = False
+print_sender_line: str = ""
+printer_backend: str = "windows" if sys.platform == "win32" else "lp"
+printer_name: str = None
+
+# Exit codes of the non-interactive mode
+EXIT_OK = 0
+EXIT_FAILURE = 1
+EXIT_USAGE_ERROR = 2  # also used by argparse
+EXIT_INPUT_ERROR = 3
+EXIT_CONTACT_DATA_ERROR = 4
+EXIT_SEND_ERROR = 5
+EXIT_PRINT_ERROR = 6
+
 raw_report_file_path: str
 destination_folder_path: str
 contact_data_csv_path: str
 
 raw_report_doc: fitz.Document
+raw_report_hash: str = None
 
 outlook: win32.CDispatch
 accounts = None
 
+# Mail backend: "outlook" or "smtp" (password from MONATSBERICHT_SMTP_PASSWORD)
+mail_transport: str = "outlook"
+smtp_host: str = "localhost"
+smtp_port: int = 25
+smtp_username: str = ""
+smtp_starttls: bool = False
+smtp_workers: int = 8
+# Outlook adds the account signature itself, SMTP mails get this HTML appended
+smtp_signature_html: str = ""
+
 year = ""
 month_name = ""
 
@@ -76,39 +239,63 @@ month_name = ""
 ########################################
 
 
-def setup_logging(log_file="log.txt", override_print=True):
+def setup_logging(log_file="log.txt", override_print=True, console_level=logging.INFO):
     """
     Set up logging to file (with timestamp) and console (without timestamp).
 
+    Log records are put on a queue and written to the handlers by a
+    ``QueueListener`` on a background thread, so slow console output never
+    blocks the caller. The log file is rotated by size.
+
     Args:
         log_file (str): Path to the log file.
-        override_print (bool): If True, overrides the built-in print() to log automatically.
+        override_print (bool): If True, overrides the built-in print() to log
+            automatically. input() is overridden as well, so all pending log
+            lines are written before a prompt appears.
+        console_level (int): Minimum level shown on the console, e.g.
+            ``logging.DEBUG`` for per-page output.
 
     Returns:
         logging.Logger: Configured logger instance.
     """
+    global log_listener
+    global log_queue
+
     # Create logger
     logger = logging.getLogger("my_logger")
-    logger.setLevel(logging.INFO)  # log everything INFO and above
+    logger.setLevel(min(console_level, logging.INFO))
     logger.propagate = False  # avoid duplicate logs if root logger exists
 
     # Clear existing handlers
     if logger.hasHandlers():
         logger.handlers.clear()
-
-    # --- File handler with timestamp ---
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    stop_logging()
+
+    # --- File handler with timestamp, rotated by size ---
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file,
+        maxBytes=log_max_bytes,
+        backupCount=log_backup_count,
+        encoding="utf-8",
+    )
     file_formatter = logging.Formatter("%(asctime)s | %(message)s")
     file_handler.setFormatter(file_formatter)
+    file_handler.setLevel(min(console_level, logging.INFO))
 
     # --- Console handler without timestamp ---
     console_handler = logging.StreamHandler(sys.stdout)
     console_formatter = logging.Formatter("%(message)s")
     console_handler.setFormatter(console_formatter)
+    console_handler.setLevel(console_level)
 
-    # Add handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # --- Queue between the logger and the handlers ---
+    log_queue = queue.Queue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    log_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    log_listener.start()
+    atexit.register(stop_logging)
 
     # Optional: override print()
     if override_print:
@@ -117,18 +304,68 @@ def setup_logging(log_file="log.txt", override_print=True):
             sep = kwargs.get("sep", " ")
             end = kwargs.get("end", "\n")
             message = sep.join(str(a) for a in args) + end
-            logger.info(
-                message.rstrip()
+            logger.log(
+                get_message_level(message), message.rstrip()
             )  # remove extra newline since logger adds its own
 
-        # Override built-in print
         builtins = __import__("builtins")
+        original_input = builtins.input
+
+        def custom_input(prompt=""):
+            flush_logging()
+            return original_input(prompt)
+
+        # Override built-in print and input
         builtins.print = custom_print
+        builtins.input = custom_input
 
     return logger
 
 
-def setup_date_month_year():
+def get_message_level(message: str) -> int:
+    """
+    Return the log level of a printed message from its status emoji: ❌ is
+    an error and ⚠️ a warning, so both still reach the console with
+    ``--quiet``. Everything else is INFO.
+    """
+
+    if "❌" in message:
+        return logging.ERROR
+    if "⚠️" in message:
+        return logging.WARNING
+    return logging.INFO
+
+
+def flush_logging():
+    """Wait until the background thread has written all queued log records."""
+    if log_listener and log_queue:
+        log_queue.join()
+
+
+def stop_logging():
+    """Write all queued log records and stop the background thread."""
+    global log_listener
+
+    if log_listener:
+        log_listener.stop()
+        log_listener = None
+
+
+def print_progress(label: str, done: int, total: int):
+    """
+    Print a progress line in steps of 10 percent instead of one line per item.
+
+    Args:
+        label: Description of the counted items, e.g. "Seiten gescannt".
+        done: Number of finished items.
+        total: Total number of items.
+    """
+    step = max(1, total // 10)
+    if done == total or done % step == 0:
+        print(f"⏳ {done}/{total} {label} ({done * 100 // max(1, total)} %)")
+
+
+def setup_date_month_year(month_override: int = None, year_override: int = None):
     """
     Set the global `year` and `month_name` variables to represent the previous
     month.
@@ -138,6 +375,12 @@ def setup_date_month_year():
     stores the localized month name and 4-digit year into the module-level
     globals `month_name` and `year`.
 
+    Args:
+        month_override: Optional month (1-12) to use instead of the previous
+            month.
+        year_override: Optional 4-digit year to use instead of the year of
+            the previous month.
+
     Returns:
         None
 
@@ -168,6 +411,11 @@ def setup_date_month_year():
             prev_month = now.month - 1
             prev_year = now.year
 
+        if month_override:
+            prev_month = month_override
+        if year_override:
+            prev_year = year_override
+
         # Create a date object for the previous month (use day=1)
         prev_date = datetime.datetime(prev_year, prev_month, 1)
         # Get full month name in German
@@ -192,14 +440,17 @@ def clean_path(path: str) -> str:
     return path.strip().strip('"').strip("'")
 
 
-def input_paths():
+def input_paths(dropped_raw_report_path: str = None):
     """
     Prompt the user for input file paths and initialize required resources.
 
     The function asks the user (via console input) for the raw monthly report
     PDF path, the destination folder for the split PDFs, and the CSV path for
-    contact data. It attempts to initialize the contact data lookup, creates
-    the destination folder if necessary, and opens the raw PDF with PyMuPDF.
+    contact data, then initializes the resources with ``open_inputs``.
+
+    Args:
+        dropped_raw_report_path: Raw report passed on the command line, e.g.
+            by dropping it onto the program; it is not asked for again.
 
     Globals set:
         rawReportFilePath, destinationFolderPath, contact_data_csv_path,
@@ -210,15 +461,12 @@ def input_paths():
             error message and exits the program.
     """
 
-    global sort_by_deliver_method
-
     global raw_report_file_path
     global destination_folder_path
     global contact_data_csv_path
-    global raw_report_doc
 
     try:
-        raw_report_file_path = input(
+        raw_report_file_path = dropped_raw_report_path or input(
             "Pfad zum rohen Monatsbericht eingeben oder per Drag & Drop in das Fenster ziehen. \nAnschließend mit Enter bestätigen. \n\nPfad: "
         )
         raw_report_file_path = clean_path(raw_report_file_path)
@@ -236,20 +484,8 @@ def input_paths():
         contact_data_csv_path = clean_path(contact_data_csv_path)
         print(f"\n✅ Eingabepfad erkannt: {contact_data_csv_path}\n")
 
-        try:
-            init(contact_data_csv_path)
-            print("✅ Kontaktdaten erfolgreich initialisiert")
-        except Exception as e:
-            sort_by_deliver_method = False
-            destination_folder_path += f"/Kontaktdatenlos_und_Unsortiert"
-            print(f"❌ FEHLER BEIM DATEI-ZUGRIFF: {e}")
-            print(f"ℹ️ Es wird ohne Kontaktdatenliste gearbeitet")
-
-        os.makedirs(destination_folder_path, exist_ok=True)
-        print("✅ Zielordner erstellt oder bereits vorhandenen gefunden")
-
-        raw_report_doc = fitz.open(raw_report_file_path)
-        print("✅ PDF erfolgreich geöffnet\n\n")
+        with metrics.stage("input_paths"):
+            open_inputs()
 
     except Exception as e:
         print(f"❌ FEHLER BEIM DATEI-ZUGRIFF: {e}")
@@ -257,6 +493,127 @@ def input_paths():
         raise SystemExit
 
 
+def open_inputs():
+    """
+    Initialize the resources for the paths stored in the module globals.
+
+    Loads the contact data (see ``load_contacts``) and opens the raw report
+    (see ``open_raw_report``).
+
+    Globals set:
+        raw_report_doc, sort_by_deliver_method, destination_folder_path
+
+    Raises:
+        Exception: If the destination folder cannot be created or the PDF
+            cannot be opened.
+    """
+
+    load_contacts()
+    open_raw_report()
+
+
+def load_contacts():
+    """
+    Load the contact data from `contact_data_csv_path`.
+
+    On failure the run falls back to unsorted output without contact data
+    and `destination_folder_path` is redirected to a subfolder.
+
+    Globals set:
+        sort_by_deliver_method, destination_folder_path
+    """
+
+    global sort_by_deliver_method
+    global destination_folder_path
+
+    try:
+        init(
+            contact_data_csv_path,
+            scan_cache_folder_path if use_contact_cache else None,
+        )
+        print("✅ Kontaktdaten erfolgreich initialisiert")
+
+        validation_errors = get_validation_errors()
+        if validation_errors:
+            print(
+                f"⚠️ Die Kontaktdatenliste enthält {len(validation_errors)} fehlerhafte Einträge:"
+            )
+            for validation_error in validation_errors:
+                print(f" ⚠️ {validation_error}")
+    except Exception as e:
+        sort_by_deliver_method = False
+        destination_folder_path += f"/Kontaktdatenlos_und_Unsortiert"
+        print(f"❌ FEHLER BEIM DATEI-ZUGRIFF: {e}")
+        print(f"ℹ️ Es wird ohne Kontaktdatenliste gearbeitet")
+
+
+def open_raw_report():
+    """
+    Create `destination_folder_path` and open `raw_report_file_path` with
+    PyMuPDF, via shared memory if ``use_shared_source`` is enabled.
+
+    Globals set:
+        raw_report_doc, shared_source
+
+    Raises:
+        Exception: If the destination folder cannot be created or the PDF
+            cannot be opened.
+    """
+
+    global raw_report_doc
+    global shared_source
+
+    os.makedirs(destination_folder_path, exist_ok=True)
+    print("✅ Zielordner erstellt oder bereits vorhandenen gefunden")
+
+    if use_shared_source:
+        shared_source = SharedSource(raw_report_file_path)
+        atexit.register(close_shared_source)
+        raw_report_doc = shared_source.open()
+        print(
+            f"✅ PDF einmal in den gemeinsamen Speicher gelesen ({format_bytes(shared_source.size)} in {shared_source.read_seconds:.2f} s)"
+        )
+    else:
+        import fitz  # PyMuPDF
+
+        raw_report_doc = fitz.open(raw_report_file_path)
+    print("✅ PDF erfolgreich geöffnet\n\n")
+
+
+def close_shared_source():
+    """Close `raw_report_doc` and release the shared memory of the raw PDF."""
+
+    global shared_source
+
+    if not shared_source:
+        return
+
+    try:
+        raw_report_doc.close()
+    except Exception:
+        pass
+    shared_source.close()
+    shared_source = None
+
+
+def get_worker_source(workers: int) -> SourceDescriptor:
+    """
+    Return the source descriptor with which worker processes open the raw
+    PDF: the shared memory block if ``use_shared_source`` is enabled, the
+    file path otherwise.
+
+    Args:
+        workers: Number of worker processes that will open the source,
+            counted for the disk I/O report.
+    """
+
+    if not shared_source:
+        return raw_report_file_path
+
+    shared_source.worker_opens += workers
+    return shared_source.descriptor
+
+
 def regex_search_text(_regex, _text):
     """
     Search `_text` for `_regex` and return the first capture group if found.
@@ -283,31 +640,24 @@ def regex_search_text(_regex, _text):
         return None
 
 
-def create_report(
+def get_report_path(
     start_page_index, end_page_index, person_name, contact_data: ContactData = None
-):
+) -> str:
     """
-    Create a per-person PDF by slicing the raw report and save it to disk.
+    Build the target path of a per-person PDF and create its subfolder.
 
-    The function extracts pages from the global `raw_report_doc` starting at
-    `_newNamePageIndex` up to `_pageIndex` (inclusive), writes the new PDF to
-    a subfolder of `destinationFolderPath` depending on delivery preference
-    (``send``, ``print`` or ``unsorted``), and registers a `Report` object in
-    the module-level `reports` dictionary when ``contact_data`` is provided.
+    The file is placed in a subfolder of `destination_folder_path` depending
+    on delivery preference (``send``, ``print`` or ``unsorted``).
 
     Args:
-        _newNamePageIndex: First page index for the person's report (0-based).
-        _pageIndex: Last page index for the person's report (0-based).
-        _name: Person's name used to build the target filename.
-        contact_data: Optional ``ContactData`` used to determine destination
-            folder and to create a `Report` entry.
+        start_page_index: First page index of the person's report (0-based).
+        end_page_index: Last page index of the person's report (0-based).
+        person_name: Person's name used to build the target filename.
+        contact_data: Optional ``ContactData`` used to determine the
+            destination folder.
 
     Returns:
-        None
-
-    Notes:
-        Filenames are sanitized for Windows and any errors during save are
-        printed to console.
+        The full path of the PDF file to write.
     """
 
     group_folder_path: str = destination_folder_path
@@ -319,281 +669,1502 @@ def create_report(
 
     os.makedirs(group_folder_path, exist_ok=True)
 
-    new_doc = fitz.open()
-
-    try:
-        safe_name = re.sub(
-            r'[<>:"/\\|?*]', "_", person_name
-        )  # sanitize for Windows filenames
-        joined_path = os.path.join(
-            group_folder_path,
-            f"Monatsbericht_{safe_name}_{start_page_index+1}-{end_page_index+1}.pdf",
-        )
-
-        new_doc.insert_pdf(
-            raw_report_doc, from_page=start_page_index, to_page=end_page_index
-        )
-        new_doc.save(joined_path)
-
-        if contact_data:
+    safe_name = re.sub(
+        r'[<>:"/\\|?*]', "_", person_name
+    )  # sanitize for Windows filenames
+    return os.path.join(
+        group_folder_path,
+        f"Monatsbericht_{safe_name}_{start_page_index+1}-{end_page_index+1}.pdf",
+    )
 
-            pli_id: int = contact_data.pli_id
-            new_report: Report = Report(pli_id, joined_path, contact_data)
-            reports[pli_id] = new_report
 
-        print(f"💾 Datei gespeichert: {joined_path}")
-    except Exception as e:
+def get_report_start_page(report_path: str) -> int:
+    """
+    Return the first page (1-based) of a report from the page range in its
+    file name (see ``get_report_path``), 0 if the name has none.
+    """
 
-        print(f"❌ Fehler beim Speichern: {e}")
+    match = re.search(r"_(\d+)-\d+\.pdf$", report_path)
+    return int(match.group(1)) if match else 0
 
 
-def get_page_person_infos(_index):
+def register_report(joined_path: str, contact_data: ContactData = None) -> Report:
     """
-    Extract the name and PLI ID from a page in the raw report PDF.
+    Register a written PDF as ``Report`` in the module-level `reports`.
 
     Args:
-        _index: Page index (0-based) to scan in `raw_report_doc`.
+        joined_path: Path of the written per-person PDF.
+        contact_data: ``ContactData`` of the person or ``None``.
 
     Returns:
-        A tuple of ``(name, pli_id)`` where ``name`` is the extracted person
-        name string and ``pli_id`` is an integer PLI ID if successfully
-        extracted; ``pli_id`` will be ``None`` on failure to parse.
-
-    Raises:
-        Exception: If the expected name field is not found on the page.
+        The new ``Report`` or ``None`` if no ``contact_data`` is given.
     """
 
-    currentPage = raw_report_doc[_index]
-    currentText = currentPage.get_text()
+    if not contact_data:
+        return None
 
-    print("-------------START Scanning--------------")
-    currentName = regex_search_text(regex_name_finding_pattern, currentText)
+    pli_id: int = contact_data.pli_id
+    new_report: Report = Report(pli_id, joined_path, contact_data)
+    reports[pli_id] = new_report
 
-    if currentName:
-        print(f"✅ Seite {_index+1}: Name gefunden → {currentName}")
-    else:
-        raise Exception(f"❌ Kein Name auf Seite {_index+1} gefunden ❌")
+    return new_report
 
-    currentDienstplan = regex_search_text(regex_dienstplan_finding_pattern, currentText)
 
-    if currentName:
-        print(f"✅ Seite {_index+1}: Name gefunden → {currentName}")
-    else:
-        raise Exception(f"❌ Kein Name auf Seite {_index+1} gefunden ❌")
-    print("-------------END Scanning----------------")
+def get_raw_report_hash() -> str:
+    """
+    Return the content hash of the raw report, computed once per run.
 
-    try:
+    With ``use_shared_source`` the hash was already computed while reading
+    the file into shared memory.
 
-        pli_id: int = extract_pli_id(currentDienstplan)
-        print(f"Found PLI ID:-->{pli_id}<--")
+    Returns:
+        The SHA-256 hex digest of `raw_report_file_path`.
+    """
 
-    except Exception as e:
+    global raw_report_hash
 
-        print("❌❌❌ Fehler beim Bearbeiten der PLI-# ❌❌❌")
-        print(e)
-        return currentName, None
+    if raw_report_hash is None:
+        if shared_source:
+            raw_report_hash = shared_source.sha256
+        else:
+            raw_report_hash = hash_file(raw_report_file_path)
 
-    return currentName, pli_id
+    return raw_report_hash
 
 
-def get_searched_contact_data(pli_id):
+def get_output_manifest() -> OutputManifest:
     """
-    Retrieve contact data for a given PLI ID using the CSV-based lookup.
-
-    Args:
-        pli_id: Piluweri ID used to search the contact CSV.
+    Return the output manifest of `destination_folder_path`, loading it on
+    first use.
 
     Returns:
-        A ``ContactData`` instance corresponding to the PLI ID.
-
-    Raises:
-        Exception: If no deliver information is found or the lookup raises an
-            error. The original error will be propagated with the PLI ID added
-            for context.
+        The ``OutputManifest`` or ``None`` if ``use_output_manifest`` is
+        disabled.
     """
 
-    try:
-        contact_data = get_data_from_pli_id(pli_id)
-        
-        if not contact_data.deliver_via_paper and not contact_data.email:
-            raise Exception(
-                f"Pilu mit PLI-#: {pli_id} hat keine gültige Email-Adresse, obwohl Email-Versand in der CSV angegeben ist"
-            )
-        
-        #print(
-        #    f"✅✅✅✅✅✅✅ For PLI-#: {pli_id} was correct deliver-information successfully found ✅✅✅✅✅✅"
-        #)
-        print("")
-    except Exception as e:
-        print(f"⚠️⚠️⚠️⚠️ For PLI-#: {pli_id} got error: {e}")
-        raise Exception(f"{e}, {pli_id}")
+    global output_manifest
 
-    return contact_data
+    if not use_output_manifest:
+        return None
 
+    if output_manifest is None or output_manifest.folder_path != destination_folder_path:
+        output_manifest = OutputManifest.load(destination_folder_path)
 
-def iterate_pages():
-    """
-    Iterate over pages in the raw PDF and split them into per-person PDFs.
+    return output_manifest
 
-    The function walks through every page of the global `raw_report_doc`,
-    detects changes in the `Name:` field to determine page boundaries for a
-    single person's report, attempts to resolve contact data for each person
-    and calls ``create_report`` to write the per-person PDF files. Found
-    contact entries are appended to `contact_datas` and lookup failures to
-    `contact_fails`.
 
-    Returns:
-        None
+def reuse_unchanged_report(joined_path: str, start_page_index, end_page_index) -> bool:
     """
+    Check whether a report from an earlier run can be reused for
+    ``joined_path``.
 
-    last_name, last_pli_id = get_page_person_infos(0)
-    lastNewNamePageIndex = 0
+    The report is reused if the raw report, page range and save profile are
+    unchanged and the earlier file is intact; if it lies in another subfolder
+    it is moved to ``joined_path``.
 
-    for pageIndex in range(raw_report_doc.page_count):
+    Returns:
+        True if the report does not have to be written.
+    """
 
-        currentName, current_pli_id = get_page_person_infos(pageIndex)
+    manifest = get_output_manifest()
+    if not manifest:
+        return False
 
-        if last_name != currentName or pageIndex == raw_report_doc.page_count - 1:
+    try:
+        if manifest.reuse(
+            joined_path,
+            get_raw_report_hash(),
+            start_page_index,
+            end_page_index,
+            save_profile,
+        ):
+            reused_files.append(joined_path)
+            print(f"⏭️ Unverändert übernommen: {joined_path}")
+            return True
+    except Exception as e:
+        print(f"⚠️ Frühere Datei konnte nicht übernommen werden: {e}")
 
-            contact_data = None
+    return False
 
-            if sort_by_deliver_method:
 
-                try:
-                    contact_data = get_searched_contact_data(last_pli_id)
-                    contact_data_list.append(contact_data)
-                except Exception as e:
-                    contact_failures.append(
-                        f"❌ Für {last_name} war Kontaktdatensuche fehlerhaft: {e} \n❌ Die PDF wurde in den unsorted-Ordner gelegt!❌"
-                    )
+def save_output_manifest():
+    """Write the output manifest, if used, to the destination folder."""
 
-            print("\n\n")
-            print(
-                f"🎯 Seitenwechsel bei Seite {pageIndex+1} → Neuer Name: {currentName}"
-            )
+    if not output_manifest:
+        return
 
-            create_report(lastNewNamePageIndex, pageIndex - 1, last_name, contact_data)
+    try:
+        output_manifest.save()
+    except Exception as e:
+        print(f"⚠️ Manifest konnte nicht gespeichert werden: {e}")
 
-            lastNewNamePageIndex = pageIndex
 
-        last_name = currentName
-        last_pli_id = current_pli_id
+def record_written_file(
+    joined_path: str,
+    bytes_written: int,
+    start_page_index,
+    end_page_index,
+    output_hash: str = None,
+):
+    """
+    Remember the size of a written PDF, add it to the output manifest and
+    print it.
 
-        print("")
+    Files above the size budget of the ``budget`` save profile are flagged.
 
-    print("\n\n✅✅✅ PDFs wurden erstellt ✅✅✅\n\n")
+    Args:
+        joined_path: Path of the written per-person PDF.
+        bytes_written: File size in bytes.
+        start_page_index: First page index of the report (0-based).
+        end_page_index: Last page index of the report (0-based).
+        output_hash: SHA-256 of the file if already known.
+    """
 
-    if contact_data_list:
-        print(
-            f"\n\n✅✅✅ {len(contact_data_list)} Kontaktdaten wurden gefunden: ✅✅✅\n\n"
-        )
-    for current_contact_data in contact_data_list:
+    written_bytes[joined_path] = bytes_written
+    print(f"💾 Datei gespeichert: {joined_path} ({bytes_written / 1024:.0f} KB)")
 
-        print(f"✅ {current_contact_data.__dict__}")
+    manifest = get_output_manifest()
+    if manifest:
+        try:
+            manifest.record(
+                joined_path,
+                get_raw_report_hash(),
+                start_page_index,
+                end_page_index,
+                save_profile,
+                output_hash,
+            )
+        except Exception as e:
+            print(f"⚠️ Manifest-Eintrag fehlgeschlagen: {e}")
 
-    if contact_failures:
+    if save_profile == "budget" and bytes_written > size_budget_bytes:
         print(
-            f"\n❌❌❌ {len(contact_failures)} Kontaktdaten sind fehlerhaft: ❌❌❌\n\n"
+            f"⚠️ Datei ist größer als das Budget von {size_budget_bytes / 1024:.0f} KB: {joined_path}"
         )
-        for current_fail in contact_failures:
-            print(f" ❌ Fehler: {current_fail}")
 
 
-def get_answer_yes_no():
+def keeps_in_memory(contact_data: ContactData) -> bool:
     """
-    Prompt the user for a yes/no answer and return a boolean.
+    Return True if the report of ``contact_data`` is kept in memory.
 
-    The prompt accepts 'y' or 'n' (case-insensitive). It will repeat until a
-    valid answer is entered.
-
-    Returns:
-        True if the user entered 'y', False if the user entered 'n'.
+    Only email reports are kept in memory with ``in_memory_reports``; paper
+    and unsorted reports are always written to disk, since the print bundle
+    and the user read them from there.
     """
 
-    while True:
-
-        print("\n (Y -> Ja) | (N -> Nein)")
-        answer: str = input("\nEingabe:")
-
-        if str.lower(answer) == "y":
-            return True
-        elif str.lower(answer) == "n":
-            return False
-        else:
-            print("\n ❌ Ungültige Eingabe. Bitte erneut Eingeben")
+    return (
+        in_memory_reports
+        and contact_data is not None
+        and not contact_data.deliver_via_paper
+    )
 
 
-def print_banner():
+def register_in_memory_report(
+    joined_path: str,
+    content: bytes,
+    contact_data: ContactData,
+    start_page_index,
+    end_page_index,
+    output_hash: str = None,
+) -> Report:
     """
-    Print an ASCII banner and version/introduction text to the console.
+    Register a report rendered into memory and, with ``archive_reports``,
+    write it to ``joined_path`` in the background (see ``archive_report``).
 
-    The banner includes the module version and a short note about supported
-    features.
+    ``output_hash`` is the SHA-256 of ``content`` if a worker already
+    computed it.
+
+    Returns:
+        The new ``Report`` holding ``content``.
     """
 
+    new_report = register_report(joined_path, contact_data)
+    new_report.content = content
     print(
-        "\033[32m"
-        + """
- ____  ____  _____   ____        _ _ _   _
-|  _ \\|  _ \\|  ___| / ___| _ __ | (_) |_| |_ ___ _ __
-| |_) | | | | |_    \\___ \\| '_ \\| | | __| __/ _ \\ '__|
-|  __/| |_| |  _|    ___) | |_) | | | |_| ||  __/ |
-|_|   |____/|_|     |____/| .__/|_|_|\\__|\\__\\___|_|
-                          |_|
-                  _             __  __
-                 | |__  _   _  |  \\/  |_   _
-                 | '_ \\| | | | | |\\/| | | | |
-                 | |_) | |_| | | |  | | |_| |
-                 |_.__/ \\__, | |_|  |_|\\__,_|
-                        |___/
-"""
+        f"🧠 Bericht im Speicher erstellt: {os.path.basename(joined_path)} ({len(content) / 1024:.0f} KB)"
     )
 
-    print()
-    print("v2.2")
-    print("12.05.2026")
-    print("Diese Version unterstützt das Teilen und Senden der Monatsberichte")
-    print("Das Drucken wird in dieser Version noch NICHT unterstützt")
-    print("\033[0m")
+    if archive_reports:
+        archive_report(
+            joined_path,
+            content,
+            start_page_index,
+            end_page_index,
+            output_hash or hashlib.sha256(content).hexdigest(),
+        )
 
+    return new_report
 
-def send_emails():
-    """
-    Send emails for all reports that are configured to be delivered by email.
 
-    The function lists the recipients, prompts the user for the sender account
-    and confirmation, then iterates over created `Report` instances and sends
-    the reports to recipients who prefer email delivery via Outlook.
+def write_archive_file(joined_path: str, content: bytes):
+    """Write an in-memory report to disk (runs in the archive thread)."""
 
-    Returns:
-        None
+    with open(joined_path, "wb") as archive_file:
+        archive_file.write(content)
+
+
+def archive_report(
+    joined_path: str, content: bytes, start_page_index, end_page_index, output_hash: str
+):
+    """
+    Queue an in-memory report for writing to disk in the background, so the
+    write to the destination share overlaps with splitting and sending.
+    ``output_hash`` is recorded in the output manifest once it is written.
+    """
+
+    global archive_executor
+
+    if archive_executor is None:
+        archive_executor = ThreadPoolExecutor(max_workers=1)
+
+    future = archive_executor.submit(write_archive_file, joined_path, content)
+    archive_jobs.append(
+        (joined_path, len(content), start_page_index, end_page_index, output_hash, future)
+    )
+
+
+def finish_archiving():
+    """
+    Wait for the background writes of ``archive_report``, record the files
+    and save the output manifest.
+    """
+
+    global archive_executor
+
+    if not archive_jobs:
+        return
+
+    with metrics.stage("archive_reports") as stage:
+        for joined_path, size, start_page_index, end_page_index, output_hash, future in archive_jobs:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"❌ Fehler beim Archivieren von {joined_path}: {e}")
+                continue
+
+            record_written_file(
+                joined_path, size, start_page_index, end_page_index, output_hash
+            )
+            stage.items += 1
+
+    archive_jobs.clear()
+    archive_executor.shutdown()
+    archive_executor = None
+
+    save_output_manifest()
+
+
+def create_report(
+    start_page_index, end_page_index, person_name, contact_data: ContactData = None
+):
+    """
+    Create a per-person PDF by slicing the raw report and save it to disk.
+
+    The function extracts pages from the global `raw_report_doc` starting at
+    `start_page_index` up to `end_page_index` (inclusive), writes the new PDF
+    to the path from ``get_report_path`` with the configured `save_profile`
+    (unless an unchanged file from an earlier run can be reused, see
+    ``reuse_unchanged_report``; email reports may be kept in memory instead,
+    see ``keeps_in_memory``) and registers a `Report` object in the module-level `reports` dictionary
+    when ``contact_data`` is provided.
+
+    Args:
+        start_page_index: First page index for the person's report (0-based).
+        end_page_index: Last page index for the person's report (0-based).
+        person_name: Person's name used to build the target filename.
+        contact_data: Optional ``ContactData`` used to determine destination
+            folder and to create a `Report` entry.
+
+    Returns:
+        The path of the written file or ``None`` if saving failed.
+
+    Notes:
+        Filenames are sanitized for Windows and any errors during save are
+        printed to console.
+    """
+
+    try:
+        joined_path = get_report_path(
+            start_page_index, end_page_index, person_name, contact_data
+        )
+
+        if reuse_unchanged_report(joined_path, start_page_index, end_page_index):
+            register_report(joined_path, contact_data)
+            return joined_path
+
+        import fitz  # PyMuPDF
+
+        with fitz.open() as new_doc:
+            new_doc.insert_pdf(
+                raw_report_doc, from_page=start_page_index, to_page=end_page_index
+            )
+
+            if keeps_in_memory(contact_data):
+                content = render_document(new_doc, save_profile, size_budget_bytes)
+                register_in_memory_report(
+                    joined_path, content, contact_data, start_page_index, end_page_index
+                )
+                return joined_path
+
+            bytes_written, output_hash = save_document(
+                new_doc, joined_path, save_profile, size_budget_bytes
+            )
+
+        register_report(joined_path, contact_data)
+        record_written_file(
+            joined_path, bytes_written, start_page_index, end_page_index, output_hash
+        )
+
+        return joined_path
+    except Exception as e:
+
+        print(f"❌ Fehler beim Speichern: {e}")
+        return None
+
+
+def setup_header_zone():
+    """
+    Learn the position of the header fields from the first page.
+
+    When ``use_header_zone`` is enabled, the clip rectangle containing the
+    "Name:" and "Dienstplan:" fields is learned from page 0 of the global
+    `raw_report_doc` and stored in the module-level `header_zone`. Later
+    calls to ``get_page_person_infos`` then only extract the text inside this
+    rectangle. If the layout check fails, `header_zone` stays ``None`` and
+    every page is read completely.
+
+    Returns:
+        None
+    """
+
+    global header_zone
+
+    header_zone = None
+    if not use_header_zone or raw_report_doc.page_count == 0:
+        return
+
+    header_zone = learn_header_zone(
+        raw_report_doc[0],
+        (regex_name_finding_pattern, regex_dienstplan_finding_pattern),
+    )
+
+    if header_zone:
+        print(f"✅ Kopfbereich erkannt: {header_zone}")
+    else:
+        print("ℹ️ Kopfbereich nicht erkannt, es wird der gesamte Seitentext gelesen")
+
+
+def get_page_person_infos(_index):
+    """
+    Extract the name and PLI ID from a page in the raw report PDF.
+
+    Args:
+        _index: Page index (0-based) to scan in `raw_report_doc`.
+
+    Returns:
+        A tuple of ``(name, pli_id)`` where ``name`` is the extracted person
+        name string and ``pli_id`` is an integer PLI ID if successfully
+        extracted; ``pli_id`` will be ``None`` on failure to parse.
+
+    Raises:
+        Exception: If the expected name field is not found on the page.
+    """
+
+    currentPage = raw_report_doc[_index]
+    currentText = extract_header_text(
+        currentPage,
+        header_zone,
+        (regex_name_finding_pattern, regex_dienstplan_finding_pattern),
+    )
+
+    currentName = regex_search_text(regex_name_finding_pattern, currentText)
+
+    if currentName:
+        logger.debug(f"✅ Seite {_index+1}: Name gefunden → {currentName}")
+    else:
+        raise Exception(f"❌ Kein Name auf Seite {_index+1} gefunden ❌")
+
+    currentDienstplan = regex_search_text(regex_dienstplan_finding_pattern, currentText)
+    logger.debug(f"✅ Seite {_index+1}: Dienstplan gefunden → {currentDienstplan}")
+
+    try:
+
+        pli_id: int = extract_pli_id(currentDienstplan)
+        logger.debug(f"Found PLI ID:-->{pli_id}<--")
+
+    except Exception as e:
+
+        logger.warning(f"❌❌❌ Fehler beim Bearbeiten der PLI-# auf Seite {_index+1} ❌❌❌\n{e}")
+        return currentName, None
+
+    return currentName, pli_id
+
+
+def scan_page_infos():
+    """
+    Read name and PLI ID of every page in the raw report.
+
+    With ``scan_workers`` set to 1 the pages are scanned one after another
+    with ``get_page_person_infos``. Otherwise the page range is split across
+    a process pool in which every worker opens its own copy of the raw PDF.
+    Both paths return the same result.
+
+    Returns:
+        A list of ``(page_index, name, pli_id)`` tuples in page order.
+    """
+
+    page_count = raw_report_doc.page_count
+
+    if scan_workers <= 1 or page_count < 2:
+        page_infos = []
+        for page_index in range(page_count):
+            page_infos.append((page_index, *get_page_person_infos(page_index)))
+            print_progress("Seiten gescannt", page_index + 1, page_count)
+        return page_infos
+
+    print(f"ℹ️ Scanne {page_count} Seiten mit {scan_workers} Prozessen...")
+    page_infos = scan_pages_parallel(
+        get_worker_source(min(scan_workers, page_count)),
+        page_count,
+        scan_workers,
+        header_zone,
+        regex_name_finding_pattern,
+        regex_dienstplan_finding_pattern,
+        pool=worker_pool,
+    )
+    print(f"✅ {len(page_infos)} Seiten gescannt")
+
+    return page_infos
+
+
+def scan_page_infos_galloping():
+    """
+    Read name and PLI ID of every page, probing only around the boundaries.
+
+    Uses ``scan_pages_galloping`` with ``get_page_person_infos``. With
+    ``verify_boundaries`` enabled the result is compared with a full scan
+    (``scan_page_infos``); on any difference the full scan is used.
+
+    Returns:
+        A list of ``(page_index, name, pli_id)`` tuples in page order.
+    """
+
+    page_count = raw_report_doc.page_count
+
+    page_infos, probed_pages = scan_pages_galloping(get_page_person_infos, page_count)
+    print(f"ℹ️ Grenzsuche: {probed_pages} von {page_count} Seiten gelesen")
+
+    if verify_boundaries:
+        full_page_infos = scan_page_infos()
+        if [info[:2] for info in full_page_infos] != [info[:2] for info in page_infos]:
+            print(
+                "⚠️ Die Grenzsuche weicht vom vollständigen Scan ab (Seiten einer Person nicht zusammenhängend?). Es wird der vollständige Scan verwendet."
+            )
+            return full_page_infos
+        print("✅ Grenzsuche durch vollständigen Scan bestätigt")
+
+    return page_infos
+
+
+def get_page_infos():
+    """
+    Return the page scan results, from the scan cache if possible.
+
+    If ``use_scan_cache`` is enabled, the results are looked up in the scan
+    cache by a hash of the raw PDF and the regex patterns. On a cache miss
+    the pages are scanned (see ``setup_header_zone`` and ``scan_page_infos``)
+    and the results are stored in the cache. Cache errors never abort the
+    run, they only cause a full scan.
+
+    Returns:
+        A list of ``(page_index, name, pli_id)`` tuples in page order.
+    """
+
+    cache_key = None
+
+    if use_scan_cache:
+        try:
+            cache_key = build_cache_key(
+                get_raw_report_hash(),
+                (regex_name_finding_pattern, regex_dienstplan_finding_pattern)
+                # unverified boundary search results are cached separately
+                + (("boundary_search",) if boundary_search and not verify_boundaries else ()),
+            )
+            page_infos = load_scan(scan_cache_folder_path, cache_key)
+            if page_infos is not None and len(page_infos) == raw_report_doc.page_count:
+                print(f"✅ Scan-Ergebnis aus dem Cache geladen ({len(page_infos)} Seiten)")
+                return page_infos
+        except Exception as e:
+            print(f"⚠️ Scan-Cache konnte nicht gelesen werden: {e}")
+
+    with metrics.stage("get_page_person_infos") as stage:
+        setup_header_zone()
+        if boundary_search:
+            page_infos = scan_page_infos_galloping()
+        else:
+            page_infos = scan_page_infos()
+        stage.items += len(page_infos)
+
+    if cache_key:
+        try:
+            store_scan(
+                scan_cache_folder_path,
+                cache_key,
+                page_infos,
+                raw_report_file_path,
+                scan_cache_max_bytes,
+            )
+        except Exception as e:
+            print(f"⚠️ Scan-Cache konnte nicht geschrieben werden: {e}")
+
+    return page_infos
+
+
+def check_contact_data(pli_id) -> ContactData:
+    """
+    Look up the contact data of a PLI ID and check that it can be delivered.
+
+    Args:
+        pli_id: Piluweri ID used to search the contact index.
+
+    Returns:
+        The ``ContactData`` of the PLI ID.
+
+    Raises:
+        Exception: If no entry is found, the entry is invalid or an email
+            recipient has no email address.
+    """
+
+    contact_data = get_data_from_pli_id(pli_id)
+
+    if not contact_data.deliver_via_paper and not contact_data.email:
+        raise Exception(
+            f"Pilu mit PLI-#: {pli_id} hat keine gültige Email-Adresse, obwohl Email-Versand in der CSV angegeben ist"
+        )
+
+    return contact_data
+
+
+def get_searched_contact_data(pli_id):
+    """
+    Retrieve contact data for a given PLI ID using the CSV-based lookup.
+
+    Args:
+        pli_id: Piluweri ID used to search the contact CSV.
+
+    Returns:
+        A ``ContactData`` instance corresponding to the PLI ID.
+
+    Raises:
+        Exception: If no deliver information is found or the lookup raises an
+            error. The original error will be propagated with the PLI ID added
+            for context.
+    """
+
+    try:
+        contact_data = check_contact_data(pli_id)
+
+        #print(
+        #    f"✅✅✅✅✅✅✅ For PLI-#: {pli_id} was correct deliver-information successfully found ✅✅✅✅✅✅"
+        #)
+        print("")
+    except Exception as e:
+        print(f"⚠️⚠️⚠️⚠️ For PLI-#: {pli_id} got error: {e}")
+        raise Exception(f"{e}, {pli_id}")
+
+    return contact_data
+
+
+def resolve_contact_data(name, pli_id) -> ContactData:
+    """
+    Resolve the contact data of a person if sorting by delivery method.
+
+    Found entries are appended to `contact_data_list` and lookup failures to
+    `contact_failures`.
+
+    Args:
+        name: Person name, used for the failure message.
+        pli_id: Piluweri ID of the person.
+
+    Returns:
+        The ``ContactData`` or ``None`` if sorting is disabled or the lookup
+        failed.
+    """
+
+    if not sort_by_deliver_method:
+        return None
+
+    try:
+        contact_data = get_searched_contact_data(pli_id)
+        contact_data_list.append(contact_data)
+        return contact_data
+    except Exception as e:
+        contact_failures.append(
+            f"❌ Für {name} war Kontaktdatensuche fehlerhaft: {e} \n❌ Die PDF wurde in den unsorted-Ordner gelegt!❌"
+        )
+        return None
+
+
+def preflight_contact_check(page_infos) -> List[str]:
+    """
+    Check the contact data of every person in the scan before anything is
+    written.
+
+    The distinct ``(name, pli_id)`` pairs of the page headers are checked
+    with ``check_contact_data``. All problems are collected at once and
+    appended to `contact_failures`.
+
+    Args:
+        page_infos: List of ``(page_index, name, pli_id)`` tuples.
+
+    Returns:
+        The problems found, empty if every person can be delivered.
+    """
+
+    people = dict.fromkeys((name, pli_id) for _, name, pli_id in page_infos)
+    problems: List[str] = []
+
+    for name, pli_id in people:
+        if pli_id is None:
+            problems.append(f"❌ Für {name} wurde keine PLI-# im Dienstplan-Feld gefunden")
+            continue
+        try:
+            check_contact_data(pli_id)
+        except Exception as e:
+            problems.append(f"❌ Für {name} war Kontaktdatensuche fehlerhaft: {e}, {pli_id}")
+
+    contact_failures.extend(problems)
+    print(f"ℹ️ Vorabprüfung: {len(people)} Personen geprüft, {len(problems)} Probleme")
+
+    return problems
+
+
+def plan_segments(page_infos) -> List[Segment]:
+    """
+    Build the segment index from the page scan results.
+
+    Consecutive pages with the same `Name:` field form one segment. For every
+    segment the contact data is resolved (if sorting by delivery method is
+    enabled); found entries are appended to `contact_data_list` and lookup
+    failures to `contact_failures`. No files are written in this phase.
+
+    Args:
+        page_infos: List of ``(page_index, name, pli_id)`` tuples in page
+            order, as returned by ``scan_page_infos``.
+
+    Returns:
+        A list of ``Segment`` records in page order.
+    """
+
+    segments: List[Segment] = []
+    segment_start_index = 0
+
+    for position, (page_index, name, pli_id) in enumerate(page_infos):
+
+        next_info = page_infos[position + 1] if position + 1 < len(page_infos) else None
+
+        if next_info and next_info[1] == name:
+            continue
+
+        segments.append(
+            Segment(
+                segment_start_index,
+                page_index,
+                name,
+                pli_id,
+                resolve_contact_data(name, pli_id),
+            )
+        )
+
+        if next_info:
+            print(
+                f"🎯 Seitenwechsel bei Seite {next_info[0]+1} → Neuer Name: {next_info[1]}"
+            )
+            segment_start_index = next_info[0]
+
+    return segments
+
+
+def write_reports(segments: List[Segment]):
+    """
+    Write one per-person PDF for every segment of the segment index.
+
+    With ``write_workers`` set to 1 the files are written one after another
+    with ``create_report``. Otherwise the segments are spread across a
+    process pool in which every worker opens the raw PDF once and reuses it
+    for all of its segments.
+
+    Args:
+        segments: Segment records as returned by ``plan_segments``.
+
+    Returns:
+        A tuple of ``(written_paths, new_reports)`` with the paths of all
+        written files and the ``Report`` objects registered in `reports`.
+    """
+
+    written_paths: List[str] = []
+    new_reports: List[Report] = []
+
+    if write_workers <= 1 or len(segments) < 2:
+        for segment in segments:
+            joined_path = create_report(
+                segment.start_page_index,
+                segment.end_page_index,
+                segment.name,
+                segment.contact_data,
+            )
+            if joined_path:
+                written_paths.append(joined_path)
+                if segment.contact_data:
+                    new_reports.append(reports[segment.contact_data.pli_id])
+        return written_paths, new_reports
+
+    jobs = []
+    job_segments: List[Segment] = []
+
+    for segment in segments:
+        joined_path = get_report_path(
+            segment.start_page_index,
+            segment.end_page_index,
+            segment.name,
+            segment.contact_data,
+        )
+
+        if reuse_unchanged_report(
+            joined_path, segment.start_page_index, segment.end_page_index
+        ):
+            written_paths.append(joined_path)
+            new_report = register_report(joined_path, segment.contact_data)
+            if new_report:
+                new_reports.append(new_report)
+            continue
+
+        jobs.append(
+            (
+                segment.start_page_index,
+                segment.end_page_index,
+                joined_path,
+                save_profile,
+                size_budget_bytes,
+                keeps_in_memory(segment.contact_data),
+            )
+        )
+        job_segments.append(segment)
+
+    print(f"ℹ️ Schreibe {len(jobs)} Berichte mit {write_workers} Prozessen...")
+    results = write_segments_parallel(
+        get_worker_source(min(write_workers, len(jobs))),
+        jobs,
+        write_workers,
+        pool=worker_pool,
+    )
+
+    for segment, (joined_path, error, bytes_written, content, output_hash) in zip(
+        job_segments, results
+    ):
+        if error:
+            print(f"❌ Fehler beim Speichern: {error}")
+            continue
+
+        written_paths.append(joined_path)
+
+        if content is not None:
+            new_reports.append(
+                register_in_memory_report(
+                    joined_path,
+                    content,
+                    segment.contact_data,
+                    segment.start_page_index,
+                    segment.end_page_index,
+                    output_hash,
+                )
+            )
+            continue
+
+        new_report = register_report(joined_path, segment.contact_data)
+        if new_report:
+            new_reports.append(new_report)
+
+        record_written_file(
+            joined_path,
+            bytes_written,
+            segment.start_page_index,
+            segment.end_page_index,
+            output_hash,
+        )
+
+    return written_paths, new_reports
+
+
+def print_segments(segments: List[Segment]):
+    """
+    Print the planned segments without writing them (used by ``dry_run``).
+
+    Args:
+        segments: Segment records as returned by ``plan_segments``.
+    """
+
+    print("ℹ️ Probelauf: Es werden keine Dateien geschrieben\n")
+
+    for segment in segments:
+        if segment.contact_data:
+            group = "print" if segment.contact_data.deliver_via_paper else "send"
+        else:
+            group = "unsorted"
+        print(
+            f"📄 Seiten {segment.start_page_index+1}-{segment.end_page_index+1} | {segment.name} | PLI-#: {segment.pli_id} | {group}"
+        )
+
+
+def split_two_phase(page_infos=None):
+    """
+    Split the raw PDF in a planning and an execution phase.
+
+    The planning phase scans every page of the global `raw_report_doc` or
+    loads the scan from the cache (see ``get_page_infos``) unless the scan of
+    the pre-flight check is passed in as ``page_infos``, detects changes
+    in the `Name:` field and resolves the contact data for every person (see
+    ``plan_segments``). The execution phase then writes a PDF for every
+    segment of the resulting index (see ``write_reports``). Both phases are
+    timed separately.
+
+    Returns:
+        None
+    """
+
+    planning_start = time.perf_counter()
+
+    global person_count
+
+    if page_infos is None:
+        page_infos = get_page_infos()
+    segments = plan_segments(page_infos)
+    person_count += len(segments)
+
+    print(
+        f"\n⏱️ Planung: {len(segments)} Berichte aus {len(page_infos)} Seiten in {time.perf_counter() - planning_start:.2f} s\n"
+    )
+
+    if dry_run:
+        print_segments(segments)
+        return
+
+    writing_start = time.perf_counter()
+
+    with metrics.stage("create_report") as stage:
+        written_paths, _ = write_reports(segments)
+        stage.items += len(written_paths)
+
+    save_output_manifest()
+
+    print(
+        f"\n⏱️ Schreiben: {len(written_paths)} Dateien in {time.perf_counter() - writing_start:.2f} s"
+    )
+    print(
+        f"ℹ️ Geschrieben: {sum(written_bytes.values()) / (1024 * 1024):.1f} MB (Speicherprofil: {save_profile})"
+    )
+    if reused_files:
+        print(f"ℹ️ {len(reused_files)} unveränderte Dateien aus dem letzten Lauf übernommen")
+
+
+def write_streamed_segment(segment: Segment):
+    """
+    Resolve the contact data of a finished segment, write its PDF and release
+    the memory held by MuPDF for the processed pages.
+
+    Args:
+        segment: The segment to write; ``contact_data`` is filled in here.
+
+    Returns:
+        None
+    """
+
+    import fitz  # PyMuPDF
+
+    segment.contact_data = resolve_contact_data(segment.name, segment.pli_id)
+
+    with metrics.stage("create_report") as stage:
+        if create_report(
+            segment.start_page_index,
+            segment.end_page_index,
+            segment.name,
+            segment.contact_data,
+        ):
+            stage.items += 1
+
+    fitz.TOOLS.store_shrink(100)  # drop cached page resources of this segment
+
+
+def scan_page_infos_lazily() -> Iterator[Tuple[int, str, Optional[str]]]:
+    """Scan the raw PDF page by page, yielding ``(page_index, name, pli_id)``."""
+
+    setup_header_zone()
+
+    for page_index in range(raw_report_doc.page_count):
+
+        with metrics.stage("get_page_person_infos") as stage:
+            name, pli_id = get_page_person_infos(page_index)
+            stage.items += 1
+
+        print_progress("Seiten verarbeitet", page_index + 1, raw_report_doc.page_count)
+
+        yield page_index, name, pli_id
+
+
+def scan_segments(page_infos=None) -> Iterator[Segment]:
+    """
+    Scan the raw PDF page by page and yield every person segment as soon as
+    the `Name:` field changes.
+
+    Only the current segment is kept, so memory stays flat regardless of the
+    number of pages. The scan cache is not used.
+
+    Args:
+        page_infos: Scan results of the pre-flight check; the segments are
+            built from them instead of scanning the pages a second time.
+
+    Yields:
+        Finished ``Segment`` records without contact data, in page order.
+    """
+
+    segment: Segment = None
+
+    if page_infos is None:
+        page_infos = scan_page_infos_lazily()
+
+    for page_index, name, pli_id in page_infos:
+
+        if segment and segment.name == name:
+            segment.end_page_index = page_index
+            segment.pli_id = pli_id
+            continue
+
+        if segment:
+            yield segment
+            print(f"🎯 Seitenwechsel bei Seite {page_index+1} → Neuer Name: {name}")
+
+        segment = Segment(page_index, page_index, name, pli_id)
+
+    if segment:
+        yield segment
+
+
+def split_streaming(page_infos=None):
+    """
+    Split the raw PDF one person at a time with bounded memory.
+
+    As soon as ``scan_segments`` finishes a segment, it is written and its
+    page objects are released before the next page is read. No scan results
+    or segment index are kept. The scan cache and the worker pools are not
+    used in this mode.
+
+    Args:
+        page_infos: Scan results of the pre-flight check, reused instead of
+            scanning again. They hold one small tuple per page, the pages
+            themselves are still released one segment at a time.
+
+    Returns:
+        None
+    """
+
+    global person_count
+
+    written_segments = 0
+
+    for segment in scan_segments(page_infos):
+        write_streamed_segment(segment)
+        written_segments += 1
+        person_count += 1
+
+    save_output_manifest()
+
+    print(f"\nℹ️ {written_segments} Berichte im Streaming-Modus geschrieben")
+
+
+def scan_resolved_segments(page_infos=None) -> Iterator[Segment]:
+    """
+    Yield the segments of ``scan_segments`` with their contact data resolved.
+
+    Runs in the scan thread of the pipeline, which is the only user of
+    `raw_report_doc` while the pipeline runs.
+
+    Args:
+        page_infos: Scan results of the pre-flight check, see
+            ``scan_segments``.
+    """
+
+    import fitz  # PyMuPDF
+
+    for segment in scan_segments(page_infos):
+        segment.contact_data = resolve_contact_data(segment.name, segment.pli_id)
+        yield segment
+        fitz.TOOLS.store_shrink(100)  # drop cached page resources of this segment
+
+
+def create_smtp_transport(sender_email: str) -> MailTransport:
+    """
+    Create an ``SmtpTransport`` from the `smtp_*` settings. The password is
+    read from the environment variable MONATSBERICHT_SMTP_PASSWORD, the
+    mails end with `smtp_signature_html` like Outlook mails with the account
+    signature.
+
+    Args:
+        sender_email: The sender address.
+    """
+
+    from MailTransport import SmtpTransport
+
+    return SmtpTransport(
+        smtp_host,
+        smtp_port,
+        sender_email,
+        username=smtp_username,
+        password=os.environ.get("MONATSBERICHT_SMTP_PASSWORD"),
+        starttls=smtp_starttls,
+        max_workers=smtp_workers,
+        signature_html=smtp_signature_html,
+    )
+
+
+def create_pipeline_transport(sender_email: str) -> MailTransport:
+    """
+    Create the mail transport selected by `mail_transport` for the send
+    stage of the pipeline. Called in the send thread, which then owns it.
+
+    Args:
+        sender_email: The sender address.
+    """
+
+    from MailTransport import create_outlook_transport
+
+    if mail_transport == "smtp":
+        return create_smtp_transport(sender_email)
+
+    return create_outlook_transport(sender_email)
+
+
+async def run_split_pipeline(sender_email: str = None, page_infos=None):
+    """
+    Scan, write and send the reports as overlapping stages (see
+    ``run_pipeline``).
+
+    The scan runs in one thread that owns `raw_report_doc`, the reports are
+    written by a process pool of `write_workers` processes and sent through
+    a transport owned by the send threads. Segments and written reports are
+    passed on through queues of `pipeline_queue_size` entries.
+
+    Args:
+        sender_email: Sender address; without it nothing is sent.
+        page_infos: Scan results of the pre-flight check; the scan stage
+            then only groups them into segments.
+
+    Returns:
+        The ``PipelineResult`` of the run.
+    """
+
+    import asyncio
+
+    from Pipeline import run_pipeline
+
+    loop = asyncio.get_running_loop()
+    subject = f"Monatsbericht {month_name} {year}"
+    send_threads = 1 if mail_transport == "outlook" else max(1, smtp_workers)
+
+    async def write(segment: Segment) -> Optional[Report]:
+        joined_path = get_report_path(
+            segment.start_page_index,
+            segment.end_page_index,
+            segment.name,
+            segment.contact_data,
+        )
+
+        # Verifying an earlier file reads it, which must not block the loop
+        if await loop.run_in_executor(
+            None,
+            reuse_unchanged_report,
+            joined_path,
+            segment.start_page_index,
+            segment.end_page_index,
+        ):
+            new_report = register_report(joined_path, segment.contact_data)
+        else:
+            joined_path, error, bytes_written, content, output_hash = await loop.run_in_executor(
+                write_pool,
+                write_function,
+                (
+                    segment.start_page_index,
+                    segment.end_page_index,
+                    joined_path,
+                    save_profile,
+                    size_budget_bytes,
+                    keeps_in_memory(segment.contact_data),
+                ),
+            )
+            if error:
+                print(f"❌ Fehler beim Speichern: {error}")
+                return None
+
+            if content is not None:
+                new_report = register_in_memory_report(
+                    joined_path,
+                    content,
+                    segment.contact_data,
+                    segment.start_page_index,
+                    segment.end_page_index,
+                    output_hash,
+                )
+            else:
+                record_written_file(
+                    joined_path,
+                    bytes_written,
+                    segment.start_page_index,
+                    segment.end_page_index,
+                    output_hash,
+                )
+                new_report = register_report(joined_path, segment.contact_data)
+
+        if new_report and is_email_report(new_report):
+            return new_report
+        return None
+
+    async def send(report: Report):
+        await loop.run_in_executor(
+            send_executor,
+            transport.send,
+            report,
+            report.contact_data.email,
+            subject,
+            build_mail_body(report),
+        )
+        report.content = None  # sent, the archive copy is written separately
+        print(
+            f"✅ Bericht von {report.contact_data.first_name} {report.contact_data.last_name} erfolgreich zu {report.contact_data.email} gesendet"
+        )
+
+    if worker_pool:
+        # The shared pool has no per-file initializer, every job names its source
+        write_function = functools.partial(
+            write_segment, source=get_worker_source(write_workers)
+        )
+        write_pool_context = contextlib.nullcontext(worker_pool)
+    else:
+        write_function = write_segment
+        write_pool_context = create_writer_pool(get_worker_source(write_workers), write_workers)
+
+    with ThreadPoolExecutor(max_workers=1) as scan_executor, ThreadPoolExecutor(
+        max_workers=send_threads
+    ) as send_executor, write_pool_context as write_pool:
+
+        transport: MailTransport = None
+        if sender_email:
+            # Fails before anything is written if the sender is not usable
+            transport = await loop.run_in_executor(
+                send_executor, create_pipeline_transport, sender_email
+            )
+            await loop.run_in_executor(send_executor, transport.open)
+            print("✅ Absenderkonto geladen, Berichte werden während des Aufteilens gesendet")
+
+        try:
+            return await run_pipeline(
+                scan_resolved_segments(page_infos),
+                scan_executor,
+                write,
+                send if transport else None,
+                writers=write_workers,
+                senders=send_threads,
+                queue_size=pipeline_queue_size,
+            )
+        finally:
+            if transport:
+                await loop.run_in_executor(send_executor, transport.close)
+
+
+def split_pipelined(
+    sender_email: str = None, page_infos=None
+) -> List[Tuple[Report, Optional[Exception]]]:
+    """
+    Split the raw PDF and, if ``sender_email`` is given, send the reports in
+    one overlapped pipeline (see ``run_split_pipeline``).
+
+    Sending starts with the first finished report, so reports of people with
+    valid contact data are sent even if later contact entries fail; those
+    failures are still reported afterwards. The scan cache and the boundary
+    search are not used in this mode.
+
+    With ``page_infos`` from the pre-flight check the pages are not scanned
+    again. The scan is then finished before the first report is written, so
+    only writing and sending overlap.
+
+    Args:
+        sender_email: Sender address or ``None`` to only scan and write.
+        page_infos: Scan results of the pre-flight check.
+
+    Returns:
+        A list of ``(report, error)`` tuples of the sent mails.
+    """
+
+    import asyncio
+
+    global person_count
+
+    if use_output_manifest:
+        # Load both once here instead of inside the event loop
+        get_raw_report_hash()
+        get_output_manifest()
+
+    with metrics.stage("pipeline"):
+        result = asyncio.run(run_split_pipeline(sender_email, page_infos))
+    person_count += result.stages["scan"].items
+
+    metrics.record(
+        "create_report", result.stages["write"].busy_seconds, result.stages["write"].items
+    )
+    if sender_email:
+        metrics.record(
+            "send_report_to",
+            result.stages["send"].busy_seconds,
+            sum(1 for _, error in result.sent if not error),
+        )
+
+    save_output_manifest()
+
+    for _, segment, error in result.errors:
+        print(f"❌ Fehler beim Schreiben von {segment.name}: {error}")
+
+    print(
+        f"\n⏱️ Pipeline: Scan {result.stages['scan'].busy_seconds:.2f} s | "
+        f"Schreiben {result.stages['write'].busy_seconds:.2f} s | "
+        f"Senden {result.stages['send'].busy_seconds:.2f} s | "
+        f"Gesamt {result.wall_seconds:.2f} s (nacheinander {result.serial_seconds:.2f} s)"
+    )
+
+    if sender_email:
+        print_send_results(result.sent, result.wall_seconds)
+
+    return result.sent
+
+
+def iterate_pages(sender_email: str = None):
+    """
+    Split the raw PDF into per-person PDFs and print a summary.
+
+    With ``contact_preflight`` the page headers are scanned first and the
+    contact data of every person is checked (see
+    ``preflight_contact_check``); on any problem nothing is written and the
+    problems end up in `contact_failures`. All modes reuse this scan instead
+    of reading the pages again. In pipeline mode the scan therefore no longer
+    overlaps with writing, and streaming mode keeps one small tuple per page;
+    ``--no-preflight`` restores both.
+
+    Depending on ``pipeline_mode`` and ``streaming_mode`` the PDF is split
+    with ``split_pipelined`` (scan, write and send overlapped),
+    ``split_streaming`` (one person at a time, bounded memory) or with
+    ``split_two_phase`` (segment index first, then all reports). Afterwards
+    the found contact entries, the lookup failures and the peak memory usage
+    are printed.
+
+    Args:
+        sender_email: Sender address for ``pipeline_mode``; the reports are
+            sent while the PDF is still being split.
+
+    Returns:
+        The ``(report, error)`` tuples of the mails sent by the pipeline,
+        empty in the other modes.
+    """
+
+    send_results = []
+    page_infos = None
+
+    if contact_preflight and sort_by_deliver_method and not dry_run:
+        with metrics.stage("preflight"):
+            page_infos = get_page_infos()
+            problems = preflight_contact_check(page_infos)
+
+        if problems:
+            print(
+                f"\n❌❌❌ Vorabprüfung: {len(problems)} Kontaktdaten sind fehlerhaft, es wurden KEINE PDFs geschrieben ❌❌❌\n"
+            )
+            for problem in problems:
+                print(f" ❌ Fehler: {problem}")
+            return send_results
+
+        print("✅ Vorabprüfung: Die Kontaktdaten aller Personen sind vorhanden\n")
+
+    if dry_run:
+        split_two_phase()
+    elif pipeline_mode:
+        send_results = split_pipelined(sender_email, page_infos)
+    elif streaming_mode:
+        split_streaming(page_infos)
+    else:
+        split_two_phase(page_infos)
+
+    print("\n\n✅✅✅ PDFs wurden erstellt ✅✅✅\n\n")
+
+    if contact_data_list:
+        print(
+            f"\n\n✅✅✅ {len(contact_data_list)} Kontaktdaten wurden gefunden: ✅✅✅\n\n"
+        )
+    for current_contact_data in contact_data_list:
+
+        print(f"✅ {current_contact_data.__dict__}")
+
+    if contact_failures:
+        print(
+            f"\n❌❌❌ {len(contact_failures)} Kontaktdaten sind fehlerhaft: ❌❌❌\n\n"
+        )
+        for current_fail in contact_failures:
+            print(f" ❌ Fehler: {current_fail}")
+
+    print(f"\nℹ️ Maximaler Speicherverbrauch: {format_bytes(get_peak_rss_bytes())}")
+
+    if shared_source:
+        print(
+            f"ℹ️ Gemeinsamer Speicher: PDF 1× von der Festplatte gelesen statt von {shared_source.worker_opens} Worker-Prozessen, "
+            f"bis zu {format_bytes(shared_source.saved_read_bytes)} Dateizugriffe eingespart"
+        )
+        print(
+            f"ℹ️ Dafür hält jeder Prozess eine Kopie der PDF im Speicher: "
+            f"{shared_source.worker_opens + shared_source.local_opens} × {format_bytes(shared_source.size)} = "
+            f"{format_bytes(shared_source.copied_bytes)}"
+        )
+
+    return send_results
+
+
+def get_answer_yes_no():
+    """
+    Prompt the user for a yes/no answer and return a boolean.
+
+    The prompt accepts 'y' or 'n' (case-insensitive). It will repeat until a
+    valid answer is entered.
+
+    Returns:
+        True if the user entered 'y', False if the user entered 'n'.
+    """
+
+    while True:
+
+        print("\n (Y -> Ja) | (N -> Nein)")
+        answer: str = input("\nEingabe:")
+
+        if str.lower(answer) == "y":
+            return True
+        elif str.lower(answer) == "n":
+            return False
+        else:
+            print("\n ❌ Ungültige Eingabe. Bitte erneut Eingeben")
+
+
+def print_banner():
+    """
+    Print an ASCII banner and version/introduction text to the console.
+
+    The banner includes the module version and a short note about supported
+    features.
+    """
+
+    print(
+        "\033[32m"
+        + """
+ ____  ____  _____   ____        _ _ _   _
+|  _ \\|  _ \\|  ___| / ___| _ __ | (_) |_| |_ ___ _ __
+| |_) | | | | |_    \\___ \\| '_ \\| | | __| __/ _ \\ '__|
+|  __/| |_| |  _|    ___) | |_) | | | |_| ||  __/ |
+|_|   |____/|_|     |____/| .__/|_|_|\\__|\\__\\___|_|
+                          |_|
+                  _             __  __
+                 | |__  _   _  |  \\/  |_   _
+                 | '_ \\| | | | | |\\/| | | | |
+                 | |_) | |_| | | |  | | |_| |
+                 |_.__/ \\__, | |_|  |_|\\__,_|
+                        |___/
+"""
+    )
+
+    print()
+    print("v2.2")
+    print("12.05.2026")
+    print("Diese Version unterstützt das Teilen und Senden der Monatsberichte")
+    print("Papierberichte können zu einem Druckauftrag zusammengefasst werden")
+    print("\033[0m")
+
+
+def send_emails(sender_email: str = None, confirm: bool = True):
+    """
+    Send emails for all reports that are configured to be delivered by email.
+
+    The function lists the recipients, prompts the user for the sender
+    address and confirmation, creates the mail transport selected by
+    `mail_transport` (Outlook or SMTP) and sends the reports of all
+    recipients who prefer email delivery as one batch (see ``send_reports``).
+
+    Args:
+        sender_email: Sender address. If given, it is not prompted for and an
+            invalid Outlook address raises instead of asking again.
+        confirm: Ask for a final confirmation before sending.
+
+    Returns:
+        A list of ``(report, error)`` tuples of the sent mails, empty if the
+        user declined.
     """
 
+    from MailTransport import OutlookTransport
+
     global accounts
     global outlook
 
     print_people_getting_emailed()
 
-    outlook = win32.Dispatch("outlook.application")
-    accounts = outlook.Session.Accounts
+    interactive_sender = sender_email is None
+
+    if mail_transport == "smtp":
+        if interactive_sender:
+            sender_email = input("\nGib nun die Absender-Email an:\n")
+        transport = create_smtp_transport(sender_email)
+    else:
+        import win32com.client as win32
+
+        outlook = win32.Dispatch("outlook.application")
+        accounts = outlook.Session.Accounts
+
+        if interactive_sender:
+            sender_email = input("\nGib nun die Absender-Email an:\n")
+            sender_email = loop_check_sender(sender_email)
+        else:
+            check_sender(sender_email)
+        transport = OutlookTransport(outlook, accounts, sender_email)
 
-    sender_email = input("\nGib nun die Absender-Email an:\n")
-    loop_check_sender(sender_email)
+        # Resolve the account and read the signature once for all mails
+        transport.open()
+        print("✅ Absenderkonto und Signatur geladen")
 
-    print(f"\n❗Willst du wirklich JETZT die Berichte senden?")
-    print(f"❗Diese Aktion kann nicht revidiert werden❗\n")
+    decision: bool = True
+    if confirm:
+        print(f"\n❗Willst du wirklich JETZT die Berichte senden?")
+        print(f"❗Diese Aktion kann nicht revidiert werden❗\n")
 
-    decision: bool = get_answer_yes_no()
+        decision = get_answer_yes_no()
 
+    results = []
     if decision:
         print("ℹ️ Starting sending Emails")
-        for report in reports.values():
-            if not report.contact_data.deliver_via_paper:
-                send_report_to(report, report.contact_data.email, sender_email)
+        send_queue: List[Report] = [
+            report for report in reports.values() if is_email_report(report)
+        ]
+        results = send_reports(transport, send_queue)
 
     print("\n\n✔️ Die Emails wurden gesendet ✔️")
     print("⚠️ Schaue in deinem Postfach nach, ob die Emails wirklich rausgegangen sind!")
 
+    return results
+
+
+def is_email_report(report: Report) -> bool:
+    """Return True if ``report`` is delivered by email."""
+
+    return not report.contact_data.deliver_via_paper
+
 
 def print_people_getting_emailed():
     """
@@ -615,39 +2186,18 @@ def print_people_getting_emailed():
         )
 
 
-def send_report_to(report: Report, recipient_email: str, sender_email: str):
+def build_mail_body(report: Report) -> str:
     """
-    Compose and send a single report as an Outlook email message.
+    Build the HTML body of the report email (without signature).
 
     Args:
         report: A `Report` object holding the document and contact info.
-        recipient_email: The recipient email address.
-        sender_email: The sender email address configured in Outlook.
 
-    Raises:
-        Exception: Re-raises any exception thrown while composing or sending
-            the email after printing a short error notice.
+    Returns:
+        The HTML body as string.
     """
 
-    try:
-
-        mail = outlook.CreateItem(0)
-
-        set_sender(mail, sender_email)
-
-        mail.To = recipient_email
-
-        print("Monat:", month_name)
-        print("Jahr:", year)
-        mail.Subject = f"Monatsbericht {month_name} {year}"
-
-        mail.Display(False)
-        # time.sleep(0.05)
-        # Generate a temporary signature by creating a new mail (this preserves Outlook’s default signature)
-        # The default signature is automatically included when accessing mail.HTMLBody before setting it manually.
-        signature = mail.HTMLBody  # This retrieves the default Outlook signature
-
-        custom_body = f"""
+    return f"""
         <p>Hallo {report.contact_data.first_name} {report.contact_data.last_name},</p>
         <p>Anbei findest Du Deinen aktuellen Monatsbericht.<br>
         Diese Nachricht wurde automatisch erstellt. Falls Schwierigkeiten auftreten, wende Dich bitte an mich.<br>
@@ -659,18 +2209,137 @@ def send_report_to(report: Report, recipient_email: str, sender_email: str):
         <br>
         """
 
-        # Append your custom message *before* the signature
-        mail.HTMLBody = custom_body + signature
 
-        mail.Attachments.Add(report.document)
-        mail.Send()
+def send_reports(transport: MailTransport, send_queue: List[Report]):
+    """
+    Send the given reports as one batch through ``transport``.
 
-        print(
-            f"✅ Bericht von {report.contact_data.first_name} {report.contact_data.last_name} erfolgreich zu {recipient_email} gesendet"
+    Every report is sent to the email address of its contact data. Failed
+    mails do not stop the batch; they are listed after all mails were sent.
+
+    Args:
+        transport: The mail backend (see ``MailTransport``).
+        send_queue: Reports to send.
+
+    Returns:
+        A list of ``(report, error)`` tuples, ``error`` is ``None`` on success.
+    """
+
+    from MailTransport import dispatch_reports
+
+    subject = f"Monatsbericht {month_name} {year}"
+    print("Monat:", month_name)
+    print("Jahr:", year)
+
+    jobs = [
+        (report, report.contact_data.email, subject, build_mail_body(report))
+        for report in send_queue
+    ]
+
+    sending_start = time.perf_counter()
+    with metrics.stage("send_report_to") as stage:
+        results = dispatch_reports(transport, jobs)
+        stage.items += sum(1 for _, error in results if not error)
+
+    for report, error in results:
+        if not error:
+            report.content = None  # sent, the archive copy is written separately
+            print(
+                f"✅ Bericht von {report.contact_data.first_name} {report.contact_data.last_name} erfolgreich zu {report.contact_data.email} gesendet"
+            )
+
+    print_send_results(results, time.perf_counter() - sending_start)
+
+    return results
+
+
+def print_send_results(
+    results: List[Tuple[Report, Optional[Exception]]], seconds: float
+):
+    """
+    Print the failed mails and the totals of a batch.
+
+    Args:
+        results: ``(report, error)`` tuples as returned by ``send_reports``.
+        seconds: Duration of the batch.
+    """
+
+    global send_failures
+
+    failures = 0
+    for report, error in results:
+        if error:
+            failures += 1
+            print(
+                f"❌ Error sending Email an {report.contact_data.email} ❌ \n {error}"
+            )
+
+    print(
+        f"\n⏱️ Senden: {len(results) - failures} von {len(results)} Emails in {seconds:.2f} s"
+    )
+    if failures:
+        print(f"❌❌❌ {failures} Emails konnten nicht gesendet werden ❌❌❌")
+
+    send_failures += failures
+
+
+def bundle_print_reports(send_to_printer: bool = False) -> str:
+    """
+    Combine all paper-delivery reports into one print job.
+
+    The reports are concatenated in page order into
+    ``Druckauftrag_<Monat>_<Jahr>.pdf`` in `destination_folder_path`, padded
+    for duplex printing (``print_duplex``) and optionally preceded by address
+    cover pages (``print_cover_pages``). With ``send_to_printer`` the bundle
+    is sent to the configured printer backend as a single spool job.
+
+    Args:
+        send_to_printer: Print the bundle after creating it.
+
+    Returns:
+        The path of the bundle or ``None`` if there are no paper reports.
+    """
+
+    from PrintBundle import build_print_bundle, create_printer
+
+    # `reports` is in write completion order with parallel writers
+    paper_reports = [
+        (report.document, report.contact_data)
+        for report in sorted(
+            reports.values(), key=lambda report: get_report_start_page(report.document)
         )
-    except Exception as e:
-        print(f"❌ Error sending Email ❌ \n {e}")
-        raise e
+        if report.contact_data.deliver_via_paper
+    ]
+
+    if not paper_reports:
+        print("ℹ️ Es gibt keine Papierberichte")
+        return None
+
+    bundle_path = os.path.join(
+        destination_folder_path, f"Druckauftrag_{month_name}_{year}.pdf"
+    )
+
+    with metrics.stage("print_bundle") as stage:
+        page_count = build_print_bundle(
+            paper_reports,
+            bundle_path,
+            duplex=print_duplex,
+            cover_pages=print_cover_pages,
+            sender_line=print_sender_line,
+        )
+        stage.items += len(paper_reports)
+
+    print(
+        f"🖨️ Druckauftrag erstellt: {bundle_path} ({len(paper_reports)} Berichte, {page_count} Seiten)"
+    )
+
+    if send_to_printer:
+        create_printer(printer_backend, printer_name).print_file(
+            bundle_path, duplex=print_duplex
+        )
+        print(f"✅ Druckauftrag an den Drucker gesendet ({printer_backend})")
+
+    return bundle_path
 
 
 def loop_check_sender(sender_email):
@@ -682,13 +2351,13 @@ def loop_check_sender(sender_email):
         sender_email: Initial sender email to validate.
 
     Returns:
-        None
+        The validated sender email.
     """
 
     while True:
         try:
             check_sender(sender_email)
-            break
+            return sender_email
         except Exception as e:
             print(e)
             print("⚠️ Bitte versuche es erneut\n")
@@ -716,28 +2385,6 @@ def check_sender(sender_email: str):
     )
 
 
-def set_sender(mail, sender_email: str):
-    """
-    Set the Outlook ``SendUsingAccount`` on the provided mail item.
-
-    Args:
-        mail: An Outlook mail item object returned by ``outlook.CreateItem``.
-        sender_email: Email address to set as the sending account.
-
-    Raises:
-        Exception: If no matching Outlook account is found for the provided
-            sender email.
-    """
-
-    for account in accounts:
-        if account.SmtpAddress.lower() == sender_email.lower():
-            mail._oleobj_.Invoke(
-                *(64209, 0, 8, 0, account)
-            )  # This sets SendUsingAccount
-            return
-
-    raise Exception("\n❌ Problem Beim Setzen der Sender Email ❌")
-
 class ContactDataError(Exception):
     """Control-flow exception used only to skip the normal error handler."""
 
@@ -753,16 +2400,106 @@ class ContactDataError(Exception):
 ########################################
 
 
-def main():
+def parse_arguments(argv=None) -> argparse.Namespace:
+    """
+    Parse the command line arguments.
 
-    global logger
-    logger = setup_logging("log.txt")  # prints automatically go to console + file
+    Without ``--input`` the program runs interactively as before; all other
+    options only apply to the non-interactive mode. A raw report dropped onto
+    the program arrives as positional argument and is used as the first
+    answer of the interactive mode.
+
+    Args:
+        argv: Argument list, defaults to ``sys.argv[1:]``.
+
+    Returns:
+        The parsed arguments.
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Teilt einen Timoto-Monatsbericht in Berichte pro Person auf und versendet sie optional.",
+        epilog=(
+            f"Exit-Codes: {EXIT_OK} = OK, {EXIT_FAILURE} = unerwarteter Fehler, "
+            f"{EXIT_USAGE_ERROR} = ungültige Argumente, {EXIT_INPUT_ERROR} = Eingabedateien fehlerhaft, "
+            f"{EXIT_CONTACT_DATA_ERROR} = Kontaktdaten fehlerhaft, {EXIT_SEND_ERROR} = Emails nicht gesendet, "
+            f"{EXIT_PRINT_ERROR} = Druckauftrag fehlgeschlagen"
+        ),
+    )
+    parser.add_argument("raw_report", nargs="?", help="Roher Monatsbericht für den interaktiven Modus (z.B. per Drag & Drop auf die Programmdatei); die übrigen Angaben werden abgefragt")
+    parser.add_argument("-i", "--input", nargs="+", help="Rohe Monatsberichte (PDF-Pfade oder Muster wie exports/*.pdf); aktiviert den nicht-interaktiven Modus")
+    parser.add_argument("-o", "--output", help="Zielordner für die Berichte")
+    parser.add_argument("-c", "--contacts", help="Kontaktdaten (CSV)")
+    parser.add_argument("--month", type=int, choices=range(1, 13), metavar="1-12", help="Berichtsmonat (Standard: Vormonat)")
+    parser.add_argument("--year", type=int, help="Berichtsjahr (Standard: Jahr des Vormonats)")
+    parser.add_argument("--send", action=argparse.BooleanOptionalAction, default=False, help="Berichte per Email senden")
+    parser.add_argument("--sender", help="Absender-Email (erforderlich mit --send)")
+    parser.add_argument("--transport", choices=("outlook", "smtp"), default=mail_transport, help="Email-Versandweg")
+    parser.add_argument("--smtp-host", default=smtp_host, help="SMTP-Server für --transport smtp")
+    parser.add_argument("--smtp-port", type=int, default=smtp_port, help="Port des SMTP-Servers")
+    parser.add_argument("--smtp-user", default=smtp_username, help="SMTP-Benutzername (Passwort aus MONATSBERICHT_SMTP_PASSWORD); ohne Namen keine Anmeldung")
+    parser.add_argument("--smtp-starttls", action=argparse.BooleanOptionalAction, default=smtp_starttls, help="SMTP-Verbindung mit STARTTLS verschlüsseln")
+    parser.add_argument("--smtp-signature", help="Signatur (HTML-Datei, z.B. aus %%APPDATA%%\\Microsoft\\Signatures) für SMTP-Emails; Outlook fügt die Signatur selbst an")
+    parser.add_argument("--smtp-workers", type=int, default=smtp_workers, help="Parallele SMTP-Verbindungen")
+    parser.add_argument("--print-bundle", action="store_true", help="Papierberichte zu einem Druckauftrag zusammenfassen")
+    parser.add_argument("--printer", choices=("none", "windows", "lp", "file"), default="none", help="Druckauftrag an diesen Drucker senden")
+    parser.add_argument("--printer-name", help="Druckername (bzw. Zielordner für --printer file)")
+    parser.add_argument("--duplex", action=argparse.BooleanOptionalAction, default=print_duplex, help="Für Duplexdruck auf gerade Seitenzahl auffüllen")
+    parser.add_argument("--cover-pages", action="store_true", help="Adress-Deckblatt für Fensterumschläge")
+    parser.add_argument("--no-preflight", action="store_true", help="Kontaktdaten nicht vorab prüfen (fehlerhafte Personen landen in unsorted); mit --pipeline überlappt dann auch der Scan")
+    parser.add_argument("--dry-run", action="store_true", help="Nur scannen und planen, nichts schreiben oder senden")
+    parser.add_argument("--streaming", action="store_true", help="Speichersparender Streaming-Modus")
+    parser.add_argument("--pipeline", action="store_true", help="Scannen, Schreiben und Senden überlappen (Senden beginnt vor Ende des Aufteilens)")
+    parser.add_argument("--pipeline-queue", type=int, default=pipeline_queue_size, help="Maximale Anzahl wartender Berichte pro Pipeline-Stufe")
+    parser.add_argument("--scan-workers", type=int, default=scan_workers, help="Prozesse für den Seitenscan")
+    parser.add_argument("--write-workers", type=int, default=write_workers, help="Prozesse für das Schreiben")
+    parser.add_argument("--save-profile", choices=SAVE_PROFILES, default=save_profile, help="Speicherprofil der Berichte")
+    parser.add_argument("--size-budget-kb", type=int, default=size_budget_bytes // 1024, help="Größenbudget pro Bericht für --save-profile budget")
+    parser.add_argument("--in-memory", action="store_true", help="Email-Berichte im Speicher erzeugen und direkt anhängen")
+    parser.add_argument("--archive", action=argparse.BooleanOptionalAction, default=archive_reports, help="Im Speicher erzeugte Berichte im Hintergrund zusätzlich als Datei ablegen")
+    parser.add_argument("--shared-source", action="store_true", help="Roh-PDF nur einmal lesen und den Worker-Prozessen über gemeinsamen Speicher bereitstellen (jeder Prozess hält eine Kopie im Arbeitsspeicher)")
+    parser.add_argument("--boundary-search", action="store_true", help="Nur Seiten an den Personengrenzen lesen")
+    parser.add_argument("--verify-boundaries", action="store_true", help="Grenzsuche mit vollständigem Scan prüfen")
+    parser.add_argument("--rewrite-all", action="store_true", help="Alle Berichte neu schreiben, auch unveränderte")
+    parser.add_argument("--no-scan-cache", action="store_true", help="Scan-Cache nicht verwenden")
+    parser.add_argument("--no-contact-cache", action="store_true", help="Kontaktdaten-Cache nicht verwenden")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Ausführliche Ausgabe (pro Seite)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Nur Warnungen und Fehler auf der Konsole")
+    parser.add_argument("--run-report", default=run_report_path, help="Pfad des Laufberichts (JSON)")
+    parser.add_argument("--history", action=argparse.BooleanOptionalAction, default=True, help="Lauf in der Laufhistorie speichern")
+    parser.add_argument("--history-db", default=run_history_path, help="Pfad der Laufhistorie (SQLite)")
+    parser.add_argument("--history-report", type=int, nargs="?", const=12, metavar="N", help="Trends der letzten N Läufe (Standard: 12) anzeigen und beenden")
+    parser.add_argument("--profile", default=profile_path, help="Lauf mit cProfile profilieren und Statistik hier speichern")
+    parser.add_argument("--trace-memory", action="store_true", help="Python-Speicher pro Schritt mit tracemalloc messen (verlangsamt den Lauf)")
+
+    args = parser.parse_args(argv)
+
+    if args.input and args.raw_report:
+        parser.error("Roher Monatsbericht ohne Option nur im interaktiven Modus, sonst mit --input angeben")
+    if args.input and not args.output:
+        parser.error("--output ist mit --input erforderlich")
+    if args.send and not args.sender:
+        parser.error("--sender ist mit --send erforderlich")
+
+    return args
+
+
+def run_interactive(dropped_raw_report_path: str = None):
+    """
+    Run the interactive console workflow driven by ``input()`` prompts.
+
+    Args:
+        dropped_raw_report_path: Raw report passed on the command line (see
+            ``input_paths``).
+
+    Returns:
+        None
+    """
 
     setup_date_month_year()
 
     print_banner()
 
-    input_paths()
+    input_paths(dropped_raw_report_path)
 
     try:
         iterate_pages()
@@ -782,14 +2519,483 @@ def main():
         decision: bool = get_answer_yes_no()
         if decision:
             send_emails()
+
+        if any(report.contact_data.deliver_via_paper for report in reports.values()):
+            print(
+                f"\n🖨️ Willst du alle Papierberichte zu EINEM DRUCKAUFTRAG zusammenfassen?"
+            )
+            if get_answer_yes_no():
+                print(f"\n🖨️ Soll der Druckauftrag direkt an den Drucker gesendet werden?")
+                bundle_print_reports(send_to_printer=get_answer_yes_no())
     except ContactDataError:
         pass
     except Exception as e:
         print(f"❌ FEHLER BEIM ITERIEREN: {e}")
         print("❌❌❌ PDFs wurden nicht oder fehlerhaft erstellt ❌❌❌")
 
+    finish_run()
+
     input("\n\n\n\nZum BEENDEN des Programms beliebige Taste drücken...")
 
 
+def run_batch(args: argparse.Namespace) -> int:
+    """
+    Run the whole workflow without any prompts, e.g. from a scheduled task.
+
+    Args:
+        args: Parsed command line arguments (see ``parse_arguments``).
+
+    Returns:
+        One of the ``EXIT_*`` status codes.
+    """
+
+    global destination_folder_path
+    global contact_data_csv_path
+    global raw_report_file_path
+    global mail_transport
+    global smtp_host
+    global smtp_port
+    global smtp_username
+    global smtp_starttls
+    global smtp_workers
+    global smtp_signature_html
+    global dry_run
+    global contact_preflight
+    global streaming_mode
+    global pipeline_mode
+    global pipeline_queue_size
+    global use_shared_source
+    global in_memory_reports
+    global archive_reports
+    global scan_workers
+    global write_workers
+    global use_scan_cache
+    global use_contact_cache
+    global save_profile
+    global size_budget_bytes
+    global use_output_manifest
+    global boundary_search
+    global verify_boundaries
+    global print_duplex
+    global print_cover_pages
+    global printer_backend
+    global printer_name
+
+    mail_transport = args.transport
+    smtp_host = args.smtp_host
+    smtp_port = args.smtp_port
+    smtp_username = args.smtp_user
+    smtp_starttls = args.smtp_starttls
+    smtp_workers = max(1, args.smtp_workers)
+    if args.smtp_signature:
+        from MailTransport import read_signature_html
+
+        try:
+            smtp_signature_html = read_signature_html(clean_path(args.smtp_signature))
+        except OSError as e:
+            print(f"❌ Signatur konnte nicht gelesen werden: {e}")
+            return EXIT_INPUT_ERROR
+    elif args.send and mail_transport == "smtp":
+        print("⚠️ SMTP-Emails werden ohne Signatur gesendet (siehe --smtp-signature)")
+    dry_run = args.dry_run
+    contact_preflight = not args.no_preflight
+    streaming_mode = args.streaming
+    pipeline_mode = args.pipeline
+    pipeline_queue_size = max(1, args.pipeline_queue)
+    use_shared_source = args.shared_source
+    in_memory_reports = args.in_memory
+    archive_reports = args.archive
+    scan_workers = max(1, args.scan_workers)
+    write_workers = max(1, args.write_workers)
+    use_scan_cache = not args.no_scan_cache
+    use_contact_cache = not args.no_contact_cache
+    save_profile = args.save_profile
+    size_budget_bytes = args.size_budget_kb * 1024
+    use_output_manifest = not args.rewrite_all
+    boundary_search = args.boundary_search
+    verify_boundaries = args.verify_boundaries
+    print_duplex = args.duplex
+    print_cover_pages = args.cover_pages
+    if args.printer != "none":
+        printer_backend = args.printer
+    printer_name = args.printer_name
+
+    setup_date_month_year(args.month, args.year)
+    print(f"ℹ️ Berichtsmonat: {month_name} {year}")
+
+    raw_report_file_paths = expand_input_paths(args.input)
+    if not raw_report_file_paths:
+        print(f"❌ Keine Roh-PDF gefunden: {' '.join(args.input)}")
+        return EXIT_INPUT_ERROR
+
+    destination_folder_path = clean_path(args.output)
+    contact_data_csv_path = clean_path(args.contacts or "")
+
+    with metrics.stage("input_paths"):
+        load_contacts()
+
+    if len(raw_report_file_paths) > 1:
+        return run_multi_file_batch(raw_report_file_paths, destination_folder_path, args)
+
+    raw_report_file_path = raw_report_file_paths[0]
+    return process_raw_report(args)
+
+
+def expand_input_paths(patterns: List[str]) -> List[str]:
+    """
+    Expand the ``--input`` arguments into a list of raw report paths.
+
+    Glob patterns (e.g. ``exports/*.pdf``) are expanded here, since the
+    Windows shell does not. Duplicates are dropped, the order is kept.
+
+    Args:
+        patterns: File paths or glob patterns.
+
+    Returns:
+        The raw report paths; paths without glob characters are kept even
+        if they do not exist, so opening them reports the error.
+    """
+
+    file_paths: List[str] = []
+
+    for pattern in patterns:
+        pattern = clean_path(pattern)
+        if glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern))
+        else:
+            matches = [pattern]
+
+        for file_path in matches:
+            if file_path not in file_paths:
+                file_paths.append(file_path)
+
+    return file_paths
+
+
+def reset_report_state():
+    """
+    Reset the per-file globals before the next raw report of a multi-file
+    batch. The contact index, written file sizes and reused files are kept.
+    """
+
+    global raw_report_doc
+    global raw_report_hash
+
+    if shared_source:
+        close_shared_source()  # closes raw_report_doc as well
+    elif globals().get("raw_report_doc") is not None:
+        raw_report_doc.close()
+    raw_report_doc = None
+    raw_report_hash = None
+
+    reports.clear()
+    contact_data_list.clear()
+    contact_failures.clear()
+
+
+def run_multi_file_batch(
+    file_paths: List[str], output_folder_path: str, args: argparse.Namespace
+) -> int:
+    """
+    Process several raw reports with one contact index and one worker pool.
+
+    Every raw report is written into its own subfolder of
+    ``output_folder_path`` named after the file, and is printed and sent on
+    its own (see ``process_raw_report``); its in-memory reports are archived
+    before the next file starts. A failing file does not stop the
+    batch. A combined summary is printed at the end.
+
+    Args:
+        file_paths: Paths of the raw reports.
+        output_folder_path: Destination folder of the batch.
+        args: Parsed command line arguments (see ``parse_arguments``).
+
+    Returns:
+        ``EXIT_OK`` if all files succeeded, otherwise the exit code of the
+        first failing file.
+    """
+
+    global raw_report_file_path
+    global destination_folder_path
+    global worker_pool
+
+    print(f"ℹ️ Stapelmodus: {len(file_paths)} Roh-PDFs")
+
+    if max(scan_workers, write_workers) > 1:
+        worker_pool = ProcessPoolExecutor(max_workers=max(scan_workers, write_workers))
+
+    exit_code = EXIT_OK
+
+    try:
+        for file_path in file_paths:
+            reset_report_state()
+            raw_report_file_path = file_path
+            destination_folder_path = os.path.join(
+                output_folder_path, os.path.splitext(os.path.basename(file_path))[0]
+            )
+            written_before = len(written_bytes)
+            reused_before = len(reused_files)
+
+            print(f"\n\n📂 {file_path} → {destination_folder_path}\n")
+            file_exit_code = process_raw_report(args)
+            # Record the archived reports while the manifest, destination
+            # folder and source hash still belong to this file
+            finish_archiving()
+
+            batch_results.append(
+                {
+                    "file": file_path,
+                    "exit_code": file_exit_code,
+                    "pages": raw_report_doc.page_count if raw_report_doc is not None else None,
+                    "reports": len(reports),
+                    "files_written": len(written_bytes) - written_before,
+                    "files_reused": len(reused_files) - reused_before,
+                    "contact_failures": list(contact_failures),
+                }
+            )
+
+            if exit_code == EXIT_OK:
+                exit_code = file_exit_code
+    finally:
+        if worker_pool:
+            worker_pool.shutdown()
+            worker_pool = None
+
+    print_batch_summary()
+
+    return exit_code
+
+
+def print_batch_summary():
+    """Print the combined result of a multi-file batch."""
+
+    print(f"\n\n📊 Zusammenfassung: {len(batch_results)} Roh-PDFs\n")
+
+    for result in batch_results:
+        status = "✅" if result["exit_code"] == EXIT_OK else f"❌ (Exit-Code {result['exit_code']})"
+        print(
+            f"{status} {os.path.basename(result['file'])} | {result['pages'] or 0} Seiten | "
+            f"{result['reports']} Berichte | {result['files_written']} geschrieben | "
+            f"{result['files_reused']} übernommen | {len(result['contact_failures'])} Kontaktfehler"
+        )
+
+    all_failures = [
+        (result["file"], failure)
+        for result in batch_results
+        for failure in result["contact_failures"]
+    ]
+    if all_failures:
+        print(f"\n❌❌❌ {len(all_failures)} Kontaktdaten sind fehlerhaft: ❌❌❌\n")
+        for file_path, failure in all_failures:
+            print(f" ❌ {os.path.basename(file_path)}: {failure}")
+
+
+def process_raw_report(args: argparse.Namespace) -> int:
+    """
+    Split, print and send the raw report at `raw_report_file_path` after
+    the contact data was loaded.
+
+    Args:
+        args: Parsed command line arguments (see ``parse_arguments``).
+
+    Returns:
+        One of the ``EXIT_*`` status codes.
+    """
+
+    try:
+        with metrics.stage("input_paths"):
+            open_raw_report()
+    except Exception as e:
+        print(f"❌ FEHLER BEIM DATEI-ZUGRIFF: {e}")
+        return EXIT_INPUT_ERROR
+
+    try:
+        send_results = iterate_pages(args.sender if args.send else None)
+    except Exception as e:
+        print(f"❌ FEHLER BEIM ITERIEREN: {e}")
+        return EXIT_FAILURE
+
+    if contact_failures:
+        print(f"❌ Die Kontaktdatenliste ist fehlerhaft. Es gibt {len(contact_failures)} Fehler")
+        return EXIT_CONTACT_DATA_ERROR
+
+    if dry_run:
+        return EXIT_OK
+
+    if args.print_bundle:
+        try:
+            bundle_print_reports(send_to_printer=args.printer != "none")
+        except Exception as e:
+            print(f"❌ Fehler beim Drucken: {e}")
+            return EXIT_PRINT_ERROR
+
+    if not args.send:
+        return EXIT_OK
+
+    if pipeline_mode:
+        results = send_results  # already sent while splitting
+    else:
+        try:
+            results = send_emails(args.sender, confirm=False)
+        except Exception as e:
+            print(f"❌ Fehler beim Senden: {e}")
+            return EXIT_SEND_ERROR
+
+    if any(error for _, error in results):
+        return EXIT_SEND_ERROR
+
+    return EXIT_OK
+
+
+def start_run(args: argparse.Namespace):
+    """
+    Start the run metrics (with tracemalloc only if requested) and, if
+    requested, the cProfile profiler.
+
+    Args:
+        args: Parsed command line arguments (see ``parse_arguments``).
+    """
+
+    global run_report_path
+    global run_history_path
+    global profile_path
+    global profiler
+
+    run_report_path = args.run_report
+    run_history_path = args.history_db if args.history else None
+    profile_path = args.profile
+
+    metrics.track_memory = args.trace_memory
+    metrics.start()
+
+    if profile_path:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+
+def finish_run(exit_code: int = None):
+    """
+    Wait for the background archival of in-memory reports, print the stage
+    metrics, write the run report and profile and add the run to the run
+    history.
+
+    Errors while writing are printed but never abort the program.
+
+    Args:
+        exit_code: Exit code of the non-interactive mode, ``None`` for the
+            interactive mode.
+    """
+
+    global profiler
+
+    finish_archiving()
+
+    if batch_results:
+        pages = sum(result["pages"] or 0 for result in batch_results)
+        report_count = sum(result["reports"] for result in batch_results)
+        failure_count = sum(len(result["contact_failures"]) for result in batch_results)
+    else:
+        pages = raw_report_doc.page_count if globals().get("raw_report_doc") else None
+        report_count = len(reports)
+        failure_count = len(contact_failures)
+
+    metrics.info.update(
+        {
+            "exit_code": exit_code,
+            "mode": "interactive" if exit_code is None else "batch",
+            "month": globals().get("month_name"),
+            "year": globals().get("year"),
+            "raw_report_file_path": globals().get("raw_report_file_path"),
+            "pages": pages,
+            "persons": person_count,
+            "reports": report_count,
+            "contact_failures": failure_count,
+            "send_failures": send_failures,
+            "peak_rss_bytes": get_peak_rss_bytes(),
+            "streaming_mode": streaming_mode,
+            "pipeline_mode": pipeline_mode,
+            "scan_workers": scan_workers,
+            "write_workers": write_workers,
+            "save_profile": save_profile,
+            "bytes_written": sum(written_bytes.values()),
+            "files_written": len(written_bytes),
+            "files_reused": len(reused_files),
+            "raw_reports": batch_results,
+            "in_memory_reports": in_memory_reports,
+            "shared_source": use_shared_source,
+            "worker_source_opens": shared_source.worker_opens if shared_source else 0,
+            "disk_read_saved_bytes": shared_source.saved_read_bytes if shared_source else 0,
+            "source_copy_bytes": shared_source.copied_bytes if shared_source else 0,
+        }
+    )
+
+    print("\n⏱️ Laufzeiten der einzelnen Schritte:")
+    for line in metrics.summary_lines():
+        print(f"   {line}")
+
+    try:
+        metrics.write_report(run_report_path)
+        print(f"ℹ️ Laufbericht gespeichert: {run_report_path}")
+    except Exception as e:
+        print(f"⚠️ Laufbericht konnte nicht gespeichert werden: {e}")
+
+    if run_history_path:
+        from RunHistory import RunHistory
+
+        try:
+            run_id = RunHistory(run_history_path).record(metrics.to_dict())
+            print(f"ℹ️ Lauf {run_id} in der Laufhistorie gespeichert: {run_history_path}")
+        except Exception as e:
+            print(f"⚠️ Laufhistorie konnte nicht gespeichert werden: {e}")
+
+    if profiler:
+        profiler.disable()
+        try:
+            profiler.dump_stats(profile_path)
+            print(f"ℹ️ Profil gespeichert: {profile_path}")
+            import pstats
+
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+        except Exception as e:
+            print(f"⚠️ Profil konnte nicht gespeichert werden: {e}")
+        profiler = None
+
+
+def main(argv=None):
+
+    global logger
+    global console_log_level
+
+    args = parse_arguments(argv)
+
+    if args.history_report is not None:
+        from RunHistory import RunHistory, report_lines
+
+        for line in report_lines(RunHistory(args.history_db), args.history_report):
+            print(line)
+        sys.exit(EXIT_OK)
+
+    if args.verbose:
+        console_log_level = logging.DEBUG
+    elif args.quiet:
+        console_log_level = logging.WARNING
+
+    logger = setup_logging(
+        "log.txt", console_level=console_log_level
+    )  # prints automatically go to console + file
+    start_run(args)
+
+    if args.input is None:
+        run_interactive(args.raw_report)
+        return
+
+    exit_code = run_batch(args)
+    finish_run(exit_code)
+    sys.exit(exit_code)
+
+
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # required for worker processes in the PyInstaller build
     main()
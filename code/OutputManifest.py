@@ -0,0 +1,150 @@
+"""
+OutputManifest
+--------------
+
+Manifest of the per-person PDFs written into a destination folder. For
+every file it records the hash of the raw report, the page range, the save
+profile, the target subfolder and the hash of the written file. On a rerun
+with unchanged inputs a report is skipped, or only moved if its subfolder
+changed (e.g. from ``unsorted`` to ``send`` after a CSV fix), instead of
+being written again.
+
+Author: Mu Dell'Oro
+Version: v1.0
+Date: 18.10.2026
+Git: https://github.com/Capicodo/PDF-Splitter.git
+"""
+
+import json
+import os
+from typing import Dict, Optional
+
+from ScanCache import hash_file
+
+MANIFEST_FILE_NAME = "monatsbericht_manifest.json"
+
+
+class OutputManifest:
+    """
+    Manifest of the reports in one destination folder.
+
+    Attributes:
+        folder_path: The destination folder.
+        entries: Manifest entries keyed by report file name.
+    """
+
+    def __init__(self, folder_path: str):
+        self.folder_path: str = folder_path
+        self.entries: Dict[str, Dict] = {}
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.folder_path, MANIFEST_FILE_NAME)
+
+    @classmethod
+    def load(cls, folder_path: str) -> "OutputManifest":
+        """
+        Load the manifest of ``folder_path``; a missing or unreadable manifest
+        results in an empty one.
+        """
+        manifest = cls(folder_path)
+        try:
+            with open(manifest.path, encoding="utf-8") as manifest_file:
+                manifest.entries = json.load(manifest_file)["entries"]
+        except (OSError, ValueError, KeyError):
+            manifest.entries = {}
+        return manifest
+
+    def save(self):
+        """Write the manifest, replacing the previous one atomically."""
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as manifest_file:
+            json.dump({"entries": self.entries}, manifest_file, indent=1, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+
+    def _group_folder(self, target_path: str) -> str:
+        return os.path.relpath(os.path.dirname(target_path), self.folder_path)
+
+    def _find_existing(
+        self,
+        target_path: str,
+        source_hash: str,
+        start_page_index: int,
+        end_page_index: int,
+        save_profile: str,
+    ) -> Optional[str]:
+        """Return the path of an identical, intact earlier output or ``None``."""
+        file_name = os.path.basename(target_path)
+        entry = self.entries.get(file_name)
+        if (
+            not entry
+            or entry["source_hash"] != source_hash
+            or entry["start_page_index"] != start_page_index
+            or entry["end_page_index"] != end_page_index
+            or entry["save_profile"] != save_profile
+        ):
+            return None
+
+        existing_path = os.path.join(self.folder_path, entry["group_folder"], file_name)
+        if not os.path.isfile(existing_path) or hash_file(existing_path) != entry["output_hash"]:
+            return None
+
+        return existing_path
+
+    def reuse(
+        self,
+        target_path: str,
+        source_hash: str,
+        start_page_index: int,
+        end_page_index: int,
+        save_profile: str,
+    ) -> bool:
+        """
+        Reuse an earlier output for ``target_path`` if its inputs are unchanged.
+
+        If the earlier file lies in a different subfolder, it is moved to
+        ``target_path``.
+
+        Returns:
+            True if ``target_path`` is up to date and does not need to be
+            written, False otherwise.
+        """
+        existing_path = self._find_existing(
+            target_path, source_hash, start_page_index, end_page_index, save_profile
+        )
+        if not existing_path:
+            return False
+
+        if os.path.normcase(os.path.abspath(existing_path)) != os.path.normcase(
+            os.path.abspath(target_path)
+        ):
+            os.replace(existing_path, target_path)
+            self.entries[os.path.basename(target_path)]["group_folder"] = self._group_folder(
+                target_path
+            )
+
+        return True
+
+    def record(
+        self,
+        target_path: str,
+        source_hash: str,
+        start_page_index: int,
+        end_page_index: int,
+        save_profile: str,
+        output_hash: str = None,
+    ):
+        """
+        Add or replace the entry of a freshly written file.
+
+        ``output_hash`` avoids reading the file again if the caller already
+        hashed the written bytes.
+        """
+        self.entries[os.path.basename(target_path)] = {
+            "source_hash": source_hash,
+            "start_page_index": start_page_index,
+            "end_page_index": end_page_index,
+            "save_profile": save_profile,
+            "group_folder": self._group_folder(target_path),
+            "output_hash": output_hash or hash_file(target_path),
+        }
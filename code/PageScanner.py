@@ -0,0 +1,295 @@
+"""
+PageScanner
+-----------
+
+Helpers for reading the "Name:" and "Dienstplan:" header fields of the raw
+Timoto export without extracting the full text of every page. The position of
+the header fields is learned once from a reference page; later pages are only
+read inside that clip rectangle. Pages can also be scanned in parallel across
+a process pool, or only at the person boundaries with a galloping search.
+
+Author: Mu Dell'Oro
+Version: v1.0
+Date: 18.10.2026
+Git: https://github.com/Capicodo/PDF-Splitter.git
+"""
+
+from __future__ import annotations
+
+import contextlib
+import math
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional, Tuple
+
+from PeopleEmailLookup import extract_pli_id
+from SourceBuffer import SourceDescriptor, open_source, release_source
+
+if TYPE_CHECKING:
+    import fitz  # PyMuPDF, imported where it is used to keep the start fast
+
+HEADER_LABELS = ("Name:", "Dienstplan:")
+
+# Raw report last scanned by this worker process (see ``scan_page_range``)
+_scan_source: SourceDescriptor = None
+
+
+def _first_match(pattern: str, text: str) -> Optional[str]:
+    """Return the stripped first capture group of ``pattern`` in ``text``."""
+    match = re.search(pattern, text)
+    return match.group(1).strip() if match else None
+
+
+def learn_header_zone(
+    page: fitz.Page, patterns: Iterable[str]
+) -> Optional[fitz.Rect]:
+    """
+    Determine the clip rectangle that contains the header fields of a page.
+
+    The labels from ``HEADER_LABELS`` are located on ``page``; the zone spans
+    the full page width between the first and the last label with a margin of
+    one line height, so values printed right of or below a label are still
+    included. The zone is only accepted if every pattern yields the same value
+    inside the zone as on the full page.
+
+    Args:
+        page: Reference page, usually the first page of the raw report.
+        patterns: Regular expressions (one capture group each) that must be
+            readable from the zone.
+
+    Returns:
+        The learned ``fitz.Rect`` or ``None`` if the layout check failed.
+    """
+    import fitz  # PyMuPDF
+
+    label_rects = []
+    for label in HEADER_LABELS:
+        hits = page.search_for(label)
+        if not hits:
+            return None
+        label_rects.append(hits[0])
+
+    line_height = max(rect.height for rect in label_rects)
+    top = min(rect.y0 for rect in label_rects) - line_height / 2
+    bottom = max(rect.y1 for rect in label_rects) + line_height
+    zone = fitz.Rect(page.rect.x0, top, page.rect.x1, bottom) & page.rect
+
+    full_text = page.get_text()
+    zone_text = page.get_text(clip=zone)
+
+    for pattern in patterns:
+        full_value = _first_match(pattern, full_text)
+        if full_value is None or full_value != _first_match(pattern, zone_text):
+            return None
+
+    return zone
+
+
+def extract_header_text(
+    page: fitz.Page, zone: Optional[fitz.Rect], patterns: Iterable[str]
+) -> str:
+    """
+    Extract the text needed to read the header fields of ``page``.
+
+    Only the text inside ``zone`` is extracted. If no zone is known or one of
+    the patterns cannot be found inside it (e.g. a page with a different
+    layout), the full page text is returned instead.
+
+    Args:
+        page: Page to read.
+        zone: Clip rectangle from ``learn_header_zone`` or ``None``.
+        patterns: Regular expressions that must match the returned text.
+
+    Returns:
+        The clipped text, or the full page text as fallback.
+    """
+    if zone is not None:
+        zone_text = page.get_text(clip=zone)
+        if all(re.search(pattern, zone_text) for pattern in patterns):
+            return zone_text
+
+    return page.get_text()
+
+
+def scan_page_range(
+    source: SourceDescriptor,
+    start_page_index: int,
+    stop_page_index: int,
+    zone: Optional[Tuple[float, float, float, float]],
+    name_pattern: str,
+    dienstplan_pattern: str,
+) -> List[Tuple[int, str, Optional[int]]]:
+    """
+    Read name and PLI ID from a range of pages of the raw report.
+
+    Runs inside a worker process: the PDF is opened separately from
+    ``source`` so no document has to be shared between processes. A worker
+    of a shared pool detaches from the previous raw report's shared memory
+    block once it scans the next one.
+
+    Args:
+        source: Path to the raw report PDF or a shared memory descriptor
+            (see ``SourceBuffer``).
+        start_page_index: First page index (0-based, inclusive).
+        stop_page_index: Last page index (0-based, exclusive).
+        zone: Coordinates of the header zone or ``None`` for full-page text.
+        name_pattern: Regular expression for the "Name:" field.
+        dienstplan_pattern: Regular expression for the "Dienstplan:" field.
+
+    Returns:
+        A list of ``(page_index, name, pli_id)`` tuples in page order.
+        ``pli_id`` is ``None`` if it could not be parsed.
+
+    Raises:
+        Exception: If the name field is not found on a page.
+    """
+    import fitz  # PyMuPDF
+
+    global _scan_source
+    if _scan_source is not None and source != _scan_source:
+        release_source(_scan_source)
+    _scan_source = source
+
+    patterns = (name_pattern, dienstplan_pattern)
+    clip = fitz.Rect(zone) if zone else None
+    page_infos = []
+
+    with open_source(source) as doc:
+        for page_index in range(start_page_index, stop_page_index):
+            text = extract_header_text(doc[page_index], clip, patterns)
+
+            name = _first_match(name_pattern, text)
+            if not name:
+                raise Exception(f"❌ Kein Name auf Seite {page_index+1} gefunden ❌")
+
+            try:
+                pli_id = extract_pli_id(_first_match(dienstplan_pattern, text))
+            except Exception:
+                pli_id = None
+
+            page_infos.append((page_index, name, pli_id))
+
+    return page_infos
+
+
+def scan_pages_parallel(
+    source: SourceDescriptor,
+    page_count: int,
+    workers: int,
+    zone: Optional[fitz.Rect],
+    name_pattern: str,
+    dienstplan_pattern: str,
+    pool: ProcessPoolExecutor = None,
+) -> List[Tuple[int, str, Optional[int]]]:
+    """
+    Scan all pages of the raw report across a process pool.
+
+    The page range is split into one contiguous chunk per worker. Every
+    worker opens its own ``fitz.Document`` and the chunk results are merged
+    back in page order.
+
+    Args:
+        source: Path to the raw report PDF or a shared memory descriptor.
+        page_count: Number of pages in the PDF.
+        workers: Maximum number of worker processes.
+        zone: Learned header zone or ``None``.
+        name_pattern: Regular expression for the "Name:" field.
+        dienstplan_pattern: Regular expression for the "Dienstplan:" field.
+        pool: Existing pool shared with other raw reports; by default a
+            pool is created and shut down afterwards.
+
+    Returns:
+        A list of ``(page_index, name, pli_id)`` tuples for every page.
+    """
+    page_infos = []
+    if not page_count:
+        return page_infos
+
+    workers = max(1, min(workers, page_count))
+    chunk_size = math.ceil(page_count / workers)
+    zone_coords = tuple(zone) if zone else None
+
+    with contextlib.nullcontext(pool) if pool else ProcessPoolExecutor(
+        max_workers=workers
+    ) as pool:
+        futures = [
+            pool.submit(
+                scan_page_range,
+                source,
+                start,
+                min(start + chunk_size, page_count),
+                zone_coords,
+                name_pattern,
+                dienstplan_pattern,
+            )
+            for start in range(0, page_count, chunk_size)
+        ]
+        for future in futures:
+            page_infos.extend(future.result())
+
+    return page_infos
+
+
+def scan_pages_galloping(
+    read_page: Callable[[int], Tuple[str, Optional[int]]], page_count: int
+) -> Tuple[List[Tuple[int, str, Optional[int]]], int]:
+    """
+    Find the person boundaries while reading as few pages as possible.
+
+    Relies on every person's pages being contiguous. From the first page of
+    a person the search probes ahead with exponentially growing steps until
+    a page of another person is found, then binary-searches the transition
+    in between. This needs about O(persons * log(pages per person)) page
+    reads instead of one read per page.
+
+    Args:
+        read_page: Callable returning ``(name, pli_id)`` for a page index.
+        page_count: Number of pages in the PDF.
+
+    Returns:
+        A tuple of ``(page_infos, probed_pages)``. ``page_infos`` holds a
+        ``(page_index, name, pli_id)`` tuple for every page; all pages of a
+        segment carry the PLI ID of its last page. ``probed_pages`` is the
+        number of pages actually read.
+    """
+    probed = {}
+
+    def probe(page_index: int) -> Tuple[str, Optional[int]]:
+        if page_index not in probed:
+            probed[page_index] = read_page(page_index)
+        return probed[page_index]
+
+    page_infos = []
+    start = 0
+
+    while start < page_count:
+        name = probe(start)[0]
+
+        # Gallop: double the step until a page of another person is found
+        last_same = start
+        different = page_count
+        step = 1
+        while last_same + step < page_count:
+            candidate = last_same + step
+            if probe(candidate)[0] == name:
+                last_same = candidate
+                step *= 2
+            else:
+                different = candidate
+                break
+
+        # Binary search for the last page of the person
+        while different - last_same > 1:
+            middle = (last_same + different) // 2
+            if probe(middle)[0] == name:
+                last_same = middle
+            else:
+                different = middle
+
+        end_pli_id = probe(last_same)[1]
+        for page_index in range(start, last_same + 1):
+            page_infos.append((page_index, name, end_pli_id))
+
+        start = last_same + 1
+
+    return page_infos, len(probed)
@@ -3,7 +3,12 @@ PeopleEmailLookup
 ------------------
 
 Helper functions for reading a contact CSV and resolving delivery
-preferences and email addresses for Piluweri IDs (PLI-#).
+preferences and email addresses for Piluweri IDs (PLI-#). The CSV is indexed
+by PLI-# once when it is loaded, so lookups take constant time.
+
+Only the ``CONTACT_COLUMNS`` are kept from the CSV. The resulting index can
+be stored in a pickled cache file that is reused as long as the CSV content
+is unchanged, so repeated runs do not parse the CSV at all.
 
 Author: Mu Dell'Oro
 Version: v2.0 
@@ -12,12 +17,35 @@ Git: https://github.com/Capicodo/PDF-Splitter.git
 """
 
 import csv
-from typing import List
+import os
+import pickle
+from typing import Dict, List, Optional
 
 from ContactData import ContactData
+from ScanCache import hash_file
+
+# Columns read from the CSV, all others (e.g. Geburtsdatum) are dropped
+CONTACT_COLUMNS = ("PLI - #", "Papierbericht", "Mail-Adresse", "Rufname", "Nachname", "Adresse")
+# Columns that may be missing from the CSV
+OPTIONAL_COLUMNS = ("Adresse",)
+# Key of the file line number a row starts on, quoted fields may span lines
+LINE_NUMBER_KEY = "_line_number"
+
+CONTACT_CACHE_FILE_NAME = "contact_index.pickle"
+# Bump when ContactData or the cached index changes
+CONTACT_CACHE_VERSION = 2
 
+# Rows of the last parsed CSV, reduced to CONTACT_COLUMNS; empty after a
+# cache hit
 csv_data: List[dict] = []
 
+# PLI-# (as written in the CSV) -> ContactData, built by ``init``
+contact_index: Dict[str, ContactData] = {}
+# PLI-# -> error message for rows that could not be turned into ContactData
+invalid_rows: Dict[str, str] = {}
+# All problems found while loading the CSV
+validation_errors: List[str] = []
+
 
 def extract_pli_id(name: str) -> int:
     """
@@ -49,27 +77,241 @@ def extract_pli_id(name: str) -> int:
         raise ValueError(f"No valid PLI ID found in '{name}'")
 
 
-def init(path: str):
+def init(path: str, cache_folder_path: str = None):
     """
-    Load the contact CSV into memory for later lookups.
+    Load the contact CSV and build the PLI-# index for later lookups.
+
+    This function reads the ``CONTACT_COLUMNS`` of the CSV file at ``path``
+    (see ``read_contact_rows``), stores the rows in the module-level
+    ``csv_data`` list and builds ``contact_index`` with one ``ContactData``
+    per PLI-#. All rows are validated while loading; duplicate PLI-#s,
+    invalid ``Papierbericht`` values and missing email addresses are
+    collected in ``validation_errors`` instead of failing one by one during
+    the lookups.
 
-    This function reads the CSV file at ``path`` using ``csv.DictReader`` and
-    stores the rows in the module-level ``csv_data`` list.
+    With ``cache_folder_path`` the index is loaded from the contact cache if
+    the CSV is unchanged (see ``load_contact_cache``) and stored there after
+    parsing otherwise.
 
     Args:
         path: Filesystem path to the CSV file encoded in UTF-8.
+        cache_folder_path: Folder of the contact cache or ``None`` to always
+            parse the CSV.
 
     Raises:
         Exception: If the file cannot be read or parsed.
     """
     global csv_data
     try:
-        with open(path, newline="", encoding="utf-8") as csv_fh:
-            csv_data = list(csv.DictReader(csv_fh))
+        if cache_folder_path and load_contact_cache(cache_folder_path, path):
+            csv_data = []
+            return
+
+        csv_data = read_contact_rows(path)
+        build_index(csv_data)
     except Exception as e:
         csv_data = []  # fallback to empty list if reading fails
+        build_index(csv_data)
         raise Exception(f"Fehler beim Lesen der CSV: {e}")
 
+    if cache_folder_path:
+        store_contact_cache(cache_folder_path, path)
+
+
+def read_contact_rows(path: str) -> List[dict]:
+    """
+    Read the ``CONTACT_COLUMNS`` of every row of the contact CSV.
+
+    The CSV still has to be tokenized completely (quoted fields may span
+    several lines), but only the needed fields are kept per row.
+
+    Args:
+        path: Filesystem path to the CSV file encoded in UTF-8.
+
+    Returns:
+        One dictionary per data row with the ``CONTACT_COLUMNS`` as keys;
+        missing optional columns are ``None``. ``LINE_NUMBER_KEY`` holds the
+        file line the row starts on.
+
+    Raises:
+        ValueError: If a required column is missing.
+    """
+    with open(path, newline="", encoding="utf-8") as csv_fh:
+        reader = csv.reader(csv_fh)
+        header = next(reader, [])
+
+        column_indices = {}
+        for column in CONTACT_COLUMNS:
+            if column in header:
+                column_indices[column] = header.index(column)
+            elif column not in OPTIONAL_COLUMNS:
+                raise ValueError(f"Spalte '{column}' fehlt")
+
+        rows = []
+        last_line_number = reader.line_num
+        for fields in reader:
+            row = {
+                column: fields[index] if index < len(fields) else None
+                for column, index in column_indices.items()
+            }
+            row[LINE_NUMBER_KEY] = last_line_number + 1
+            last_line_number = reader.line_num
+            rows.append(row)
+        return rows
+
+
+def _get_cache_path(cache_folder_path: str) -> str:
+    return os.path.join(cache_folder_path, CONTACT_CACHE_FILE_NAME)
+
+
+def load_contact_cache(cache_folder_path: str, path: str) -> bool:
+    """
+    Load ``contact_index``, ``invalid_rows`` and ``validation_errors`` from
+    the contact cache if it was built from the current content of ``path``.
+
+    Size and modification time of the CSV are checked first; only if they
+    differ, the file is hashed and compared with the cached hash (e.g. after
+    the CSV was copied without changes). On such a hash match the cache is
+    stored again with the new size and modification time, so later runs
+    skip the hash. Unreadable or outdated caches are ignored.
+
+    Args:
+        cache_folder_path: Folder of the contact cache.
+        path: Filesystem path to the CSV file.
+
+    Returns:
+        True if the index was loaded from the cache.
+    """
+    try:
+        with open(_get_cache_path(cache_folder_path), "rb") as cache_file:
+            cache = pickle.load(cache_file)
+
+        if cache["version"] != CONTACT_CACHE_VERSION or cache["columns"] != CONTACT_COLUMNS:
+            return False
+
+        stat = os.stat(path)
+        if (cache["size"], cache["mtime_ns"]) != (stat.st_size, stat.st_mtime_ns):
+            if hash_file(path) != cache["hash"]:
+                return False
+            cache["size"], cache["mtime_ns"] = stat.st_size, stat.st_mtime_ns
+            try:
+                _write_cache(cache_folder_path, cache)
+            except Exception:
+                pass  # still a hit, the next run only hashes again
+    except Exception:
+        return False
+
+    contact_index.clear()
+    contact_index.update(cache["contact_index"])
+    invalid_rows.clear()
+    invalid_rows.update(cache["invalid_rows"])
+    validation_errors[:] = cache["validation_errors"]
+    return True
+
+
+def store_contact_cache(cache_folder_path: str, path: str) -> Optional[str]:
+    """
+    Store the current index in the contact cache, replacing the previous one
+    atomically. Errors are ignored, the cache is only an optimization.
+
+    Args:
+        cache_folder_path: Folder of the contact cache.
+        path: Filesystem path of the CSV the index was built from.
+
+    Returns:
+        The path of the cache file or ``None`` if it could not be written.
+    """
+    try:
+        stat = os.stat(path)
+        cache = {
+            "version": CONTACT_CACHE_VERSION,
+            "columns": CONTACT_COLUMNS,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "hash": hash_file(path),
+            "contact_index": contact_index,
+            "invalid_rows": invalid_rows,
+            "validation_errors": validation_errors,
+        }
+        return _write_cache(cache_folder_path, cache)
+    except Exception:
+        return None
+
+
+def _write_cache(cache_folder_path: str, cache: dict) -> str:
+    """Write ``cache`` to the contact cache file atomically."""
+    os.makedirs(cache_folder_path, exist_ok=True)
+    cache_path = _get_cache_path(cache_folder_path)
+    temp_path = cache_path + ".tmp"
+    with open(temp_path, "wb") as cache_file:
+        pickle.dump(cache, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, cache_path)
+    return cache_path
+
+
+def build_index(rows: List[dict]):
+    """
+    Build ``contact_index``, ``invalid_rows`` and ``validation_errors`` from
+    the given CSV rows.
+
+    Rows without PLI-# are ignored. For duplicate PLI-#s the first row wins,
+    as with the former linear search.
+
+    Args:
+        rows: CSV rows as returned by ``read_contact_rows``.
+    """
+    contact_index.clear()
+    invalid_rows.clear()
+    validation_errors.clear()
+
+    for position, row in enumerate(rows, start=2):  # line 1 is the header
+        line_number = row.get(LINE_NUMBER_KEY, position)
+        pli_id_str = (row.get("PLI - #") or "").strip()
+        if not pli_id_str:
+            continue
+
+        if pli_id_str in contact_index or pli_id_str in invalid_rows:
+            validation_errors.append(
+                f"Zeile {line_number}: PLI-# {pli_id_str} ist mehrfach vorhanden"
+            )
+            continue
+
+        try:
+            pli_id = int(pli_id_str)
+            deliver_via_paper = sheets_formated_str_to_bool(
+                row.get("Papierbericht") or ""
+            )
+        except ValueError as e:
+            message = f"Zeile {line_number}: PLI-# {pli_id_str} ist ungültig: {e}"
+            invalid_rows[pli_id_str] = message
+            validation_errors.append(message)
+            continue
+
+        contact_data = ContactData(
+            deliver_via_paper,
+            row["Mail-Adresse"],
+            pli_id,
+            row["Rufname"],
+            row["Nachname"],
+            row.get("Adresse") or "",
+        )
+        contact_index[pli_id_str] = contact_data
+
+        if not deliver_via_paper and not (contact_data.email or "").strip():
+            validation_errors.append(
+                f"Zeile {line_number}: PLI-# {pli_id_str} hat keine Email-Adresse, obwohl Email-Versand angegeben ist"
+            )
+
+
+def get_validation_errors() -> List[str]:
+    """
+    Return the problems found by the last ``init`` call.
+
+    Returns:
+        A list of human-readable error messages, empty if the CSV is valid.
+    """
+    return list(validation_errors)
+
 
 def sheets_formated_str_to_bool(s: str) -> bool:
     """
@@ -95,37 +337,29 @@ def sheets_formated_str_to_bool(s: str) -> bool:
 
 def get_data_from_pli_id(pli_id: int) -> ContactData:
     """
-    Find contact data for a given PLI ID from the loaded CSV rows.
+    Find contact data for a given PLI ID in the contact index.
 
     The CSV is expected to contain a column named "PLI - #" which stores the
-    Piluweri ID. When a matching row is found this function builds and
-    returns a ``ContactData`` instance.
+    Piluweri ID. The ``ContactData`` instances are built once by ``init``;
+    this function only looks them up.
 
     Args:
         pli_id: Piluweri ID to search for.
 
     Returns:
-        A ``ContactData`` object for the matched row.
+        The ``ContactData`` object for the matched row.
 
     Raises:
-        Exception: If no matching deliver information is found.
+        Exception: If no matching deliver information is found or the row of
+            the PLI ID is invalid.
     """
     pli_id_str = str(pli_id)
-    #print(f"COMPARE ID: --{pli_id_str}--")
-
-    for row in csv_data:
-        if row["PLI - #"] == pli_id_str:
-            #print(f"Found Contact Data. -> {row.get('Papierbericht')}, {row.get('Mail-Adresse')}")
-            contact_data = ContactData(
-                sheets_formated_str_to_bool(row["Papierbericht"]),
-                row["Mail-Adresse"],
-                pli_id,
-                row["Rufname"],
-                row["Nachname"],
-            )
-            
-            #print(contact_data.deliver_via_paper, contact_data.email)
 
-            return contact_data
+    contact_data = contact_index.get(pli_id_str)
+    if contact_data:
+        return contact_data
+
+    if pli_id_str in invalid_rows:
+        raise Exception(f"❌ {invalid_rows[pli_id_str]}")
 
     raise Exception("❌ No Deliver Information found")
@@ -0,0 +1,194 @@
+"""
+Pipeline
+--------
+
+Overlapped scan → write → send pipeline built on asyncio. The producer
+yields items (person segments) from a blocking iterator in its own
+executor, writer coroutines turn them into results (written reports) and
+sender coroutines deliver those. The stages are connected by bounded queues:
+a fast scanner waits for the writers instead of piling up segments in memory
+(backpressure), and the first reports are sent while later pages are still
+being scanned.
+
+The actual work runs in executors chosen by the caller; the event loop only
+moves items between the stages. The end-to-end time therefore approaches the
+time of the slowest stage instead of the sum of all stages.
+
+Author: Mu Dell'Oro
+Version: v1.0
+Date: 18.10.2026
+Git: https://github.com/Capicodo/PDF-Splitter.git
+"""
+
+import asyncio
+import time
+from concurrent.futures import Executor
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Marks the end of the stream in the queues
+_DONE = object()
+
+
+class StageStats:
+    """
+    Busy time and throughput of one pipeline stage.
+
+    Attributes:
+        name: Stage name (``scan``, ``write`` or ``send``).
+        busy_seconds: Time spent in the stage, summed over all of its
+            concurrent workers.
+        items: Number of processed items.
+        max_queue: Highest fill level of the stage's input queue.
+    """
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self.busy_seconds: float = 0.0
+        self.items: int = 0
+        self.max_queue: int = 0
+
+
+class PipelineResult:
+    """
+    Outcome of a pipeline run.
+
+    Attributes:
+        stages: ``StageStats`` of the ``scan``, ``write`` and ``send`` stage.
+        wall_seconds: End-to-end time of the run.
+        sent: ``(item, error)`` for every item of the send stage, ``error``
+            is ``None`` on success.
+        errors: ``(stage, item, error)`` for every item whose write failed.
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, StageStats] = {
+            name: StageStats(name) for name in ("scan", "write", "send")
+        }
+        self.wall_seconds: float = 0.0
+        self.sent: List[Tuple[Any, Optional[Exception]]] = []
+        self.errors: List[Tuple[str, Any, Exception]] = []
+
+    @property
+    def serial_seconds(self) -> float:
+        """Time the stages would have taken one after another."""
+        return sum(stage.busy_seconds for stage in self.stages.values())
+
+
+async def run_pipeline(
+    source: Iterator,
+    source_executor: Executor,
+    write: Callable[[Any], Awaitable[Any]],
+    send: Optional[Callable[[Any], Awaitable[Any]]] = None,
+    writers: int = 1,
+    senders: int = 1,
+    queue_size: int = 8,
+) -> PipelineResult:
+    """
+    Run ``source`` → ``write`` → ``send`` with overlapping stages.
+
+    Args:
+        source: Blocking iterator of items; ``next`` is called in
+            ``source_executor``, one item at a time.
+        source_executor: Executor for the producer, e.g. a single thread
+            owning a document that must not be shared.
+        write: Coroutine function per item. Its result is passed to ``send``;
+            ``None`` means there is nothing to send for the item.
+        send: Coroutine function per write result or ``None`` to stop after
+            writing. Exceptions are recorded in ``PipelineResult.sent``.
+        writers: Number of items written concurrently.
+        senders: Number of results sent concurrently.
+        queue_size: Capacity of each queue between two stages.
+
+    Returns:
+        The ``PipelineResult`` of the run.
+
+    Raises:
+        Exception: Any error of the producer; the other stages are cancelled.
+    """
+    loop = asyncio.get_running_loop()
+    result = PipelineResult()
+    scan_stats = result.stages["scan"]
+    write_stats = result.stages["write"]
+    send_stats = result.stages["send"]
+
+    writers = max(1, writers)
+    senders = max(1, senders)
+    write_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    send_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    finished_writers = 0
+
+    async def produce():
+        while True:
+            start = time.perf_counter()
+            item = await loop.run_in_executor(source_executor, next, source, _DONE)
+            scan_stats.busy_seconds += time.perf_counter() - start
+            if item is _DONE:
+                break
+
+            scan_stats.items += 1
+            await write_queue.put(item)  # waits while the writers are behind
+            write_stats.max_queue = max(write_stats.max_queue, write_queue.qsize())
+
+        for _ in range(writers):
+            await write_queue.put(_DONE)
+
+    async def consume_writes():
+        nonlocal finished_writers
+
+        while True:
+            item = await write_queue.get()
+            if item is _DONE:
+                break
+
+            start = time.perf_counter()
+            try:
+                written = await write(item)
+            except Exception as e:
+                result.errors.append(("write", item, e))
+                written = None
+            write_stats.busy_seconds += time.perf_counter() - start
+            write_stats.items += 1
+
+            if send and written is not None:
+                await send_queue.put(written)
+                send_stats.max_queue = max(send_stats.max_queue, send_queue.qsize())
+
+        finished_writers += 1
+        if send and finished_writers == writers:
+            for _ in range(senders):
+                await send_queue.put(_DONE)
+
+    async def consume_sends():
+        while True:
+            item = await send_queue.get()
+            if item is _DONE:
+                return
+
+            start = time.perf_counter()
+            try:
+                await send(item)
+                error = None
+            except Exception as e:
+                error = e
+            send_stats.busy_seconds += time.perf_counter() - start
+            send_stats.items += 1
+            result.sent.append((item, error))
+
+    run_start = time.perf_counter()
+
+    tasks = [asyncio.ensure_future(produce())]
+    tasks += [asyncio.ensure_future(consume_writes()) for _ in range(writers)]
+    if send:
+        tasks += [asyncio.ensure_future(consume_sends()) for _ in range(senders)]
+
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    finally:
+        result.wall_seconds = time.perf_counter() - run_start
+
+    return result
@@ -0,0 +1,185 @@
+"""
+PrintBundle
+-----------
+
+Combines all paper-delivery reports into a single print job. Every person's
+part is padded to an even page count for duplex printing, and optionally
+starts with an address cover page for window envelopes (DIN 5008). The
+bundle is handed to a pluggable printer backend.
+
+Backends:
+    WindowsPrinter: Prints via ``ShellExecute`` on the given or default
+        printer.
+    LpPrinter: Prints via the CUPS ``lp`` command.
+    FilePrinter: Copies the bundle into a folder, e.g. for tests.
+
+Author: Mu Dell'Oro
+Version: v1.0
+Date: 18.10.2026
+Git: https://github.com/Capicodo/PDF-Splitter.git
+"""
+
+import abc
+import os
+import shutil
+import subprocess
+from typing import List, Tuple
+
+import fitz  # PyMuPDF
+
+from ContactData import ContactData
+
+MM = 72 / 25.4  # PDF points per millimetre
+
+# Address field of a DIN 5008 letter (form B) behind the envelope window
+ADDRESS_FIELD = fitz.Rect(25 * MM, 50 * MM, 105 * MM, 85 * MM)
+SENDER_LINE = fitz.Rect(25 * MM, 45 * MM, 105 * MM, 50 * MM)
+
+
+def add_cover_page(doc: fitz.Document, contact_data: ContactData, sender_line: str = ""):
+    """
+    Append an A4 cover page with the recipient address in the window field.
+
+    Args:
+        doc: The bundle document.
+        contact_data: Recipient; ``address`` holds the CSV ``Adresse``.
+        sender_line: Optional small return address above the recipient.
+    """
+    page = doc.new_page(width=595, height=842)  # A4
+
+    if sender_line:
+        page.insert_textbox(SENDER_LINE, sender_line, fontsize=6)
+
+    address_lines = [f"{contact_data.first_name} {contact_data.last_name}"]
+    address_lines += [
+        line.strip() for line in (contact_data.address or "").replace(",", "\n").splitlines()
+        if line.strip()
+    ]
+    page.insert_textbox(ADDRESS_FIELD, "\n".join(address_lines), fontsize=10)
+
+
+def build_print_bundle(
+    paper_reports: List[Tuple[str, ContactData]],
+    bundle_path: str,
+    duplex: bool = True,
+    cover_pages: bool = False,
+    sender_line: str = "",
+) -> int:
+    """
+    Concatenate all paper reports into one PDF.
+
+    Args:
+        paper_reports: List of ``(report_path, contact_data)`` in print order.
+        bundle_path: Path of the bundle PDF to write.
+        duplex: Pad every person's part to an even number of pages so the
+            next person starts on a new sheet.
+        cover_pages: Put an address cover page in front of every report.
+        sender_line: Return address printed above the recipient address.
+
+    Returns:
+        The number of pages in the bundle.
+    """
+    with fitz.open() as bundle:
+        for report_path, contact_data in paper_reports:
+            first_page = bundle.page_count
+
+            if cover_pages:
+                add_cover_page(bundle, contact_data, sender_line)
+                if duplex:
+                    bundle.new_page(width=595, height=842)  # back of the cover stays empty
+
+            with fitz.open(report_path) as report_doc:
+                bundle.insert_pdf(report_doc)
+
+            if duplex and (bundle.page_count - first_page) % 2:
+                last_page = bundle[-1]
+                bundle.new_page(width=last_page.rect.width, height=last_page.rect.height)
+
+        page_count = bundle.page_count
+        bundle.save(bundle_path, garbage=3, deflate=True)
+
+    return page_count
+
+
+class PrinterBackend(abc.ABC):
+    """Interface of a printer backend."""
+
+    @abc.abstractmethod
+    def print_file(self, path: str, duplex: bool = True):
+        """
+        Send the PDF at ``path`` to the printer.
+
+        Raises:
+            Exception: If the print job could not be submitted.
+        """
+
+
+class WindowsPrinter(PrinterBackend):
+    """
+    Print via the shell ``printto`` verb of the default PDF application,
+    which takes the printer name as parameter (the ``print`` verb ignores
+    it and always uses the default printer).
+
+    Duplex cannot be controlled through the shell verb; ``duplex`` is
+    ignored and the printer's default setting applies.
+    """
+
+    def __init__(self, printer_name: str = None):
+        self.printer_name: str = printer_name
+
+    def print_file(self, path: str, duplex: bool = True):
+        import win32api
+        import win32print
+
+        printer_name = self.printer_name or win32print.GetDefaultPrinter()
+        win32api.ShellExecute(0, "printto", path, f'"{printer_name}"', ".", 0)
+
+
+class LpPrinter(PrinterBackend):
+    """Print via the CUPS ``lp`` command."""
+
+    def __init__(self, printer_name: str = None, command: str = "lp"):
+        self.printer_name: str = printer_name
+        self.command: str = command
+
+    def print_file(self, path: str, duplex: bool = True):
+        arguments = [self.command]
+        if self.printer_name:
+            arguments += ["-d", self.printer_name]
+        arguments += ["-o", "sides=two-sided-long-edge" if duplex else "sides=one-sided"]
+        arguments.append(path)
+        subprocess.run(arguments, check=True, capture_output=True)
+
+
+class FilePrinter(PrinterBackend):
+    """Copy the print job into ``folder_path`` instead of printing it."""
+
+    def __init__(self, folder_path: str):
+        self.folder_path: str = folder_path
+        self.printed: List[str] = []
+
+    def print_file(self, path: str, duplex: bool = True):
+        os.makedirs(self.folder_path, exist_ok=True)
+        target_path = os.path.join(self.folder_path, os.path.basename(path))
+        shutil.copyfile(path, target_path)
+        self.printed.append(target_path)
+
+
+def create_printer(backend: str, printer_name: str = None) -> PrinterBackend:
+    """
+    Create a printer backend by name.
+
+    Args:
+        backend: ``"windows"``, ``"lp"`` or ``"file"``.
+        printer_name: Printer name, or the target folder for ``"file"``.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    if backend == "windows":
+        return WindowsPrinter(printer_name)
+    if backend == "lp":
+        return LpPrinter(printer_name)
+    if backend == "file":
+        return FilePrinter(printer_name or "printed")
+    raise ValueError(f"Unbekannter Drucker: {backend}")
@@ -11,9 +11,15 @@ Date: 12.11.2025
 Git: https://github.com/Capicodo/PDF-Splitter.git
 """
 
-import fitz
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from ContactData import ContactData
 
+if TYPE_CHECKING:
+    import fitz
+
 
 class Report:
     """
@@ -24,9 +30,17 @@ class Report:
         document: Filesystem path or PyMuPDF document reference for the
             generated per-person PDF.
         contact_data: The associated ``ContactData`` instance.
+        content: The PDF bytes if the report is kept in memory for sending,
+            otherwise ``None``.
     """
 
-    def __init__(self, pli_id: int, document: str, contact_data: ContactData):
+    def __init__(
+        self,
+        pli_id: int,
+        document: str,
+        contact_data: ContactData,
+        content: bytes = None,
+    ):
         """
         Initialize a ``Report`` instance.
 
@@ -35,7 +49,10 @@ class Report:
             document: Path to the generated PDF file (or a fitz.Document
                 reference where used by calling code).
             contact_data: ``ContactData`` associated with this report.
+            content: Optional in-memory PDF bytes; ``document`` is then the
+                archival path and provides the attachment file name.
         """
         self.pli_id: int = pli_id
         self.document: fitz.Document = document
         self.contact_data = contact_data
+        self.content: bytes = content
@@ -0,0 +1,256 @@
+"""
+ReportWriter
+------------
+
+Worker functions to write the per-person PDFs in parallel. Every worker
+process opens the raw report once (from its path or from shared memory, see
+``SourceBuffer``) and reuses it for all segments it writes. A pool shared by
+several raw reports passes the source with every job instead; the worker then
+switches to the new source on first use.
+
+Files are saved with one of the ``SAVE_PROFILES``:
+    fast: Default PyMuPDF save options, quickest to write.
+    compact: Garbage collection, deflate compression, object streams and
+        font subsetting for small files.
+    budget: Like compact; files above the size budget are saved a second
+        time with recompressed images and a full clean-up.
+
+Reports can also be rendered into memory (``render_document``) with the same
+profiles, e.g. to attach them to a mail without a disk round-trip. Workers
+return the SHA-256 of every report, so the output manifest does not have to
+read the written files back.
+
+Author: Mu Dell'Oro
+Version: v1.0
+Date: 18.10.2026
+Git: https://github.com/Capicodo/PDF-Splitter.git
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from SourceBuffer import SourceDescriptor, open_source, release_source
+
+if TYPE_CHECKING:
+    import fitz  # PyMuPDF, imported where it is used to keep the start fast
+
+SAVE_PROFILES = ("fast", "compact", "budget")
+
+COMPACT_SAVE_OPTIONS = {"garbage": 3, "deflate": True, "use_objstms": 1}
+BUDGET_SAVE_OPTIONS = {
+    "garbage": 4,
+    "deflate": True,
+    "deflate_images": True,
+    "deflate_fonts": True,
+    "clean": True,
+    "use_objstms": 1,
+}
+
+# Raw report opened once per worker process by ``_open_source``
+_source_doc: fitz.Document = None
+_source: SourceDescriptor = None
+
+
+def _open_source(source: SourceDescriptor):
+    """Open the raw report in the current worker process."""
+    global _source_doc
+    global _source
+    _source_doc = open_source(source)
+    _source = source
+
+
+def _get_source_doc(source: SourceDescriptor = None) -> fitz.Document:
+    """
+    Return the worker's raw report, switching to ``source`` if it differs
+    from the currently opened one.
+    """
+    if source is not None and source != _source:
+        if _source_doc is not None:
+            _source_doc.close()
+            release_source(_source)
+        _open_source(source)
+    return _source_doc
+
+
+def _save_with_profile(
+    doc: fitz.Document,
+    profile: str,
+    size_budget: Optional[int],
+    save: Callable[[Dict], int],
+) -> int:
+    """
+    Apply the save profile to ``doc``.
+
+    Args:
+        save: Saves ``doc`` with the given save options and returns the
+            resulting size in bytes.
+
+    Returns:
+        The size of the last save in bytes.
+
+    Raises:
+        ValueError: If ``profile`` is unknown.
+    """
+    if profile not in SAVE_PROFILES:
+        raise ValueError(f"Unbekanntes Speicherprofil: {profile}")
+
+    if profile == "fast":
+        return save({})
+
+    try:
+        doc.subset_fonts()
+    except Exception:
+        pass  # subsetting is optional, e.g. older PyMuPDF without support
+
+    size = save(COMPACT_SAVE_OPTIONS)
+
+    if profile == "budget" and size_budget and size > size_budget:
+        if hasattr(doc, "rewrite_images"):
+            doc.rewrite_images(dpi_threshold=150, dpi_target=120, quality=70)
+        size = save(BUDGET_SAVE_OPTIONS)
+
+    return size
+
+
+def save_document(
+    doc: fitz.Document, target_path: str, profile: str = "fast", size_budget: int = None
+) -> Tuple[int, str]:
+    """
+    Save ``doc`` to ``target_path`` with the given save profile.
+
+    The PDF is rendered in memory and written once, so its hash is computed
+    without reading the file back and the ``budget`` profile does not write
+    the file twice.
+
+    Args:
+        doc: The new per-person document.
+        target_path: Path of the PDF file to write.
+        profile: One of ``SAVE_PROFILES``.
+        size_budget: Maximum file size in bytes for the ``budget`` profile.
+
+    Returns:
+        A tuple of ``(size, sha256)`` of the written file.
+
+    Raises:
+        ValueError: If ``profile`` is unknown.
+    """
+    content = render_document(doc, profile, size_budget)
+    with open(target_path, "wb") as target_file:
+        target_file.write(content)
+    return len(content), hashlib.sha256(content).hexdigest()
+
+
+def render_document(
+    doc: fitz.Document, profile: str = "fast", size_budget: int = None
+) -> bytes:
+    """
+    Like ``save_document``, but return the PDF as bytes instead of writing
+    a file.
+
+    Raises:
+        ValueError: If ``profile`` is unknown.
+    """
+    content = b""
+
+    def render(options: Dict) -> int:
+        nonlocal content
+        content = doc.tobytes(**options)
+        return len(content)
+
+    _save_with_profile(doc, profile, size_budget, render)
+    return content
+
+
+def write_segment(
+    job: Tuple[int, int, str, str, Optional[int], bool],
+    source: SourceDescriptor = None,
+) -> Tuple[str, Optional[str], int, Optional[bytes], Optional[str]]:
+    """
+    Copy a page range of the worker's source document into a new PDF.
+
+    Args:
+        job: Tuple of ``(start_page_index, end_page_index, target_path,
+            save_profile, size_budget, in_memory)`` with inclusive 0-based
+            page indices. With ``in_memory`` the PDF is returned instead of
+            written to ``target_path``.
+        source: Raw report of the job for pools shared by several raw
+            reports; ``None`` uses the source opened by the pool initializer.
+
+    Returns:
+        A tuple of ``(target_path, error, size, content, output_hash)`` where
+        ``error`` is ``None`` on success or the error message if the file
+        could not be written, ``content`` holds the PDF bytes for
+        ``in_memory`` jobs and ``output_hash`` is the SHA-256 of the PDF.
+    """
+    import fitz  # PyMuPDF
+
+    start_page_index, end_page_index, target_path, profile, size_budget, in_memory = job
+    try:
+        with fitz.open() as new_doc:
+            new_doc.insert_pdf(
+                _get_source_doc(source),
+                from_page=start_page_index,
+                to_page=end_page_index,
+            )
+            if in_memory:
+                content = render_document(new_doc, profile, size_budget)
+                return (
+                    target_path, None, len(content), content, hashlib.sha256(content).hexdigest()
+                )
+
+            bytes_written, output_hash = save_document(
+                new_doc, target_path, profile, size_budget
+            )
+        return target_path, None, bytes_written, None, output_hash
+    except Exception as e:
+        return target_path, str(e), 0, None, None
+
+
+def create_writer_pool(source: SourceDescriptor, workers: int) -> ProcessPoolExecutor:
+    """
+    Create a process pool for ``write_segment`` in which every worker opens
+    the raw report from ``source`` once.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max(1, workers), initializer=_open_source, initargs=(source,)
+    )
+
+
+def write_segments_parallel(
+    source: SourceDescriptor,
+    jobs: List[Tuple[int, int, str, str, Optional[int], bool]],
+    workers: int,
+    pool: ProcessPoolExecutor = None,
+) -> List[Tuple[str, Optional[str], int, Optional[bytes], Optional[str]]]:
+    """
+    Write all jobs across a process pool.
+
+    Args:
+        source: Path to the raw report PDF or a shared memory descriptor.
+        jobs: List of jobs as described in ``write_segment``.
+        workers: Maximum number of worker processes.
+        pool: Existing pool shared with other raw reports; by default a
+            pool is created for ``source`` and shut down afterwards.
+
+    Returns:
+        A list of ``(target_path, error, size, content, output_hash)`` tuples
+        in the order of ``jobs``.
+    """
+    if not jobs:
+        return []
+
+    workers = max(1, min(workers, len(jobs)))
+    chunksize = max(1, math.ceil(len(jobs) / (workers * 4)))
+
+    if pool:
+        return list(
+            pool.map(functools.partial(write_segment, source=source), jobs, chunksize=chunksize)
+        )
+
+    with create_writer_pool(source, workers) as pool:
+        return list(pool.map(write_segment, jobs, chunksize=chunksize))
@@ -0,0 +1,248 @@
+"""
+RunHistory
+----------
+
+Local SQLite database with one row per run: page and person counts, the
+durations of the scan, write and send stages, output sizes, failures and the
+worker settings, taken from the run report of ``RunMetrics``. The report
+command lists the recent runs as trend table and flags runs whose per-page
+or per-mail times are clearly worse than those of the runs before.
+
+Author: Mu Dell'Oro
+Version: v1.0
+Date: 18.10.2026
+Git: https://github.com/Capicodo/PDF-Splitter.git
+"""
+
+import contextlib
+import json
+import sqlite3
+import statistics
+from typing import Dict, List
+
+# Run report stage -> column
+STAGE_COLUMNS = {
+    "get_page_person_infos": "scan_seconds",
+    "create_report": "write_seconds",
+    "send_report_to": "send_seconds",
+}
+
+# Run report info key -> column
+INFO_COLUMNS = (
+    "mode",
+    "exit_code",
+    "month",
+    "year",
+    "raw_report_file_path",
+    "pages",
+    "persons",
+    "reports",
+    "contact_failures",
+    "send_failures",
+    "bytes_written",
+    "files_written",
+    "files_reused",
+    "peak_rss_bytes",
+    "scan_workers",
+    "write_workers",
+    "save_profile",
+    "streaming_mode",
+    "pipeline_mode",
+)
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT,
+    wall_seconds REAL,
+    {", ".join(f"{column} REAL" for column in STAGE_COLUMNS.values())},
+    {", ".join(INFO_COLUMNS)},
+    run_report TEXT
+)
+"""
+
+# Per-unit times checked for regressions: (label, duration column, unit column)
+RATES = (
+    ("Scan s/Seite", "scan_seconds", "pages"),
+    ("Schreiben s/Seite", "write_seconds", "pages"),
+    ("Senden s/Email", "send_seconds", "sent_mails"),
+)
+
+
+class RunHistory:
+    """
+    The run history database.
+
+    Attributes:
+        db_path: Path of the SQLite file, created on first use.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path: str = db_path
+
+    @contextlib.contextmanager
+    def _connect(self):
+        connection = sqlite3.connect(self.db_path)
+        connection.row_factory = sqlite3.Row
+        try:
+            with connection:  # commits on success
+                connection.execute(SCHEMA)
+                yield connection
+        finally:
+            connection.close()
+
+    def record(self, run_report: Dict) -> int:
+        """
+        Add a run.
+
+        Args:
+            run_report: The run report as returned by ``RunMetrics.to_dict``.
+
+        Returns:
+            The id of the new row.
+        """
+        info = run_report.get("info", {})
+        stages = run_report.get("stages", {})
+
+        row = {
+            "started_at": run_report.get("started_at"),
+            "wall_seconds": run_report.get("wall_seconds"),
+            "run_report": json.dumps(run_report, ensure_ascii=False),
+        }
+        for stage_name, column in STAGE_COLUMNS.items():
+            row[column] = stages.get(stage_name, {}).get("wall_seconds")
+        for column in INFO_COLUMNS:
+            value = info.get(column)
+            row[column] = value if not isinstance(value, (list, dict)) else len(value)
+
+        columns = ", ".join(row)
+        placeholders = ", ".join(f":{column}" for column in row)
+        with self._connect() as connection:
+            cursor = connection.execute(
+                f"INSERT INTO runs ({columns}) VALUES ({placeholders})", row
+            )
+            return cursor.lastrowid
+
+    def recent_runs(self, limit: int = 12) -> List[Dict]:
+        """
+        Return the last ``limit`` runs in chronological order.
+
+        Every run gets an extra ``sent_mails`` value, the number of mails
+        sent successfully, taken from the stored run report.
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT * FROM runs ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+
+        runs = []
+        for row in reversed(rows):
+            run = dict(row)
+            stages = json.loads(run["run_report"] or "{}").get("stages", {})
+            run["sent_mails"] = stages.get("send_report_to", {}).get("items")
+            runs.append(run)
+        return runs
+
+
+def _rate(run: Dict, duration_column: str, unit_column: str):
+    """Return seconds per unit or ``None`` if the run has no such work."""
+    duration, units = run.get(duration_column), run.get(unit_column)
+    if not duration or not units:
+        return None
+    return duration / units
+
+
+def find_regressions(
+    runs: List[Dict], window: int = 5, tolerance: float = 0.25, first: int = 0
+) -> List[str]:
+    """
+    Compare every run from position ``first`` on with the median of the
+    ``window`` runs before it.
+
+    A stage counts as regression if its time per page (or per email) is more
+    than ``tolerance`` above that median. Runs without the stage, e.g. a
+    scan cache hit or a run without sending, are skipped.
+
+    Args:
+        runs: Runs in chronological order as returned by ``recent_runs``.
+        window: Number of previous runs forming the baseline.
+        tolerance: Allowed slowdown, 0.25 = 25 %.
+        first: Position of the first run to check; the runs before only
+            serve as baseline.
+
+    Returns:
+        One message per regression.
+    """
+    messages = []
+
+    for position, run in enumerate(runs):
+        if position < first:
+            continue
+
+        for label, duration_column, unit_column in RATES:
+            rate = _rate(run, duration_column, unit_column)
+            if rate is None:
+                continue
+
+            previous = [
+                _rate(earlier, duration_column, unit_column)
+                for earlier in runs[max(0, position - window) : position]
+            ]
+            previous = [value for value in previous if value is not None]
+            if not previous:
+                continue
+
+            baseline = statistics.median(previous)
+            if baseline and rate > baseline * (1 + tolerance):
+                messages.append(
+                    f"⚠️ Lauf {run['id']} ({(run['started_at'] or '')[:16].replace('T', ' ')}): {label} {rate:.3f} "
+                    f"statt {baseline:.3f} (+{(rate / baseline - 1) * 100:.0f} %)"
+                )
+
+    return messages
+
+
+def report_lines(history: RunHistory, limit: int = 12, window: int = 5) -> List[str]:
+    """
+    Build the trend report of the last ``limit`` runs.
+
+    The ``window`` runs before them are loaded as well, so the oldest shown
+    runs are also checked for regressions.
+
+    Returns:
+        The report lines for console output.
+    """
+    loaded_runs = history.recent_runs(limit + window)
+    runs = loaded_runs[-limit:] if limit > 0 else []
+    if not runs:
+        return ["ℹ️ Noch keine Läufe in der Laufhistorie"]
+
+    lines = [
+        f"📈 Laufhistorie: letzte {len(runs)} Läufe ({history.db_path})",
+        "",
+        f"{'Lauf':>5} {'Datum':16} {'Monat':14} {'Seiten':>7} {'Pers.':>6} "
+        f"{'Scan s':>8} {'Schr. s':>8} {'Send. s':>8} {'MB':>7} {'Fehler':>6} {'Worker':>7} Exit",
+    ]
+
+    for run in runs:
+        month = f"{run['month'] or ''} {run['year'] or ''}".strip()
+        failures = (run["contact_failures"] or 0) + (run["send_failures"] or 0)
+        lines.append(
+            f"{run['id']:>5} {(run['started_at'] or '')[:16].replace('T', ' '):16} {month:14} "
+            f"{run['pages'] or 0:>7} {run['persons'] or 0:>6} "
+            f"{run['scan_seconds'] or 0:>8.1f} {run['write_seconds'] or 0:>8.1f} {run['send_seconds'] or 0:>8.1f} "
+            f"{(run['bytes_written'] or 0) / (1024 * 1024):>7.1f} {failures:>6} "
+            f"{run['scan_workers'] or 0:>3}/{run['write_workers'] or 0:<3} "
+            f"{'-' if run['exit_code'] is None else run['exit_code']}"
+        )
+
+    regressions = find_regressions(
+        loaded_runs, window, first=len(loaded_runs) - len(runs)
+    )
+    lines.append("")
+    if regressions:
+        lines += regressions
+    else:
+        lines.append("✅ Keine Verschlechterung gegenüber den vorherigen Läufen")
+
+    return lines
@@ -0,0 +1,186 @@
+"""
+RunMetrics
+----------
+
+Per-stage instrumentation of a run: wall time, call and item counts,
+items per second and, on request, peak Python memory (tracemalloc) of every
+stage. At the end of a run the metrics are written as machine-readable JSON
+run report.
+
+Memory tracing slows down every Python allocation and is therefore off by
+default (``track_memory``). It is only done in the main thread of the main
+process; worker
+processes of the parallel scan and write stages and stages entered from
+other threads (e.g. the scan thread of the pipeline) are not included in the
+tracemalloc peak.
+
+Author: Mu Dell'Oro
+Version: v1.0
+Date: 18.10.2026
+Git: https://github.com/Capicodo/PDF-Splitter.git
+"""
+
+import contextlib
+import datetime
+import json
+import threading
+import time
+import tracemalloc
+from typing import Dict, List
+
+
+class StageMetrics:
+    """
+    Accumulated metrics of one stage.
+
+    Attributes:
+        name: Stage name.
+        wall_seconds: Total wall time spent in the stage.
+        calls: Number of times the stage was entered.
+        items: Number of processed items (pages, files, mails).
+        peak_memory_bytes: Highest tracemalloc peak seen during the stage or
+            ``None`` if memory was not traced.
+    """
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self.wall_seconds: float = 0.0
+        self.calls: int = 0
+        self.items: int = 0
+        self.peak_memory_bytes: int = None
+
+    def to_dict(self) -> Dict:
+        return {
+            "wall_seconds": round(self.wall_seconds, 4),
+            "calls": self.calls,
+            "items": self.items,
+            "items_per_second": (
+                round(self.items / self.wall_seconds, 2) if self.wall_seconds else None
+            ),
+            "peak_memory_bytes": self.peak_memory_bytes,
+        }
+
+
+class RunMetrics:
+    """
+    Collects ``StageMetrics`` for the stages of a run.
+
+    Usage:
+        with metrics.stage("create_report") as stage:
+            ...
+            stage.items += 1
+
+    Attributes:
+        track_memory: Trace Python allocations with tracemalloc; adds
+            overhead to every allocation, meant for diagnosis only.
+        stages: Metrics per stage name, in order of first use.
+        info: Free-form run information added to the report.
+    """
+
+    def __init__(self, track_memory: bool = False):
+        self.track_memory: bool = track_memory
+        self.stages: Dict[str, StageMetrics] = {}
+        self.info: Dict = {}
+        self.started_at: datetime.datetime = None
+        self._start: float = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def _active(self) -> List[str]:
+        """Stack of the stages entered by the current thread."""
+        active = getattr(self._local, "active", None)
+        if active is None:
+            active = self._local.active = []
+        return active
+
+    def _get_stage(self, name: str) -> StageMetrics:
+        with self._lock:
+            stage = self.stages.get(name)
+            if stage is None:
+                stage = self.stages[name] = StageMetrics(name)
+            return stage
+
+    def start(self):
+        """Start the run clock and, if enabled, memory tracing."""
+        self.started_at = datetime.datetime.now()
+        self._start = time.perf_counter()
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """
+        Measure the enclosed block as stage ``name``.
+
+        The memory peak is only measured for outermost stages of the main
+        thread, since resetting the tracemalloc peak inside a nested stage or
+        from another thread would hide the peak of the enclosing one.
+
+        Yields:
+            The ``StageMetrics`` of the stage, e.g. to count items.
+        """
+        stage = self._get_stage(name)
+
+        outermost = not self._active
+        trace = (
+            self.track_memory
+            and outermost
+            and threading.current_thread() is threading.main_thread()
+            and tracemalloc.is_tracing()
+        )
+        if trace:
+            tracemalloc.reset_peak()
+
+        self._active.append(name)
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage.wall_seconds += time.perf_counter() - start
+            stage.calls += 1
+            self._active.pop()
+            if trace:
+                peak = tracemalloc.get_traced_memory()[1]
+                stage.peak_memory_bytes = max(stage.peak_memory_bytes or 0, peak)
+
+    def record(self, name: str, seconds: float, items: int = 0, calls: int = 1):
+        """
+        Add an externally measured stage, e.g. the busy time of a pipeline
+        stage whose work is spread over many overlapping coroutines.
+        """
+        stage = self._get_stage(name)
+        stage.wall_seconds += seconds
+        stage.items += items
+        stage.calls += calls
+
+    def to_dict(self) -> Dict:
+        """Return the run report as dictionary."""
+        return {
+            "started_at": (
+                self.started_at.isoformat(timespec="seconds") if self.started_at else None
+            ),
+            "wall_seconds": (
+                round(time.perf_counter() - self._start, 4) if self._start else None
+            ),
+            "info": self.info,
+            "stages": {name: stage.to_dict() for name, stage in self.stages.items()},
+        }
+
+    def write_report(self, path: str):
+        """Write the run report as JSON to ``path``."""
+        with open(path, "w", encoding="utf-8") as report_file:
+            json.dump(self.to_dict(), report_file, indent=2, ensure_ascii=False)
+
+    def summary_lines(self) -> List[str]:
+        """Return one human-readable line per stage."""
+        lines = []
+        for name, stage in self.stages.items():
+            values = stage.to_dict()
+            line = f"{name:24} {values['wall_seconds']:9.2f} s | {stage.calls:6} Aufrufe | {stage.items:6} Elemente"
+            if values["items_per_second"]:
+                line += f" | {values['items_per_second']:9.1f} /s"
+            if stage.peak_memory_bytes is not None:
+                line += f" | Peak {stage.peak_memory_bytes / (1024 * 1024):.1f} MB"
+            lines.append(line)
+        return lines
@@ -0,0 +1,171 @@
+"""
+ScanCache
+---------
+
+On-disk cache for the page scan results (page -> name, PLI ID) of a raw
+monthly report. Entries are keyed by a hash of the PDF content and the regex
+patterns used for scanning, so a rerun with the same PDF (e.g. after fixing
+the contact CSV) skips the text extraction. The cache folder is bounded in
+size; the least recently used entries are evicted first.
+
+Author: Mu Dell'Oro
+Version: v1.0
+Date: 18.10.2026
+Git: https://github.com/Capicodo/PDF-Splitter.git
+"""
+
+import hashlib
+import json
+import os
+from typing import Iterable, List, Optional, Tuple
+
+# Bump when the format of the cached scan results changes
+CACHE_FORMAT_VERSION = 1
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(file_path: str) -> str:
+    """
+    Compute the SHA-256 hex digest of a file's content.
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        The hex digest as string.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_cache_key(file_hash: str, patterns: Iterable[str]) -> str:
+    """
+    Combine the PDF hash and the scan patterns into a cache key.
+
+    Args:
+        file_hash: Hash of the raw report as returned by ``hash_file``.
+        patterns: Regular expressions used to read the page headers.
+
+    Returns:
+        The cache key as hex string.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"v{CACHE_FORMAT_VERSION}\n{file_hash}\n".encode("utf-8"))
+    for pattern in patterns:
+        digest.update(f"{pattern}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _entry_path(cache_folder_path: str, key: str) -> str:
+    return os.path.join(cache_folder_path, f"{key}.json")
+
+
+def load_scan(
+    cache_folder_path: str, key: str
+) -> Optional[List[Tuple[int, str, Optional[int]]]]:
+    """
+    Load cached scan results.
+
+    A hit refreshes the modification time of the entry so it is evicted last.
+
+    Args:
+        cache_folder_path: Folder containing the cache entries.
+        key: Cache key from ``build_cache_key``.
+
+    Returns:
+        The list of ``(page_index, name, pli_id)`` tuples or ``None`` if no
+        valid entry exists.
+    """
+    entry_path = _entry_path(cache_folder_path, key)
+    try:
+        with open(entry_path, encoding="utf-8") as entry_file:
+            entry = json.load(entry_file)
+        page_infos = [
+            (page_index, name, pli_id)
+            for page_index, name, pli_id in entry["page_infos"]
+        ]
+        os.utime(entry_path)
+        return page_infos
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def store_scan(
+    cache_folder_path: str,
+    key: str,
+    page_infos: List[Tuple[int, str, Optional[int]]],
+    source_path: str,
+    max_bytes: int,
+):
+    """
+    Store scan results and evict old entries beyond ``max_bytes``.
+
+    The entry is written to a temporary file first and then renamed, so an
+    interrupted run never leaves a half-written entry behind.
+
+    Args:
+        cache_folder_path: Folder containing the cache entries.
+        key: Cache key from ``build_cache_key``.
+        page_infos: List of ``(page_index, name, pli_id)`` tuples.
+        source_path: Path of the raw report, stored for information only.
+        max_bytes: Maximum total size of the cache folder.
+    """
+    os.makedirs(cache_folder_path, exist_ok=True)
+
+    entry_path = _entry_path(cache_folder_path, key)
+    temp_path = entry_path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as entry_file:
+        json.dump(
+            {
+                "version": CACHE_FORMAT_VERSION,
+                "source": source_path,
+                "page_infos": page_infos,
+            },
+            entry_file,
+            ensure_ascii=False,
+        )
+    os.replace(temp_path, entry_path)
+
+    evict(cache_folder_path, max_bytes, keep=entry_path)
+
+
+def evict(cache_folder_path: str, max_bytes: int, keep: str = None) -> int:
+    """
+    Delete the least recently used entries until the folder fits ``max_bytes``.
+
+    Args:
+        cache_folder_path: Folder containing the cache entries.
+        max_bytes: Maximum total size of all entries.
+        keep: Optional entry path that must not be deleted.
+
+    Returns:
+        The number of deleted entries.
+    """
+    entries = []
+    for file_name in os.listdir(cache_folder_path):
+        if not file_name.endswith(".json"):
+            continue
+        path = os.path.join(cache_folder_path, file_name)
+        stat = os.stat(path)
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total_bytes = sum(size for _, size, _ in entries)
+    deleted = 0
+
+    for _, size, path in sorted(entries):
+        if total_bytes <= max_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+            total_bytes -= size
+            deleted += 1
+        except OSError:
+            pass
+
+    return deleted
@@ -0,0 +1,52 @@
+"""
+Segment
+-------
+
+Lightweight record describing the contiguous page range of a single person
+inside the raw monthly report, as produced by the planning phase.
+
+Author: Mu Dell'Oro
+Version: v1.0
+Date: 18.10.2026
+Git: https://github.com/Capicodo/PDF-Splitter.git
+"""
+
+from typing import Optional
+
+from ContactData import ContactData
+
+
+class Segment:
+    """
+    Page range of one person in the raw report.
+
+    Attributes:
+        start_page_index: First page of the person (0-based, inclusive).
+        end_page_index: Last page of the person (0-based, inclusive).
+        name: Person name read from the "Name:" field.
+        pli_id: Piluweri ID read from the "Dienstplan:" field or ``None``.
+        contact_data: Resolved ``ContactData`` or ``None`` if the lookup was
+            skipped or failed.
+    """
+
+    __slots__ = (
+        "start_page_index",
+        "end_page_index",
+        "name",
+        "pli_id",
+        "contact_data",
+    )
+
+    def __init__(
+        self,
+        start_page_index: int,
+        end_page_index: int,
+        name: str,
+        pli_id: Optional[int],
+        contact_data: Optional[ContactData] = None,
+    ):
+        self.start_page_index: int = start_page_index
+        self.end_page_index: int = end_page_index
+        self.name: str = name
+        self.pli_id: Optional[int] = pli_id
+        self.contact_data: Optional[ContactData] = contact_data
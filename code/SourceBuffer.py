@@ -0,0 +1,196 @@
+"""
+SourceBuffer
+------------
+
+Shares the raw report between the worker processes of the parallel scan and
+write stages. The PDF is read from disk once into a shared memory block;
+workers attach to the block by name and open it with
+``fitz.open(stream=...)`` instead of reading the file again. This matters on
+network shares, where every open of the file path transfers it again.
+
+PyMuPDF only accepts ``bytes`` as stream (``bytearray`` and ``BytesIO`` are
+copied into ``bytes`` as well), so every process that opens the block holds a
+private copy of the PDF in memory for as long as the document is open. The
+saving is the disk or network read, not memory; ``copied_bytes`` reports the
+price.
+
+A source is passed to workers as a picklable *source descriptor*: either a
+plain file path or the ``(name, size)`` of the shared memory block. Workers
+open both kinds with ``open_source``.
+
+Author: Mu Dell'Oro
+Version: v1.0
+Date: 18.10.2026
+Git: https://github.com/Capicodo/PDF-Splitter.git
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import time
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Dict, Tuple, Union
+
+if TYPE_CHECKING:
+    import fitz  # PyMuPDF, imported where it is used to keep the start fast
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+# File path or (shared memory name, size)
+SourceDescriptor = Union[str, Tuple[str, int]]
+
+# Blocks attached by this worker process by name, kept alive as long as their
+# documents (see ``release_source``)
+_attached_blocks: Dict[str, shared_memory.SharedMemory] = {}
+
+
+class SharedSource:
+    """
+    The raw report read once into a shared memory block.
+
+    Its SHA-256 hash is computed while reading, so the file does not have to
+    be read again for the scan cache or the output manifest.
+
+    Attributes:
+        file_path: Path of the raw report.
+        size: File size in bytes.
+        sha256: Hex digest of the file content.
+        read_seconds: Time spent reading the file into the block.
+        worker_opens: Number of worker processes that opened the block
+            instead of the file path, counted by the caller.
+        local_opens: Number of documents opened from the block in the
+            creating process.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path: str = file_path
+        self.size: int = os.path.getsize(file_path)
+        self.worker_opens: int = 0
+        self.local_opens: int = 0
+
+        # A block of size 0 is not allowed, the PDF parser reports the error
+        self._block = shared_memory.SharedMemory(create=True, size=max(1, self.size))
+
+        start = time.perf_counter()
+        digest = hashlib.sha256()
+        try:
+            with open(file_path, "rb") as source_file:
+                offset = 0
+                for chunk in iter(lambda: source_file.read(READ_CHUNK_SIZE), b""):
+                    self._block.buf[offset : offset + len(chunk)] = chunk
+                    digest.update(chunk)
+                    offset += len(chunk)
+        except Exception:
+            self.close()
+            raise
+        self.sha256: str = digest.hexdigest()
+        self.read_seconds: float = time.perf_counter() - start
+
+    @property
+    def descriptor(self) -> Tuple[str, int]:
+        """Source descriptor of the block for ``open_source``."""
+        return self._block.name, self.size
+
+    def open(self) -> fitz.Document:
+        """Open the block as ``fitz.Document`` in the creating process."""
+        self.local_opens += 1
+        return _open_buffer(self._block.buf[: self.size])
+
+    @property
+    def saved_read_bytes(self) -> int:
+        """
+        Disk reads saved compared with opening the file path in every worker.
+
+        Counts the whole file per worker, i.e. an upper bound: MuPDF may only
+        read the parts of the file it needs.
+        """
+        return self.worker_opens * self.size
+
+    @property
+    def copied_bytes(self) -> int:
+        """
+        Memory taken by the private copies of the PDF that PyMuPDF needs to
+        open the block, summed over all processes.
+        """
+        return (self.worker_opens + self.local_opens) * self.size
+
+    def close(self):
+        """
+        Release the block. Documents opened from it in this process must be
+        closed first.
+        """
+        if self._block is None:
+            return
+        try:
+            self._block.close()
+        except BufferError:
+            pass  # still referenced by an open document, released at exit
+        self._block.unlink()
+        self._block = None
+
+
+def _attach_block(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing block without taking over its lifetime."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 attaching registers the block with the resource
+        # tracker, which would unlink it when this worker exits
+        block = shared_memory.SharedMemory(name=name)
+        if sys.platform != "win32":
+            from multiprocessing import resource_tracker
+
+            resource_tracker.unregister(block._name, "shared_memory")
+        return block
+
+
+def _open_buffer(buffer: memoryview) -> fitz.Document:
+    """
+    Open a PDF from shared memory. PyMuPDF has no zero-copy stream input, so
+    the content is copied into a private ``bytes`` object (no disk read).
+    """
+    import fitz  # PyMuPDF
+
+    return fitz.open(stream=bytes(buffer), filetype="pdf")
+
+
+def open_source(source: SourceDescriptor) -> fitz.Document:
+    """
+    Open the raw report from a source descriptor.
+
+    Args:
+        source: A file path or the descriptor of a ``SharedSource``.
+
+    Returns:
+        The opened ``fitz.Document``.
+    """
+    if isinstance(source, str):
+        import fitz  # PyMuPDF
+
+        return fitz.open(source)
+
+    name, size = source
+    block = _attached_blocks.get(name)
+    if block is None:
+        block = _attached_blocks[name] = _attach_block(name)
+
+    return _open_buffer(block.buf[:size])
+
+
+def release_source(source: SourceDescriptor):
+    """
+    Detach this worker from a shared memory source once its documents are
+    closed, e.g. when a shared pool moves on to the next raw report.
+    """
+    if isinstance(source, str):
+        return
+
+    block = _attached_blocks.pop(source[0], None)
+    if block is None:
+        return
+    try:
+        block.close()
+    except BufferError:
+        pass  # still referenced by a document, released at exit